@@ -0,0 +1,258 @@
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import contextlib
+import tracemalloc
+# Sem a mensagem de boas-vindas do pygame no stdout (com --json a saída deve ser só o JSON)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import numpy as np
+from src.game.headless import load_game, reset_world, messages_to_stderr
+
+def no_setup():
+    pass
+
+class Benchmark:
+    """
+    Microbenchmark de uma única função
+    :param name: Nome do benchmark
+    :param func: Função medida (sem argumentos)
+    :param setup: Função chamada antes de cada repetição, fora da medição
+    :param number: Chamadas por repetição
+    """
+    def __init__(self, name, func, setup=no_setup, number=100):
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.number = number
+
+def measure(benchmark, repeat=7, warmup=1):
+    """
+    Mede o tempo por chamada e as alocações de uma chamada.
+    As alocações vêm do tracemalloc (memória do Python e do NumPy); pixels de superfícies
+    alocados pelo SDL não aparecem nelas.
+    :param benchmark: Benchmark a medir
+    :param repeat: Repetições medidas (cada uma com benchmark.number chamadas)
+    :param warmup: Repetições descartadas antes da medição (caches, primeira conversão etc.)
+    :return: Dicionário com tempos por chamada (µs), ops/s e bytes alocados por chamada
+    """
+    func = benchmark.func
+    number = benchmark.number
+    for _ in range(warmup):
+        benchmark.setup()
+        for _ in range(number):
+            func()
+
+    per_call = []
+    for _ in range(repeat):
+        benchmark.setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        per_call.append((time.perf_counter() - start) / number)
+    per_call.sort()
+    median = per_call[len(per_call) // 2]
+
+    # Alocações medidas à parte: o tracemalloc deixa as chamadas bem mais lentas
+    benchmark.setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'number': number,
+        'repeat': repeat,
+        'best_us': per_call[0] * 1e6,
+        'median_us': median * 1e6,
+        'ops_per_s': 1 / median if median > 0 else 0.0,
+        'alloc_peak_bytes': peak - before,
+        'alloc_retained_bytes': current - before
+    }
+
+def particle_benchmarks(game, counts=(100, 1000, 10000)):
+    """
+    EffectManager.update e draw com o pool cheio em cada tamanho. As partículas usam as
+    cores dos presets do jogo (para o cache de sprites se comportar como no jogo) e tempo
+    de vida 10: o pool é recriado a cada repetição, antes de elas morrerem.
+    """
+    from src.utils.effects import EffectManager
+    colors = np.array(sorted({preset.color for preset in game.effect_manager.presets.values()}), dtype=np.uint8)
+    screen = game.screen
+    width, height = screen.get_size()
+    benchmarks = []
+    for count in counts:
+        manager = EffectManager(max_particles=count, presets=game.effect_manager.presets)
+
+        def populate(manager=manager, count=count):
+            rng = np.random.default_rng(0)
+            pool = manager.particles
+            pool.rng = rng
+            pool.clear()
+            pool.emit(rng.uniform(0, width, count), rng.uniform(0, height, count),
+                      rng.uniform(-2, 2, count), rng.uniform(-2, 2, count),
+                      colors[rng.integers(0, len(colors), count)], 255,
+                      rng.uniform(2, 4, count), 10)
+
+        benchmarks.append(Benchmark(f"EffectManager.update[{count}]", manager.update, populate, number=5))
+        benchmarks.append(Benchmark(f"EffectManager.draw[{count}]",
+                                    lambda manager=manager: manager.draw(screen, screen.get_rect()),
+                                    populate, number=5))
+    return benchmarks
+
+def sprite_benchmarks(game):
+    from src.sprites.sprite_config import PLAYER_SPRITE
+    from src.sprites.sprite_manager import SpriteSheet, enemy_animation_bank
+    from src.sprites.atlas import TextureAtlas
+
+    # Sprite sheet sintético com as dimensões do jogador (o arquivo real pode não existir)
+    dimensions = PLAYER_SPRITE["dimensions"]
+    frame_width = int(dimensions["width"] * dimensions["scale"])
+    frame_height = int(dimensions["height"] * dimensions["scale"])
+    running = PLAYER_SPRITE["animations"]["running"]
+    rows = max(config["row"] for config in PLAYER_SPRITE["animations"].values()) + 1
+    columns = max(config["frames"] for config in PLAYER_SPRITE["animations"].values())
+    sheet = SpriteSheet.from_surface(pygame.Surface((columns * frame_width, rows * frame_height),
+                                                    pygame.SRCALPHA).convert_alpha())
+
+    def get_frames():
+        return sheet.get_animation_frames(running["row"], running["frames"], frame_width, frame_height)
+
+    def get_frames_cold():
+        # Sem a memorização do get_image (primeiro carregamento)
+        sheet.images.clear()
+        return sheet.get_animation_frames(running["row"], running["frames"], frame_width, frame_height)
+
+    enemy = game.Enemy(0, game.HEIGHT, game.player, game.platforms)
+    enemy.kill()
+
+    def load_enemy_animations_bank_miss():
+        # Banco vazio: o conjunto volta a ser montado a partir dos frames já no atlas
+        enemy_animation_bank.clear()
+        enemy.load_animations()
+
+    enemy_sheets = [key for key in game.asset_manager.entries if key.startswith("enemy/")]
+
+    def load_enemy_animations_cold():
+        # Primeiro carregamento: sem o banco, sem os frames no atlas e sem os sprite sheets
+        # convertidos (relidos do cache de assets). O atlas do jogo é trocado por um vazio
+        # só durante a chamada, e o banco volta ao conjunto do atlas do jogo no fim
+        sets = dict(enemy_animation_bank.sets)
+        atlas = game.sprite_atlas
+        for key in enemy_sheets:
+            game.asset_manager.surfaces.pop(key, None)
+        enemy_animation_bank.clear()
+        game.sprite_atlas = TextureAtlas()
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                enemy.load_animations()
+        finally:
+            game.sprite_atlas = atlas
+            enemy_animation_bank.sets = sets
+
+    return [
+        Benchmark("SpriteSheet.get_animation_frames", get_frames, number=1000),
+        Benchmark("SpriteSheet.get_animation_frames[cold]", get_frames_cold, number=200),
+        Benchmark("Enemy.load_animations", enemy.load_animations, number=1000),
+        Benchmark("Enemy.load_animations[bank-miss]", load_enemy_animations_bank_miss, number=50),
+        Benchmark("Enemy.load_animations[cold]", load_enemy_animations_cold, number=5)
+    ]
+
+def player_benchmarks(game):
+    player = game.player
+    screen = game.screen
+
+    def running_state():
+        player.state = "running"
+        player.facing_right = True
+
+    def shield_state():
+        player.magic_shield_active = True
+        player.magic_shield_wave = 0
+
+    def draw_shield():
+        # Avançar a ondulação como em update, para passar por todos os frames do cache
+        player.magic_shield_wave += player.magic_shield_wave_speed
+        player.draw(screen, (0, 0))
+
+    return [
+        Benchmark("Player.update_animation", player.update_animation, running_state, number=1000),
+        Benchmark("Player.draw[shield]", draw_shield, shield_state, number=500)
+    ]
+
+def menu_benchmarks(game):
+    from src.menus.menu import Button
+    screen = game.screen
+    menu = game.main_menu
+    button = Button(310, 300, 180, 35, "Iniciar Jogo")
+    hovered = Button(310, 300, 180, 35, "Iniciar Jogo")
+    hovered.is_hovered = True
+    hovered.current_color = hovered.hover_color
+
+    def menu_state():
+        # Depois do fade de entrada (estado em que o menu fica a maior parte do tempo)
+        menu.fade_alpha = 0
+
+    return [
+        Benchmark("Button.draw", lambda: button.draw(screen), number=500),
+        Benchmark("Button.draw[hover]", lambda: hovered.draw(screen), number=500),
+        Benchmark("Menu.draw", lambda: menu.draw(screen), menu_state, number=100)
+    ]
+
+def all_benchmarks(game):
+    return (particle_benchmarks(game) + sprite_benchmarks(game) +
+            player_benchmarks(game) + menu_benchmarks(game))
+
+def run_all(pattern=None, repeat=7, warmup=1):
+    """
+    :param pattern: Rodar só os benchmarks cujo nome contém este texto
+    :return: Dicionário {nome: resultado de measure()}
+    """
+    game = load_game()
+    reset_world(game)
+    results = {}
+    for benchmark in all_benchmarks(game):
+        if pattern and pattern not in benchmark.name:
+            continue
+        results[benchmark.name] = measure(benchmark, repeat, warmup)
+    # Os benchmarks do jogador mexem no estado dele
+    reset_world(game)
+    return results
+
+def print_results(results):
+    print(f"{'benchmark':40s} {'mediana µs':>12s} {'ops/s':>12s} {'pico B':>10s} {'retido B':>10s}")
+    for name, result in results.items():
+        print(f"{name:40s} {result['median_us']:12.2f} {result['ops_per_s']:12.0f} "
+              f"{result['alloc_peak_bytes']:10d} {result['alloc_retained_bytes']:10d}")
+
+def main(argv=None):
+    # Microbenchmarks das funções mais chamadas por frame (python -m benchmarks.micro)
+    parser = argparse.ArgumentParser(description="Microbenchmarks das funções críticas do jogo")
+    parser.add_argument("-k", "--filter", help="Rodar só os benchmarks cujo nome contém este texto")
+    parser.add_argument("--repeat", type=int, default=7, help="Repetições medidas por benchmark")
+    parser.add_argument("--warmup", type=int, default=1, help="Repetições de aquecimento descartadas")
+    parser.add_argument("--json", action="store_true", help="Imprimir o resultado em JSON")
+    parser.add_argument("--output", help="Gravar o resultado em JSON neste arquivo")
+    args = parser.parse_args(argv)
+
+    # Com --json o stdout recebe só o JSON; mensagens do carregamento vão para o stderr
+    with messages_to_stderr(args.json):
+        results = run_all(args.filter, max(1, args.repeat), max(0, args.warmup))
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_results(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,272 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+# Sem a mensagem de boas-vindas do pygame no stdout (com --json a saída deve ser só o JSON)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+from src.game.headless import HeldKeys, load_game, reset_world, messages_to_stderr
+
+def no_keys(step):
+    return ()
+
+def no_setup(game):
+    pass
+
+def no_step(game, step):
+    pass
+
+class Scenario:
+    """
+    Cenário de benchmark com entrada sintética: a cada frame a simulação avança um passo
+    fixo e o jogo é desenhado na tela (sem apresentá-la)
+    :param name: Nome do cenário
+    :param frames: Frames medidos
+    :param keys: Função (passo) que devolve as teclas pressionadas no passo
+    :param setup: Função (jogo) que prepara o mundo antes do cenário
+    :param before_step: Função (jogo, passo) executada antes de cada passo, medida como update
+    :param menu: Medir o menu principal em vez do jogo
+    """
+    def __init__(self, name, frames=600, keys=no_keys, setup=no_setup, before_step=no_step, menu=False):
+        self.name = name
+        self.frames = frames
+        self.keys = keys
+        self.setup = setup
+        self.before_step = before_step
+        self.menu = menu
+
+def run_across_sections(step):
+    # Ida e volta pelas três seções (10 px por passo: uma travessia a cada 240 passos), pulando de vez em quando
+    direction = pygame.K_RIGHT if (step // 240) % 2 == 0 else pygame.K_LEFT
+    return (direction, pygame.K_SPACE) if step % 60 < 5 else (direction,)
+
+def spam_magic(game, step):
+    # Uma magia por passo, ignorando o cooldown e o custo de mana
+    game.player.cast_magic(game.enemies)
+
+def activate_shield(step):
+    # O escudo mágico dura 600 passos depois de ativado
+    return (pygame.K_v,) if step == 0 else ()
+
+def spawn_enemies(count):
+    """
+    :param count: Número de inimigos, espalhados pelas três seções
+    :return: Função de preparação do cenário
+    """
+    def setup(game):
+        for enemy in game.enemies:
+            enemy.kill()
+        spacing = (game.SECTION_WIDTH - 400) / max(count - 1, 1)
+        for i in range(count):
+            enemy = game.Enemy(200 + i * spacing, game.HEIGHT - 100, game.player, game.platforms)
+            game.enemies.add(enemy)
+            game.all_sprites.add(enemy)
+    return setup
+
+SCENARIOS = [
+    Scenario("idle"),
+    Scenario("run", frames=960, keys=run_across_sections),
+    Scenario("magic_spam", before_step=spam_magic),
+    Scenario("shield", keys=activate_shield),
+    Scenario("enemies_3", setup=spawn_enemies(3)),
+    Scenario("enemies_30", setup=spawn_enemies(30)),
+    Scenario("enemies_300", setup=spawn_enemies(300)),
+    Scenario("menu_idle", menu=True)
+]
+
+def percentile(values, p):
+    """
+    Percentil com interpolação linear entre os dois valores vizinhos
+    :param values: Amostras
+    :param p: Percentil (0 a 100)
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = (len(ordered) - 1) * p / 100
+    lower = int(index)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (index - lower)
+
+def summarize(times):
+    return {
+        'mean': sum(times) / len(times) if times else 0.0,
+        'p50': percentile(times, 50),
+        'p95': percentile(times, 95),
+        'p99': percentile(times, 99),
+        'max': max(times, default=0.0)
+    }
+
+def run_scenario(game, scenario, frames=None, warmup=60, seed=0):
+    """
+    Roda um cenário a partir do mundo no estado inicial.
+    O jogador fica invulnerável (a morte reiniciaria o mundo no meio da medição) e o
+    orçamento de partículas não recebe o tempo real dos frames, para a carga ser a mesma
+    em qualquer máquina.
+    :param game: Módulo do jogo devolvido por load_game()
+    :param scenario: Cenário a rodar
+    :param frames: Frames medidos (padrão: os do cenário)
+    :param warmup: Frames parados antes do roteiro, fora das estatísticas
+    :param seed: Semente da aleatoriedade
+    :return: Dicionário com tempos por frame (ms), update e desenho separados, e picos
+    """
+    frames = frames or scenario.frames
+    reset_world(game, seed)
+    scenario.setup(game)
+    keys = HeldKeys()
+    timestep = game.timestep
+    player = game.player
+
+    frame_times = []
+    update_times = []
+    draw_times = []
+    peak_particles = 0
+    peak_enemies = 0
+    for frame in range(warmup + frames):
+        step = frame - warmup
+        if step >= 0:
+            keys.hold(*scenario.keys(step))
+        t0 = time.perf_counter()
+        if scenario.menu:
+            game.main_menu.update()
+        else:
+            player.health = player.max_health
+            if step >= 0:
+                scenario.before_step(game, step)
+            for _ in range(timestep.advance(timestep.step_ms)):
+                game.simulation_step(keys)
+        t1 = time.perf_counter()
+        if scenario.menu:
+            game.main_menu.draw(game.screen)
+        else:
+            game.camera.interpolate(1.0)
+            game.draw_world(game.screen)
+        t2 = time.perf_counter()
+
+        if step < 0:
+            continue
+        update_times.append((t1 - t0) * 1000)
+        draw_times.append((t2 - t1) * 1000)
+        frame_times.append((t2 - t0) * 1000)
+        peak_particles = max(peak_particles, len(game.effect_manager.particles))
+        peak_enemies = max(peak_enemies, len(game.enemies))
+
+    return {
+        'frames': frames,
+        'frame_ms': summarize(frame_times),
+        'update_ms': summarize(update_times),
+        'draw_ms': summarize(draw_times),
+        'peak_particles': peak_particles,
+        'peak_enemies': peak_enemies
+    }
+
+def run_all(names=None, frames=None, warmup=60, seed=0):
+    """
+    :param names: Nomes dos cenários (padrão: todos)
+    :return: Resultado com metadados da máquina e um dicionário por cenário
+    """
+    game = load_game()
+    scenarios = [scenario for scenario in SCENARIOS if not names or scenario.name in names]
+    results = {}
+    for scenario in scenarios:
+        results[scenario.name] = run_scenario(game, scenario, frames, warmup, seed)
+    # Não deixar o estado do último cenário para quem importou o jogo
+    reset_world(game, seed)
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'pygame': pygame.version.ver,
+            'platform': platform.platform(),
+            'processor': platform.processor(),
+            'seed': seed,
+            'warmup': warmup,
+            'date': time.strftime("%Y-%m-%dT%H:%M:%S")
+        },
+        'scenarios': results
+    }
+
+# Métricas de tempo de frame comparadas com o baseline
+COMPARED_METRICS = ('p50', 'p95', 'p99')
+
+def compare(results, baseline, threshold=0.10, min_delta_ms=0.05):
+    """
+    Compara os tempos de frame com um resultado anterior
+    :param results: Resultado de run_all()
+    :param baseline: Resultado gravado anteriormente (mesmo formato)
+    :param threshold: Aumento relativo que conta como regressão (0.10 = 10%)
+    :param min_delta_ms: Aumento absoluto mínimo, para ruído em tempos muito curtos não contar
+    :return: Lista de (cenário, métrica, baseline, atual, variação relativa, regressão)
+    """
+    rows = []
+    for name, current in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old = previous['frame_ms'][metric]
+            new = current['frame_ms'][metric]
+            change = (new - old) / old if old > 0 else 0.0
+            regression = change > threshold and new - old > min_delta_ms
+            rows.append((name, metric, old, new, change, regression))
+    return rows
+
+def print_results(results):
+    print(f"{'cenário':14s} {'p50':>8s} {'p95':>8s} {'p99':>8s} {'update':>8s} {'desenho':>8s} {'partíc.':>8s}")
+    for name, result in results['scenarios'].items():
+        frame = result['frame_ms']
+        print(f"{name:14s} {frame['p50']:8.3f} {frame['p95']:8.3f} {frame['p99']:8.3f} "
+              f"{result['update_ms']['p50']:8.3f} {result['draw_ms']['p50']:8.3f} {result['peak_particles']:8d}")
+
+def print_comparison(rows, results, baseline):
+    for name, metric, old, new, change, regression in rows:
+        flag = "REGRESSÃO" if regression else ""
+        print(f"{name:14s} {metric:4s} {old:8.3f} -> {new:8.3f} ms ({change:+7.1%}) {flag}")
+    # Com a mesma semente as partículas são determinísticas: diferença indica mudança de comportamento
+    for name, result in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if previous is not None and previous['peak_particles'] != result['peak_particles']:
+            print(f"{name:14s} pico de partículas {previous['peak_particles']} -> {result['peak_particles']}")
+
+def main(argv=None):
+    # Benchmark de cenários sem janela (python -m benchmarks.scenarios --output baseline.json)
+    parser = argparse.ArgumentParser(description="Tempos de frame do jogo em cenários roteirizados")
+    parser.add_argument("--scenario", action="append", choices=[scenario.name for scenario in SCENARIOS],
+                        help="Rodar só este cenário (pode repetir)")
+    parser.add_argument("--frames", type=int, help="Frames medidos por cenário (padrão: os de cada cenário)")
+    parser.add_argument("--warmup", type=int, default=60, help="Frames de aquecimento fora das estatísticas")
+    parser.add_argument("--seed", type=int, default=0, help="Semente da aleatoriedade")
+    parser.add_argument("--json", action="store_true", help="Imprimir o resultado em JSON")
+    parser.add_argument("--output", help="Gravar o resultado em JSON neste arquivo (ex.: para usar como baseline)")
+    parser.add_argument("--baseline", help="Comparar com um resultado gravado; sai com código 1 se houver regressão")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Aumento relativo que conta como regressão")
+    args = parser.parse_args(argv)
+
+    # Com --json o stdout recebe só o JSON; o resto (carregamento, comparação) vai para o stderr
+    stdout = sys.stdout
+    with messages_to_stderr(args.json):
+        results = run_all(args.scenario, args.frames, args.warmup, args.seed)
+        if args.json:
+            print(json.dumps(results, indent=2), file=stdout)
+        else:
+            print_results(results)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+        if args.baseline:
+            try:
+                with open(args.baseline, encoding="utf-8") as f:
+                    baseline = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Não foi possível ler o baseline {args.baseline}: {e}")
+                return 2
+            rows = compare(results, baseline, args.threshold)
+            print_comparison(rows, results, baseline)
+            if any(row[-1] for row in rows):
+                return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,9 +3,18 @@ from PyInstaller.utils.hooks import collect_data_files
 from PyInstaller.building.api import PYZ, EXE
 from PyInstaller.building.build_main import Analysis
 import os
+import sys
 
 block_cipher = None
 
+# Gerar o pack só com os assets referenciados pelo jogo (GAME_ASSETS), em vez de
+# levar a pasta assets/ inteira (PSDs, PDF e backgrounds não usados)
+sys.path.insert(0, SPECPATH)
+from src.utils.asset_pack import build_pack, PACK_FILE
+from src.utils.assets import GAME_ASSETS
+asset_pack_path = os.path.join('build', 'pack', PACK_FILE)
+build_pack(asset_pack_path, [path for path, _ in GAME_ASSETS.values() if os.path.exists(path)])
+
 # Hook para resolver caminhos
 def get_data_files():
     data_files = []
@@ -29,7 +38,7 @@ a = Analysis(
     pathex=['src', '.'],
     binaries=[],
     datas=[
-        ('assets', 'assets'),
+        (asset_pack_path, '.'),
         ('src/menus', 'src/menus'),
         ('src/sprites', 'src/sprites'),
         ('src/utils', 'src/utils'),
@@ -46,19 +55,6 @@ a = Analysis(
     noarchive=False,
 )
 
-# Adicionar arquivos manualmente se necessário
-a.datas += [
-    ('assets/enemy/Idle.png', 'assets/enemy/Idle.png', 'DATA'),
-    ('assets/enemy/Walk.png', 'assets/enemy/Walk.png', 'DATA'),
-    ('assets/enemy/Run.png', 'assets/enemy/Run.png', 'DATA'),
-    ('assets/enemy/Jump.png', 'assets/enemy/Jump.png', 'DATA'),
-    ('assets/enemy/Attack_1.png', 'assets/enemy/Attack_1.png', 'DATA'),
-    ('assets/enemy/Attack_2.png', 'assets/enemy/Attack_2.png', 'DATA'),
-    ('assets/enemy/Attack_3.png', 'assets/enemy/Attack_3.png', 'DATA'),
-    ('assets/enemy/Hurt.png', 'assets/enemy/Hurt.png', 'DATA'),
-    ('assets/enemy/Dead.png', 'assets/enemy/Dead.png', 'DATA')
-]
-
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
 exe = EXE(
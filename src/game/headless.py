@@ -0,0 +1,199 @@
+import os
+import sys
+import time
+import json
+import random
+import argparse
+import contextlib
+# Sem a mensagem de boas-vindas do pygame no stdout (com --json a saída deve ser só o JSON)
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+
+# Ações da entrada simulada (teclas pressionadas juntas), sorteadas em trechos de alguns passos
+SCRIPTED_ACTIONS = [
+    (),
+    (pygame.K_RIGHT,),
+    (pygame.K_LEFT,),
+    (pygame.K_RIGHT, pygame.K_SPACE),
+    (pygame.K_x,),
+    (pygame.K_RIGHT, pygame.K_x),
+    (pygame.K_c,),
+    (pygame.K_v,),
+    (pygame.K_RIGHT, pygame.K_LSHIFT),
+    (pygame.K_LEFT, pygame.K_LSHIFT)
+]
+
+class HeldKeys:
+    """
+    Entrada sintética no formato de pygame.key.get_pressed(): keys[pygame.K_x] diz se a
+    tecla está pressionada
+    :param pressed: Teclas pressionadas
+    """
+    def __init__(self, pressed=()):
+        self.pressed = frozenset(pressed)
+
+    def hold(self, *pressed):
+        # Trocar as teclas pressionadas (soltando as demais)
+        self.pressed = frozenset(pressed)
+        return self
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class ScriptedKeys(HeldKeys):
+    """
+    Entrada simulada: uma sequência de ações sorteada com semente fixa, para que as
+    execuções sejam reproduzíveis
+    :param seed: Semente do sorteio das ações
+    :param actions: Lista de ações (tuplas de teclas pressionadas)
+    :param min_steps: Duração mínima (em passos) de cada ação
+    :param max_steps: Duração máxima (em passos) de cada ação
+    """
+    def __init__(self, seed=0, actions=SCRIPTED_ACTIONS, min_steps=10, max_steps=90):
+        super().__init__()
+        self.rng = random.Random(seed)
+        self.actions = actions
+        self.min_steps = min_steps
+        self.max_steps = max_steps
+        self.remaining = 0
+
+    def advance(self):
+        # Trocar de ação quando a atual terminar
+        if self.remaining <= 0:
+            self.pressed = frozenset(self.rng.choice(self.actions))
+            self.remaining = self.rng.randint(self.min_steps, self.max_steps)
+        self.remaining -= 1
+        return self
+
+def load_game():
+    """
+    Importa o jogo com o driver de vídeo dummy do SDL (sem janela) e monta o mundo
+    :return: Módulo src.game.main pronto para simular
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from src.game import main as game
+    if not game.world_built:
+        game.asset_manager.wait()
+        game.build_world()
+    return game
+
+def messages_to_stderr(enabled=True):
+    """
+    Desvia para o stderr as mensagens que o jogo imprime (carregamento de assets, atlas etc.),
+    para que o stdout de uma execução com --json contenha só o JSON
+    :param enabled: Sem desvio quando False
+    :return: Gerenciador de contexto
+    """
+    return contextlib.redirect_stdout(sys.stderr) if enabled else contextlib.nullcontext()
+
+def reset_world(game, seed=0):
+    """
+    Volta o mundo ao estado inicial e fixa as sementes (IA dos inimigos e partículas)
+    :param game: Módulo do jogo devolvido por load_game()
+    :param seed: Semente da aleatoriedade
+    """
+    import numpy as np
+    random.seed(seed)
+    game.effect_manager.particles.rng = np.random.default_rng(seed)
+    game.effect_manager.particles.clear()
+    for power_up in game.power_ups:
+        power_up.kill()
+    game.reset_game()
+    # reset_game() só cuida de vida, mana e posição: zerar também ações e escudo em andamento
+    player = game.player
+    player.score = 0
+    player.vel_y = 0
+    player.attacking = player.casting = player.dashing = False
+    player.attack_cooldown = player.cast_cooldown = player.dash_cooldown = 0
+    player.magic_shield_active = False
+    player.magic_shield_cooldown = 0
+    player.facing_right = True
+    # Recomeçar o tempo simulado junto com os timers de respawn que dependem dele
+    game.timestep.time_ms = 0.0
+    for key in game.enemy_spawner.spawn_timer:
+        game.enemy_spawner.spawn_timer[key] = 0
+
+def run(steps=3600, draw=True, seed=0, on_step=None):
+    """
+    Roda a simulação sem janela, o mais rápido que a CPU permitir (sem limite de FPS).
+    Cada iteração é um passo fixo da simulação; o desenho, quando ativo, é feito na
+    superfície da tela mas nunca apresentado. O orçamento de partículas não recebe o
+    tempo real dos frames, para o resultado não depender da máquina.
+    :param steps: Número de passos (60 por segundo de jogo)
+    :param draw: Executar também as chamadas de desenho
+    :param seed: Semente da entrada simulada, da IA dos inimigos e das partículas
+    :param on_step: Função opcional chamada a cada passo com (passo, ms de update, ms de desenho)
+    :return: Dicionário com as estatísticas da execução
+    """
+    game = load_game()
+    reset_world(game, seed)
+    keys = ScriptedKeys(seed)
+    timestep = game.timestep
+
+    deaths = 0
+    peak_particles = 0
+    peak_enemies = 0
+    update_total = draw_total = 0.0
+    start = time.perf_counter()
+    for step in range(steps):
+        keys.advance()
+        t0 = time.perf_counter()
+        for _ in range(timestep.advance(timestep.step_ms)):
+            game.simulation_step(keys)
+        if game.player.health <= 0:
+            # Sem tela de game over: recomeçar e seguir simulando
+            deaths += 1
+            game.reset_game()
+        t1 = time.perf_counter()
+        if draw:
+            game.camera.interpolate(1.0)
+            game.draw_world(game.screen)
+        t2 = time.perf_counter()
+
+        update_ms = (t1 - t0) * 1000
+        draw_ms = (t2 - t1) * 1000
+        update_total += update_ms
+        draw_total += draw_ms
+        peak_particles = max(peak_particles, len(game.effect_manager.particles))
+        peak_enemies = max(peak_enemies, len(game.enemies))
+        if on_step is not None:
+            on_step(step, update_ms, draw_ms)
+    elapsed = time.perf_counter() - start
+
+    return {
+        'steps': steps,
+        'draw': draw,
+        'seed': seed,
+        'elapsed_s': elapsed,
+        'steps_per_s': steps / elapsed if elapsed > 0 else 0.0,
+        'simulated_s': steps * timestep.step_ms / 1000,
+        'update_ms': update_total,
+        'draw_ms': draw_total,
+        'deaths': deaths,
+        'score': game.player.score,
+        'peak_particles': peak_particles,
+        'peak_enemies': peak_enemies,
+        'particles_dropped': game.effect_manager.particles.dropped
+    }
+
+def main(argv=None):
+    # Simulação sem janela para soak tests e benchmarks (python -m src.game.headless)
+    parser = argparse.ArgumentParser(description="Roda o jogo sem janela (driver de vídeo dummy do SDL)")
+    parser.add_argument("--steps", type=int, default=3600, help="Passos da simulação (60 por segundo de jogo)")
+    parser.add_argument("--seed", type=int, default=0, help="Semente da entrada simulada e da aleatoriedade")
+    parser.add_argument("--no-draw", action="store_true", help="Pular todas as chamadas de desenho")
+    parser.add_argument("--json", action="store_true", help="Imprimir as estatísticas em JSON")
+    args = parser.parse_args(argv)
+
+    with messages_to_stderr(args.json):
+        stats = run(args.steps, draw=not args.no_draw, seed=args.seed)
+    if args.json:
+        print(json.dumps(stats, indent=2))
+    else:
+        for key, value in stats.items():
+            print(f"{key:20s} {value:.3f}" if isinstance(value, float) else f"{key:20s} {value}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,19 +3,19 @@ import sys
 import random
 import math
 import os
-from src.menus.menu import Menu, OptionsMenu, CreditsMenu
+from src.menus.menu import Menu, OptionsMenu, CreditsMenu, LoadingScreen
 from src.sprites.sprite_config import PLAYER_SPRITE, ENEMY_SPRITE
-from src.sprites.sprite_manager import SpriteSheet
-from src.utils.effects import EffectManager
-
-# Função para resolver caminhos de recursos
-def get_resource_path(relative_path):
-    try:
-        # PyInstaller cria um temp folder e armazena o caminho em _MEIPASS
-        base_path = sys._MEIPASS
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+from src.sprites.sprite_manager import SpriteSheet, AnimationFrames, enemy_animation_bank
+from src.sprites.atlas import TextureAtlas
+from src.sprites.animation import AnimationPlayer, compile_animation_timings, FRAME_MS
+from src.utils.effects import EffectManager, ShieldAnimationCache, compile_emitter_presets
+from src.utils.assets import AssetManager, GAME_ASSETS
+from src.utils.asset_cache import AssetCache
+from src.utils.parallax import ParallaxBackground
+from src.utils.tilemap import TileMap
+from src.utils.camera import Camera
+from src.utils.renderer import DirtyRenderer, ScaledFramebuffer, RENDER_SCALES
+from src.utils.timestep import FixedTimestep
 
 # Inicialização do Pygame
 pygame.init()
@@ -26,11 +26,26 @@ SECTION_WIDTH = WIDTH * 3  # Largura total do mapa (3 seções em vez de 2)
 screen = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption("Solo Leveling - Demo")
 
+# Envio só das áreas alteradas da tela (opcional: SOLO_LEVELING_DIRTY_RECTS=1 ou --dirty-rects).
+# Ajuda em máquinas em que o flip da tela inteira é o custo dominante
+DIRTY_RECTS = os.environ.get("SOLO_LEVELING_DIRTY_RECTS", "0") == "1" or "--dirty-rects" in sys.argv
+renderer = DirtyRenderer(screen, enabled=DIRTY_RECTS)
+
+# Resolução interna do cenário (background e chão): "auto" ou uma das frações de RENDER_SCALES.
+# Escolhida no menu de opções ou por SOLO_LEVELING_RENDER_SCALE (1, 0.5 ou auto)
+framebuffer = ScaledFramebuffer((WIDTH, HEIGHT))
+RENDER_SCALE = os.environ.get("SOLO_LEVELING_RENDER_SCALE", "1")
+try:
+    framebuffer.set_mode("auto" if RENDER_SCALE == "auto" else float(RENDER_SCALE))
+except ValueError:
+    print(f"Escala de renderização inválida: {RENDER_SCALE} (use auto ou uma de {RENDER_SCALES}); usando 1")
+
 # Estados do jogo
 MENU = 'menu'
 OPTIONS = 'options'
 CREDITS = 'credits'
 CONTROLS = 'controls'
+LOADING = 'loading'
 PLAYING = 'playing'
 GAME_OVER = 'game_over'
 
@@ -48,90 +63,196 @@ DARK_GREEN = (0, 100, 0)
 # Criar menus
 main_menu = Menu(WIDTH, HEIGHT)
 options_menu = OptionsMenu(WIDTH, HEIGHT)
+options_menu.set_render_scale(framebuffer.mode)
 credits_menu = CreditsMenu(WIDTH, HEIGHT)
 
 # Estado atual do jogo
 current_state = MENU
 
-# Carregar tileset do Oak Woods
-try:
-    # Carregar o tileset do Oak Woods
-    oak_woods_tileset = pygame.image.load(get_resource_path("assets/oak_woods_v1.0/oak_woods_tileset.png")).convert_alpha()
-    
-    # Extrair tiles para plataforma (segunda imagem do sprite sheet)
-    platform_tile_left = oak_woods_tileset.subsurface((0, 16, 16, 16))  # Tile esquerdo
-    platform_tile_middle = oak_woods_tileset.subsurface((16, 16, 16, 16))  # Tile do meio
-    platform_tile_right = oak_woods_tileset.subsurface((32, 16, 16, 16))  # Tile direito
-    
-    # Extrair tiles para o chão (tiles de terra)
-    ground_tile_top = oak_woods_tileset.subsurface((16, 32, 16, 16))  # Tile de terra superior
-    ground_tile_bottom = oak_woods_tileset.subsurface((16, 48, 16, 16))  # Tile de terra inferior
-    
-    # Escalar os tiles para o tamanho desejado
-    TILE_SCALE = 2
-    platform_tile_left = pygame.transform.scale(platform_tile_left, (16 * TILE_SCALE, 16 * TILE_SCALE))
-    platform_tile_middle = pygame.transform.scale(platform_tile_middle, (16 * TILE_SCALE, 16 * TILE_SCALE))
-    platform_tile_right = pygame.transform.scale(platform_tile_right, (16 * TILE_SCALE, 16 * TILE_SCALE))
-    ground_tile_top = pygame.transform.scale(ground_tile_top, (16 * TILE_SCALE, 16 * TILE_SCALE))
-    ground_tile_bottom = pygame.transform.scale(ground_tile_bottom, (16 * TILE_SCALE, 16 * TILE_SCALE))
-except Exception as e:
-    print(f"Erro ao carregar o tileset do Oak Woods: {e}")
-    # Fallback para cores sólidas
-    platform_image = pygame.Surface((120, 30))
-    platform_image.fill((40, 40, 60))
-    ground_image = pygame.Surface((WIDTH, 50))
-    ground_image.fill(BROWN)
+# Configurar dimensões do sprite sheet do inimigo
+ENEMY_SPRITE["dimensions"]["width"] = 64
+ENEMY_SPRITE["dimensions"]["height"] = 64
+ENEMY_SPRITE["dimensions"]["scale"] = 1.5
+
+TILE_SCALE = 2
+
+# Tamanho em que cada imagem é usada no jogo; as versões escaladas ficam no cache em disco
+ASSET_TARGETS = {
+    "tileset": TILE_SCALE,
+    "player": PLAYER_SPRITE["dimensions"]["scale"]
+}
+for asset_key in GAME_ASSETS:
+    if asset_key.startswith("enemy/"):
+        ASSET_TARGETS[asset_key] = ENEMY_SPRITE["dimensions"]["scale"]
+    elif asset_key.startswith("background/"):
+        ASSET_TARGETS[asset_key] = (None, HEIGHT)  # Altura da tela, mantendo a proporção
+
+# Camadas do background (city 1), do fundo para a frente, com a fração do scroll da câmera
+# aplicada a cada uma. 6.png e 10.png do pacote são prévias com todas as camadas juntas
+BACKGROUND_LAYERS = [
+    ("background/1", 0.05),  # Céu
+    ("background/2", 0.15),  # Prédios distantes
+    ("background/3", 0.3),
+    ("background/4", 0.5),
+    ("background/5", 0.7)    # Prédios mais próximos
+]
 
-# Variáveis globais
-camera_scroll = 0  # Posição da câmera
-MAX_SCROLL = SECTION_WIDTH - WIDTH  # Máximo que a câmera pode rolar
+# Carregador central de assets: a decodificação das imagens começa em segundo plano
+# já aqui, enquanto o menu é exibido; o mundo só é montado quando tudo estiver pronto
+asset_manager = AssetManager(cache=AssetCache(
+    ".asset_cache",
+    config_hash=AssetCache.hash_config(PLAYER_SPRITE, ENEMY_SPRITE)
+))
+asset_manager.register_many(GAME_ASSETS, ASSET_TARGETS)
+
+# Atlas com todos os frames do jogo, gerado na primeira execução (ou por python -m src.sprites.atlas).
+# O digest das fontes e o atlas salvo são lidos em segundo plano junto com os assets; com um
+# atlas válido em disco, os sprite sheets de origem nem precisam ser abertos
+ATLAS_DIR = os.path.join(".asset_cache", "atlas")
+ATLAS_SOURCES = ["tileset", "player"] + [key for key in GAME_ASSETS if key.startswith("enemy/")]
+sprite_atlas = TextureAtlas()
+atlas_built = False            # Atlas carregado do disco ou já montado por build_sprite_atlas()
+atlas_build_submitted = False  # Montagem do atlas já enviada para o asset_manager
+
+def read_sprite_atlas():
+    # Roda numa thread do carregador: sem converter as páginas (isso exige a thread principal)
+    digest = TextureAtlas.hash_sources(
+        [asset_manager.entries[key][0] for key in ATLAS_SOURCES],
+        PLAYER_SPRITE, ENEMY_SPRITE, ASSET_TARGETS
+    )
+    return TextureAtlas.load(ATLAS_DIR, digest, convert=False) or TextureAtlas(digest=digest)
+
+def use_sprite_atlas(atlas):
+    """
+    Recebe o atlas lido em segundo plano (na thread principal, via asset_manager.poll)
+    :param atlas: Atlas salvo, um atlas vazio a gerar, ou None se a leitura falhou
+    """
+    global sprite_atlas, atlas_built
+    if atlas is None:
+        atlas = TextureAtlas()
+    if atlas.loaded:
+        atlas.convert_pages()
+        atlas_built = True
+    else:
+        # Sem atlas válido: os frames serão gerados a partir dos sprite sheets
+        # (a montagem começa em poll_assets, quando eles estiverem convertidos)
+        asset_manager.preload(ATLAS_SOURCES)
+    sprite_atlas = atlas
+
+def poll_assets():
+    """
+    Avança o carregamento em segundo plano; chamado uma vez por frame.
+    Sem atlas válido em disco, assim que os sprite sheets de origem estão prontos a
+    montagem do atlas vira mais um trabalho do asset_manager, para não travar a tela
+    de carregamento na passagem para o jogo.
+    :return: True quando os assets e o atlas estão prontos para build_world()
+    """
+    global atlas_build_submitted
+    ready = asset_manager.poll()
+    if ready and not atlas_built and not atlas_build_submitted:
+        atlas_build_submitted = True
+        asset_manager.submit("atlas_build", build_sprite_atlas)
+        return False
+    return ready
+
+asset_manager.preload([key for key in GAME_ASSETS if key not in ATLAS_SOURCES])
+asset_manager.submit("atlas", read_sprite_atlas, use_sprite_atlas)
+loading_screen = LoadingScreen(WIDTH, HEIGHT)
 
-# Carregar background
-try:
-    background = pygame.image.load(get_resource_path("assets/backgrounds/city 1/1.png")).convert()
-    # Redimensionar o background para caber na tela
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
-except:
-    # Fallback para um background simples
-    background = pygame.Surface((WIDTH, HEIGHT))
-    background.fill((100, 150, 200))  # Azul claro
-
-# Carregar sprite sheets
-try:
-    player_sprite_sheet = SpriteSheet(get_resource_path("assets/player.png"))
-    print("Carregando sprite sheet do inimigo...")
-    enemy_sprite_sheet = SpriteSheet(get_resource_path("assets/enemy/Idle.png"))
-    print("Sprite sheet do inimigo carregado com sucesso")
-    
-    # Configurar dimensões do sprite sheet do inimigo
-    ENEMY_SPRITE["dimensions"]["width"] = 64
-    ENEMY_SPRITE["dimensions"]["height"] = 64
-    ENEMY_SPRITE["dimensions"]["scale"] = 1.5
-    platform_image = pygame.image.load(get_resource_path("assets/dark_stone_platform.png")).convert_alpha()
-    platform_image = pygame.transform.scale(platform_image, (120, 30))
-except Exception as e:
-    print(f"Erro ao carregar sprite sheets: {str(e)}")
-    print("Usando fallback para o sprite do inimigo")
-    # Fallback para sprites básicos caso os arquivos não existam
-    scaled_width = int(PLAYER_SPRITE["dimensions"]["width"] * PLAYER_SPRITE["dimensions"]["scale"])
-    scaled_height = int(PLAYER_SPRITE["dimensions"]["height"] * PLAYER_SPRITE["dimensions"]["scale"])
-    player_image = pygame.Surface((scaled_width, scaled_height))
-    player_image.fill(BLUE)
-    
-    scaled_width = int(ENEMY_SPRITE["dimensions"]["width"] * ENEMY_SPRITE["dimensions"]["scale"])
-    scaled_height = int(ENEMY_SPRITE["dimensions"]["height"] * ENEMY_SPRITE["dimensions"]["scale"])
-    enemy_image = pygame.Surface((scaled_width, scaled_height))
-    enemy_image.fill(RED)
-    
-    # Fallback para plataforma
-    platform_image = pygame.Surface((120, 30))
-    platform_image.fill((40, 40, 60))  # Cor escura para representar pedra obscura
-    
-    # Adicionar alguns detalhes à plataforma
-    pygame.draw.line(platform_image, (60, 60, 80), (0, 0), (120, 0), 2)  # Borda superior
-    pygame.draw.line(platform_image, (20, 20, 40), (0, 29), (120, 29), 2)  # Borda inferior
-    for x in range(0, 120, 20):  # Adicionar alguns detalhes
-        pygame.draw.circle(platform_image, (50, 50, 70), (x + 10, 15), 3)
+# Variáveis globais
+camera = Camera(WIDTH, HEIGHT, SECTION_WIDTH)  # Scroll e viewport da câmera
+world_built = False  # O mundo é montado por build_world() depois do carregamento
+
+# Tiles do tileset do Oak Woods usados pelo jogo: nome -> (coluna, linha)
+TILESET_TILES = {
+    "platform_left": (0, 1),    # Plataforma: tile esquerdo (segunda imagem do sprite sheet)
+    "platform_middle": (1, 1),  # Plataforma: tile do meio
+    "platform_right": (2, 1),   # Plataforma: tile direito
+    "ground_top": (1, 2),       # Chão: tile de terra superior
+    "ground_bottom": (1, 3)     # Chão: tile de terra inferior
+}
+
+def tileset_tile(name):
+    """
+    Tile do tileset do Oak Woods servido a partir do atlas; na primeira vez é recortado do
+    tileset (já escalado por TILE_SCALE no carregamento). Com o atlas em disco o tileset não é aberto
+    :param name: Chave de TILESET_TILES
+    """
+    column, row = TILESET_TILES[name]
+    tile = 16 * TILE_SCALE
+    return sprite_atlas.image("tiles", name, lambda: asset_manager.get("tileset").subsurface(
+        (column * tile, row * tile, tile, tile)))
+
+def load_world_assets():
+    """
+    Prepara tiles, background e sprite sheets a partir das imagens do asset_manager.
+    Imagens que ainda não terminaram de carregar são carregadas na hora.
+    """
+    global platform_tile_left, platform_tile_middle, platform_tile_right
+    global ground_tile_top, ground_tile_bottom, platform_image, ground_image, background
+    global player_image, enemy_image
+
+    # Carregar tileset do Oak Woods
+    try:
+        # Extrair tiles para plataforma
+        platform_tile_left = tileset_tile("platform_left")
+        platform_tile_middle = tileset_tile("platform_middle")
+        platform_tile_right = tileset_tile("platform_right")
+        
+        # Extrair tiles para o chão (tiles de terra)
+        ground_tile_top = tileset_tile("ground_top")
+        ground_tile_bottom = tileset_tile("ground_bottom")
+    except Exception as e:
+        print(f"Erro ao carregar o tileset do Oak Woods: {e}")
+        # Fallback para cores sólidas
+        platform_image = pygame.Surface((120, 30))
+        platform_image.fill((40, 40, 60))
+        ground_image = pygame.Surface((WIDTH, 50))
+        ground_image.fill(BROWN)
+
+    # Carregar as camadas do background (já na altura da tela)
+    try:
+        layers = []
+        for asset_key, factor in BACKGROUND_LAYERS:
+            layer = asset_manager.get(asset_key)
+            if layer is None:
+                raise pygame.error(f"Camada {asset_key} não carregada")
+            layers.append((layer, factor))
+        background = ParallaxBackground(WIDTH, HEIGHT, layers)
+    except Exception as e:
+        print(f"Erro ao carregar o background: {e}")
+        # Fallback para um background simples
+        fallback_background = pygame.Surface((WIDTH, HEIGHT))
+        fallback_background.fill((100, 150, 200))  # Azul claro
+        background = ParallaxBackground(WIDTH, HEIGHT, [(fallback_background, 0)])
+
+    # Carregar sprite sheets
+    try:
+        platform_image = asset_manager.get("platform")
+        platform_image = pygame.transform.scale(platform_image, (120, 30))
+    except Exception as e:
+        print(f"Erro ao carregar sprite sheets: {str(e)}")
+        print("Usando fallback para o sprite do inimigo")
+        # Fallback para sprites básicos caso os arquivos não existam
+        scaled_width = int(PLAYER_SPRITE["dimensions"]["width"] * PLAYER_SPRITE["dimensions"]["scale"])
+        scaled_height = int(PLAYER_SPRITE["dimensions"]["height"] * PLAYER_SPRITE["dimensions"]["scale"])
+        player_image = pygame.Surface((scaled_width, scaled_height))
+        player_image.fill(BLUE)
+        
+        scaled_width = int(ENEMY_SPRITE["dimensions"]["width"] * ENEMY_SPRITE["dimensions"]["scale"])
+        scaled_height = int(ENEMY_SPRITE["dimensions"]["height"] * ENEMY_SPRITE["dimensions"]["scale"])
+        enemy_image = pygame.Surface((scaled_width, scaled_height))
+        enemy_image.fill(RED)
+        
+        # Fallback para plataforma
+        platform_image = pygame.Surface((120, 30))
+        platform_image.fill((40, 40, 60))  # Cor escura para representar pedra obscura
+        
+        # Adicionar alguns detalhes à plataforma
+        pygame.draw.line(platform_image, (60, 60, 80), (0, 0), (120, 0), 2)  # Borda superior
+        pygame.draw.line(platform_image, (20, 20, 40), (0, 29), (120, 29), 2)  # Borda inferior
+        for x in range(0, 120, 20):  # Adicionar alguns detalhes
+            pygame.draw.circle(platform_image, (50, 50, 70), (x + 10, 15), 3)
 
 ground_image = pygame.Surface((WIDTH, 50))
 ground_image.fill(BROWN)
@@ -139,8 +260,15 @@ ground_image.fill(BROWN)
 attack_image = pygame.Surface((70, 20))
 attack_image.fill(YELLOW)
 
-# Criar gerenciador de efeitos
-effect_manager = EffectManager()
+# Durações das animações pré-compiladas das configurações de sprite
+PLAYER_ANIMATION_TIMINGS = compile_animation_timings(PLAYER_SPRITE)
+ENEMY_ANIMATION_TIMINGS = compile_animation_timings(ENEMY_SPRITE)
+
+# Criar gerenciador de efeitos com os emissores definidos nas configurações de sprite
+effect_manager = EffectManager(presets=compile_emitter_presets({
+    "player": PLAYER_SPRITE,
+    "enemy": ENEMY_SPRITE
+}))
 
 # Classe do Jogador
 class Player(pygame.sprite.Sprite):
@@ -155,14 +283,13 @@ class Player(pygame.sprite.Sprite):
         self.effect_manager = effect_manager
         
         self.load_animations()
-        self.current_frame = 0
-        self.animation_timer = pygame.time.get_ticks()
-        self.animation_speed = 0.2  # Velocidade base da animação
+        self.animation = AnimationPlayer(self.animations, PLAYER_ANIMATION_TIMINGS, "idle")
         self.state = "idle"
         self.previous_state = "idle"
         self.image = self.animations["idle"][0].copy()
         self.rect = self.image.get_rect()
         self.rect.center = (x, y)
+        self.previous_position = self.rect.topleft  # Posição no passo anterior (para interpolar o desenho)
         
         # Ajustar velocidades baseado na escala
         self.speed = 5 * self.scale
@@ -223,60 +350,54 @@ class Player(pygame.sprite.Sprite):
         self.magic_shield_wave_speed = 0.05
         self.magic_shield_layers = 5
         self.magic_shield_damage_reduction = 0.5  # Reduz 50% do dano
+        self.magic_shield_cache = ShieldAnimationCache()
 
-    def update_animation(self):
-        # Atualizar animation_speed baseado no estado atual
-        self.animation_speed = PLAYER_SPRITE["animations"][self.state]["duration"] / 1000  # Converter para segundos
-        
-        # Incrementar o timer de animação
-        self.animation_timer += 1
-        
-        # Atualizar frame se o timer atingir o limite
-        if self.animation_timer >= self.animation_speed * 60:  # 60 FPS
-            self.animation_timer = 0
-            self.current_frame = (self.current_frame + 1) % len(self.animations[self.state])
-            
-            # Obter o próximo frame
-            self.image = self.animations[self.state][self.current_frame]
-            
-            # Aplicar flip se necessário
-            if not self.facing_right:
-                self.image = pygame.transform.flip(self.image, True, False)
-            
-            # Ajustar escala
-            self.image = pygame.transform.scale(
-                self.image,
-                (int(self.frame_width * self.scale),
-                 int(self.frame_height * self.scale))
-            )
+    def update_animation(self, dt=FRAME_MS):
+        # Trocar de estado reinicia a animação; o frame avança pelo tempo decorrido
+        self.animation.set_state(self.state)
+        self.animation.update(dt)
+        self.image = self.animation.image(self.facing_right)
 
     def load_animations(self):
+        # Frames servidos a partir do atlas de texturas (empacotados na primeira vez)
+        self.animations = sprite_atlas.animations("player", Player.build_animations)
+
+    @staticmethod
+    def build_animations():
+        """
+        Recorta as animações do sprite sheet do jogador (chamado pelo atlas na primeira vez)
+        :return: AnimationFrames com as variantes para os dois lados
+        """
+        dimensions = PLAYER_SPRITE["dimensions"]
+        scaled_width = int(dimensions["width"] * dimensions["scale"])
+        scaled_height = int(dimensions["height"] * dimensions["scale"])
         try:
-            # Pré-carregar e armazenar todas as animações com suas cópias
+            # Pré-carregar e armazenar todas as animações
+            # O sprite sheet já vem escalado pelo carregamento, então os frames são recortados
+            # no tamanho final sem reescalar
+            player_sprite_sheet = SpriteSheet.from_surface(asset_manager.get("player"))
             animations_temp = {}
             for state, config in PLAYER_SPRITE["animations"].items():
                 frames = player_sprite_sheet.get_animation_frames(
                     config["row"],
                     config["frames"],
-                    self.frame_width,
-                    self.frame_height,
-                    self.scale
+                    scaled_width,
+                    scaled_height
                 )
-                # Criar cópias de cada frame
-                animations_temp[state] = [frame.copy() for frame in frames]
-            self.animations = animations_temp
+                # Os frames são views do sprite sheet (sem cópia); o atlas copia os pixels uma única vez
+                animations_temp[state] = frames
+            # Pré-calcular as variantes viradas para a esquerda
+            return AnimationFrames(animations_temp)
             
         except Exception as e:
             print(f"Erro ao carregar animações: {e}")
             # Fallback para sprite básico
-            scaled_width = int(self.frame_width * self.scale)
-            scaled_height = int(self.frame_height * self.scale)
             basic_sprite = pygame.Surface((scaled_width, scaled_height))
             basic_sprite.fill(BLUE)
-            self.animations = {state: [basic_sprite.copy()] for state in PLAYER_SPRITE["animations"].keys()}
+            return AnimationFrames({state: [basic_sprite] for state in PLAYER_SPRITE["animations"].keys()})
 
-    def update(self, keys, platforms, ground, enemies):
-        global camera_scroll
+    def update(self, keys, platforms, ground, enemies, dt=FRAME_MS):
+        self.previous_position = self.rect.topleft
         
         # Regenerar mana
         if self.mana < self.max_mana:
@@ -297,7 +418,7 @@ class Player(pygame.sprite.Sprite):
             self.state = "idle"
 
         # Atualizar animação
-        self.update_animation()
+        self.update_animation(dt)
 
         # Atualizar cooldowns
         if self.attack_cooldown > 0:
@@ -321,33 +442,15 @@ class Player(pygame.sprite.Sprite):
 
         # Movimento lateral (apenas se não estiver atacando ou lançando magia)
         if not self.attacking and not self.casting:
-            old_x = self.rect.x
             if keys[pygame.K_LEFT]:
-                self.rect.x -= self.speed
                 self.facing_right = False
                 self.world_x -= self.speed
             if keys[pygame.K_RIGHT]:
-                self.rect.x += self.speed
                 self.facing_right = True
                 self.world_x += self.speed
 
-            # Atualizar scroll da câmera
-            if self.rect.centerx > WIDTH * 0.7 and camera_scroll < MAX_SCROLL:
-                diff = self.rect.x - old_x
-                camera_scroll = min(camera_scroll + diff, MAX_SCROLL)
-                self.rect.x = old_x
-            elif self.rect.centerx < WIDTH * 0.3 and camera_scroll > 0:
-                diff = old_x - self.rect.x
-                camera_scroll = max(camera_scroll - diff, 0)
-                self.rect.x = old_x
-
-        # Limites do mapa com scroll
-        if self.world_x < self.map_limits['left']:
-            self.world_x = self.map_limits['left']
-            self.rect.x = self.world_x - camera_scroll
-        elif self.world_x > self.map_limits['right']:
-            self.world_x = self.map_limits['right']
-            self.rect.x = self.world_x - camera_scroll
+        # Limites do mapa
+        self.world_x = max(self.map_limits['left'], min(self.world_x, self.map_limits['right']))
 
         # Dash (esquiva rápida)
         if keys[pygame.K_LSHIFT] and self.dash_cooldown == 0 and not self.attacking and not self.casting and self.mana >= self.dash_cost:
@@ -364,9 +467,10 @@ class Player(pygame.sprite.Sprite):
                 self.world_x = new_world_x
             else:
                 self.world_x = self.map_limits['left'] if new_world_x < self.map_limits['left'] else self.map_limits['right']
-            
-            # Atualizar posição na tela
-            self.rect.x = self.world_x - camera_scroll
+
+        # O rect fica em coordenadas do mundo; a câmera acompanha o jogador
+        self.rect.x = self.world_x
+        camera.follow(self.rect.centerx)
 
         # Verificar colisão com plataformas e chão
         for platform in platforms:
@@ -433,6 +537,16 @@ class Player(pygame.sprite.Sprite):
             pulse_factor = abs(math.sin(math.radians(self.magic_shield_pulse)))
             self.magic_shield_alpha = int(60 + (40 * pulse_factor))  # Variação de transparência mais sutil
             
+            # Atualizar efeito de ondulação
+            self.magic_shield_wave += self.magic_shield_wave_speed
+            
+            # Criar partículas de proteção mais frequentes
+            if random.random() < 0.4:  # 40% de chance de criar partículas a cada passo
+                angle = random.uniform(0, math.pi * 2)
+                x = self.rect.centerx + math.cos(angle) * self.magic_shield_radius
+                y = self.rect.centery + math.sin(angle) * self.magic_shield_radius
+                self.effect_manager.emit_burst(x, y, "player.shield")
+            
             # Desativar quando acabar a duração
             if self.magic_shield_duration <= 0:
                 self.magic_shield_active = False
@@ -445,18 +559,7 @@ class Player(pygame.sprite.Sprite):
             self.mana -= self.magic_shield_cost
             
             # Criar efeito de partículas ao ativar
-            for _ in range(20):  # Mais partículas
-                angle = random.uniform(0, math.pi * 2)
-                speed = random.uniform(2, 4)
-                self.effect_manager.create_particles(
-                    self.rect.centerx,
-                    self.rect.centery,
-                    (150, 200, 255),  # Cor mais clara para as partículas
-                    count=1,
-                    speed=speed,
-                    alpha=180,
-                    size=3
-                )
+            self.effect_manager.emit_burst(self.rect.centerx, self.rect.centery, "player.shield.activate")
 
     def attack(self, enemies):
         self.attacking = True
@@ -474,46 +577,25 @@ class Player(pygame.sprite.Sprite):
             attack_rect.midright = self.rect.midleft
 
         # Criar efeito de rastro do ataque
-        attack_points = []
-        num_points = 8
         if self.facing_right:
             start_x = self.rect.right
             end_x = start_x + attack_width
         else:
             start_x = self.rect.left
             end_x = start_x - attack_width
-            
-        for i in range(num_points):
-            progress = i / (num_points - 1)
-            x = start_x + (end_x - start_x) * progress
-            y = self.rect.centery + math.sin(progress * math.pi) * 20
-            attack_points.append((x, y))
-            
-            # Criar partículas ao longo do arco do ataque
-            effect_manager.create_particles(
-                x, y,
-                PLAYER_SPRITE["effects"]["attack"]["color"],
-                count=3,
-                alpha=200,
-                size=3,
-                speed=2
-            )
+
+        # Criar partículas ao longo do arco do ataque
+        effect_manager.emit_arc((start_x, self.rect.centery), (end_x, self.rect.centery),
+                                "player.attack", points=8, height=20)
 
         # Verificar colisões do ataque com inimigos
         for enemy in enemies:
             if attack_rect.colliderect(enemy.rect):
                 enemy.take_damage(30)
                 # Criar explosão de partículas no ponto de impacto
-                for _ in range(3):  # Três conjuntos de partículas para mais impacto
-                    effect_manager.create_particles(
-                        enemy.rect.centerx + random.randint(-15, 15),
-                        enemy.rect.centery + random.randint(-15, 15),
-                        PLAYER_SPRITE["effects"]["attack"]["color"],
-                        count=12,  # Mais partículas
-                        alpha=230,  # Alpha mais alto
-                        size=5,  # Partículas maiores
-                        speed=6  # Velocidade maior
-                    )
+                # Três conjuntos de partículas para mais impacto
+                effect_manager.emit_burst(enemy.rect.centerx, enemy.rect.centery,
+                                          "player.attack.impact", bursts=3, spread=15)
 
     def cast_magic(self, enemies):
         self.casting = True
@@ -530,52 +612,20 @@ class Player(pygame.sprite.Sprite):
             attack_rect.midright = self.rect.midleft
 
         # Criar efeito de energia mágica em espiral
-        center_x = attack_rect.centerx
-        center_y = attack_rect.centery
-        radius = 30
-        num_points = 12
-        for i in range(num_points):
-            angle = (i / num_points) * math.pi * 2
-            for r in range(0, radius, 5):
-                x = center_x + math.cos(angle) * r
-                y = center_y + math.sin(angle) * r
-                effect_manager.create_particles(
-                    x, y,
-                    PLAYER_SPRITE["effects"]["magic"]["color"],
-                    count=2,
-                    alpha=200,
-                    size=4,
-                    speed=3
-                )
+        effect_manager.emit_spiral(attack_rect.centerx, attack_rect.centery, "player.magic",
+                                   radius=30, arms=12, step=5)
 
         # Verificar colisões do ataque com inimigos
         for enemy in enemies:
             if attack_rect.colliderect(enemy.rect):
                 enemy.take_damage(45)
-                # Criar explosão mágica no ponto de impacto
-                for _ in range(3):  # Três camadas de efeitos
-                    # Círculo interno de partículas
-                    effect_manager.create_particles(
-                        enemy.rect.centerx,
-                        enemy.rect.centery,
-                        PLAYER_SPRITE["effects"]["magic"]["color"],
-                        count=15,  # Mais partículas
-                        alpha=230,  # Alpha mais alto
-                        size=6,  # Partículas maiores
-                        speed=7  # Velocidade maior
-                    )
-                    
-                    # Círculo externo com cor mais clara
-                    bright_color = tuple(min(c + 50, 255) for c in PLAYER_SPRITE["effects"]["magic"]["color"])
-                    effect_manager.create_particles(
-                        enemy.rect.centerx,
-                        enemy.rect.centery,
-                        bright_color,
-                        count=10,
-                        alpha=180,
-                        size=4,
-                        speed=5
-                    )
+                # Criar explosão mágica no ponto de impacto (três camadas de efeitos)
+                # Círculo interno de partículas
+                effect_manager.emit_burst(enemy.rect.centerx, enemy.rect.centery,
+                                          "player.magic.impact", bursts=3)
+                # Círculo externo com cor mais clara
+                effect_manager.emit_burst(enemy.rect.centerx, enemy.rect.centery,
+                                          "player.magic.impact_glow", bursts=3)
 
     def draw_health_bar(self, surface):
         # Configurações das barras
@@ -599,29 +649,31 @@ class Player(pygame.sprite.Sprite):
             if progress_width > 0:
                 pygame.draw.rect(surface, color, progress_rect, border_radius=height//2)
             # Desenhar borda
-            pygame.draw.rect(surface, (100, 100, 100), full_rect, 2, border_radius=height//2)
+            return pygame.draw.rect(surface, (100, 100, 100), full_rect, 2, border_radius=height//2)
         
         # Função auxiliar para desenhar texto com sombra
         def draw_text_with_shadow(text, pos, color=(255, 255, 255)):
             font = pygame.font.Font(None, 24)
             # Sombra
             shadow = font.render(text, True, (0, 0, 0))
-            surface.blit(shadow, (pos[0] + 1, pos[1] + 1))
+            shadow_rect = surface.blit(shadow, (pos[0] + 1, pos[1] + 1))
             # Texto
             rendered = font.render(text, True, color)
-            surface.blit(rendered, pos)
+            return surface.blit(rendered, pos).union(shadow_rect)
         
         # Desenhar indicadores HP e MP primeiro
         hp_text_pos = (padding, health_pos[1] + 2)  # +2 para alinhar verticalmente
         mp_text_pos = (padding, mana_pos[1] + 2)
-        draw_text_with_shadow("HP", hp_text_pos, (220, 50, 50))
-        draw_text_with_shadow("MP", mp_text_pos, (50, 50, 220))
+        areas = [
+            draw_text_with_shadow("HP", hp_text_pos, (220, 50, 50)),
+            draw_text_with_shadow("MP", mp_text_pos, (50, 50, 220))
+        ]
         
         # Desenhar barras
-        draw_rounded_bar(health_pos, bar_width, bar_height,
-                        (200, 50, 50), self.health / self.max_health)
-        draw_rounded_bar(mana_pos, bar_width, bar_height,
-                        (50, 50, 200), self.mana / self.max_mana)
+        areas.append(draw_rounded_bar(health_pos, bar_width, bar_height,
+                                      (200, 50, 50), self.health / self.max_health))
+        areas.append(draw_rounded_bar(mana_pos, bar_width, bar_height,
+                                      (50, 50, 200), self.mana / self.max_mana))
         
         # Textos dos valores
         health_text = f"{int(self.health)}/{self.max_health}"
@@ -633,94 +685,34 @@ class Player(pygame.sprite.Sprite):
         mana_text_pos = (mana_pos[0] + bar_width + text_padding, mana_pos[1])
         
         # Desenhar textos dos valores
-        draw_text_with_shadow(health_text, health_text_pos)
-        draw_text_with_shadow(mana_text, mana_text_pos)
-
-    def draw(self, surface, camera_offset):
-        # Desenhar efeito mágico
+        areas.append(draw_text_with_shadow(health_text, health_text_pos))
+        areas.append(draw_text_with_shadow(mana_text, mana_text_pos))
+        
+        # Área da tela ocupada pelo HUD (para o envio por dirty rects)
+        return areas[0].unionall(areas[1:])
+
+    def draw(self, surface, offset):
+        """
+        Desenha o escudo mágico (a animação e as partículas avançam em update)
+        :param offset: Deslocamento (x, y) subtraído do rect, ex.: camera.sprite_offset(player)
+        """
+        area = None
         if self.magic_shield_active:
-            # Criar superfície para a bolha com gradiente
-            shield_surface = pygame.Surface((self.magic_shield_radius * 2, self.magic_shield_radius * 2), pygame.SRCALPHA)
-            
-            # Atualizar efeito de ondulação
-            self.magic_shield_wave += self.magic_shield_wave_speed
-            
-            # Desenhar múltiplas camadas para criar efeito de aura
-            for i in range(self.magic_shield_layers):
-                # Calcular raio e ondulação para cada camada
-                layer_radius = self.magic_shield_radius - (i * 8)
-                wave_offset = math.sin(self.magic_shield_wave + i * math.pi/2) * 4
-                
-                # Desenhar círculos concêntricos com ondulação
-                for r in range(layer_radius, 0, -2):
-                    # Calcular alpha baseado na distância do centro
-                    alpha = int(self.magic_shield_alpha * (r / layer_radius) * 0.9)
-                    current_radius = r + wave_offset
-                    
-                    # Desenhar círculo com cor variável baseada na distância
-                    color = (
-                        int(self.magic_shield_color[0] * (0.8 + 0.2 * (r / layer_radius))),
-                        int(self.magic_shield_color[1] * (0.8 + 0.2 * (r / layer_radius))),
-                        int(self.magic_shield_color[2] * (0.8 + 0.2 * (r / layer_radius)))
-                    )
-                    
-                    pygame.draw.circle(shield_surface, (*color, alpha),
-                                     (self.magic_shield_radius, self.magic_shield_radius),
-                                     current_radius)
-            
-            # Adicionar brilho externo mais intenso
-            glow_radius = self.magic_shield_radius + 8
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            
-            # Criar gradiente de brilho mais suave
-            for r in range(glow_radius, 0, -1):
-                alpha = int((r / glow_radius) * self.magic_shield_alpha * 0.5)
-                glow_color = (
-                    int(self.magic_shield_color[0] * 1.2),
-                    int(self.magic_shield_color[1] * 1.2),
-                    int(self.magic_shield_color[2] * 1.2)
-                )
-                pygame.draw.circle(glow_surface, (*glow_color, alpha),
-                                 (glow_radius, glow_radius),
-                                 r)
-            
-            # Posicionar os efeitos
-            shield_pos = (self.rect.centerx - self.magic_shield_radius - camera_offset,
-                        self.rect.centery - self.magic_shield_radius)
-            glow_pos = (self.rect.centerx - glow_radius - camera_offset,
-                       self.rect.centery - glow_radius)
-            
-            # Desenhar os efeitos
-            surface.blit(glow_surface, glow_pos)
-            surface.blit(shield_surface, shield_pos)
-            
-            # Criar partículas de proteção mais frequentes
-            if random.random() < 0.4:  # 40% de chance de criar partículas a cada frame
-                angle = random.uniform(0, math.pi * 2)
-                x = self.rect.centerx + math.cos(angle) * self.magic_shield_radius
-                y = self.rect.centery + math.sin(angle) * self.magic_shield_radius
-                self.effect_manager.create_particles(
-                    x, y,
-                    (150, 200, 255),  # Cor mais clara para as partículas
-                    count=2,  # Mais partículas
-                    speed=1.5,  # Velocidade um pouco maior
-                    alpha=150,  # Alpha mais alto
-                    size=3  # Tamanho um pouco maior
-                )
+            # Bolha e brilho vêm pré-renderizados do cache (refeito se raio, cor ou camadas mudarem)
+            self.magic_shield_cache.configure(self.magic_shield_radius, self.magic_shield_color,
+                                              self.magic_shield_layers)
+            shield_frame = self.magic_shield_cache.get_frame(self.magic_shield_wave, self.magic_shield_alpha)
+            half_size = shield_frame.get_width() // 2
+            area = surface.blit(shield_frame, (self.rect.centerx - half_size - offset[0],
+                                               self.rect.centery - half_size - offset[1]))
+        return area
 
     def take_damage(self, damage):
         # Reduzir dano se o escudo estiver ativo
         if self.magic_shield_active:
             damage = int(damage * self.magic_shield_damage_reduction)
             # Criar efeito de partículas ao receber dano com escudo
-            self.effect_manager.create_particles(
-                self.rect.centerx,
-                self.rect.centery,
-                (150, 200, 255),
-                count=8,
-                alpha=150,
-                size=2
-            )
+            self.effect_manager.emit_burst(self.rect.centerx, self.rect.centery, "player.shield.hit")
         
         self.health -= damage
         if self.health <= 0:
@@ -732,38 +724,44 @@ class Player(pygame.sprite.Sprite):
 
 # Classe da Plataforma
 class Platform(pygame.sprite.Sprite):
+    width = 120
+    height = 32  # Altura ajustada para o novo tile
+    
     def __init__(self, x, y):
         super().__init__()
-        # Criar superfície para a plataforma
-        self.width = 120
-        self.height = 32  # Altura ajustada para o novo tile
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Todas as plataformas compartilham a mesma imagem, montada uma vez e guardada no atlas
+        self.image = sprite_atlas.image("platform", "default", Platform.build_image)
+        
+        # Posição em coordenadas do mundo (a câmera só é aplicada no desenho)
+        self.rect = self.image.get_rect(topleft=(x, y))
+        self.world_x = x
+        
+        # Criar uma hitbox mais precisa para colisões
+        self.collision_rect = pygame.Rect(x, y + 5, self.width, self.height - 10)
+    
+    @classmethod
+    def build_image(cls):
+        image = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
         
         try:
             # Desenhar os tiles na plataforma
-            num_middle_tiles = (self.width - 64) // 32  # Número de tiles do meio necessários
+            num_middle_tiles = (cls.width - 64) // 32  # Número de tiles do meio necessários
             
             # Desenhar tile esquerdo
-            self.image.blit(platform_tile_left, (0, 0))
+            image.blit(tileset_tile("platform_left"), (0, 0))
             
             # Desenhar tiles do meio
             for i in range(num_middle_tiles):
-                self.image.blit(platform_tile_middle, ((i + 1) * 32, 0))
+                image.blit(tileset_tile("platform_middle"), ((i + 1) * 32, 0))
             
             # Desenhar tile direito
-            self.image.blit(platform_tile_right, (self.width - 32, 0))
+            image.blit(tileset_tile("platform_right"), (cls.width - 32, 0))
             
         except:
-            self.image.fill((40, 40, 60))
-            pygame.draw.line(self.image, (60, 60, 80), (0, 0), (self.width, 0), 2)
-            pygame.draw.line(self.image, (20, 20, 40), (0, self.height-1), (self.width, self.height-1), 2)
-        
-        self.rect = self.image.get_rect(topleft=(x, y))
-        self.initial_x = x
-        self.world_x = x  # Adicionar posição mundial
-        
-        # Criar uma hitbox mais precisa para colisões
-        self.collision_rect = pygame.Rect(x, y + 5, self.width, self.height - 10)
+            image.fill((40, 40, 60))
+            pygame.draw.line(image, (60, 60, 80), (0, 0), (cls.width, 0), 2)
+            pygame.draw.line(image, (20, 20, 40), (0, cls.height-1), (cls.width, cls.height-1), 2)
+        return image
     
     def update(self):
         # Atualizar a hitbox de colisão junto com a posição da plataforma
@@ -778,26 +776,27 @@ class Platform(pygame.sprite.Sprite):
 
 # Classe do Chão
 class Ground(pygame.sprite.Sprite):
-    def __init__(self):
+    def __init__(self, width=SECTION_WIDTH):
         super().__init__()
-        self.image = pygame.Surface((SECTION_WIDTH, 64))  # Altura ajustada para os tiles
-        self.image.set_colorkey((0, 0, 0))  # Tornar o fundo transparente
+        tile_size = 32  # Largura do tile escalado
+        columns = -(-width // tile_size)
         
         try:
-            # Preencher o chão com os tiles de terra
-            for x in range(0, SECTION_WIDTH, 32):  # 32 é a largura do tile escalado
-                # Primeira fileira (superior)
-                self.image.blit(ground_tile_top, (x, 0))
-                # Segunda fileira (inferior)
-                self.image.blit(ground_tile_bottom, (x, 32))
-        except:
-            self.image.fill(BROWN)
+            tiles = [ground_tile_top, ground_tile_bottom]
+        except NameError:
+            # Fallback para cor sólida
+            fallback_tile = pygame.Surface((tile_size, tile_size))
+            fallback_tile.fill(BROWN)
+            tiles = [fallback_tile, fallback_tile]
         
-        self.rect = self.image.get_rect(topleft=(0, HEIGHT - 64))
-        self.initial_x = 0
+        # Fase guardada como índices de tiles: primeira fileira (superior) e segunda (inferior)
+        self.tilemap = TileMap(tiles, [[0] * columns, [1] * columns], tile_size)
+        
+        self.rect = pygame.Rect(0, HEIGHT - self.tilemap.height, width, self.tilemap.height)
     
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, camera_offset=0, scale=1.0):
+        # Só os chunks que cruzam a câmera são desenhados
+        self.tilemap.draw(surface, camera_offset, self.rect.y, self.rect.x, scale)
 
 
 # Classe da Tela de Game Over
@@ -858,13 +857,7 @@ class Enemy(pygame.sprite.Sprite):
         }
         
         # Criar sprite de fallback
-        self.fallback_sprite = pygame.Surface((self.sprite_config["width"], self.sprite_config["height"]))
-        self.fallback_sprite.fill((255, 0, 0))  # Vermelho para fallback
-        self.fallback_sprite = pygame.transform.scale(
-            self.fallback_sprite, 
-            (int(self.sprite_config["width"] * self.sprite_config["scale"]),
-             int(self.sprite_config["height"] * self.sprite_config["scale"]))
-        )
+        self.fallback_sprite = Enemy.build_fallback_sprite()
         
         # Inicializar animações
         self.animations = {}
@@ -872,9 +865,7 @@ class Enemy(pygame.sprite.Sprite):
         
         # Estado inicial
         self.current_state = "idle"
-        self.current_frame = 0
-        self.animation_timer = 0
-        self.animation_speed = 0.2
+        self.animation = AnimationPlayer(self.animations, ENEMY_ANIMATION_TIMINGS, "idle")
         self.direction = 1  # 1 para direita, -1 para esquerda
         
         # Configurações de movimento
@@ -888,6 +879,7 @@ class Enemy(pygame.sprite.Sprite):
         self.rect.x = x
         self.rect.bottom = y  # Usar bottom em vez de y para alinhar com o chão
         self.world_x = x
+        self.previous_position = self.rect.topleft  # Posição no passo anterior (para interpolar o desenho)
         
         # Configurações de ataque
         self.attack_range = 100
@@ -899,26 +891,59 @@ class Enemy(pygame.sprite.Sprite):
         self.death_timer = 0
         self.death_duration = 60
         
-        # Trail effect
-        self.trail = []
-        self.trail_length = 5
+        # Trail effect (desenhado pelo effect_manager junto com os outros rastros)
+        self.trail_name = f"enemy_{id(self)}"
         self.trail_timer = 0
         self.trail_interval = 5
+        effect_manager.create_trail(self.trail_name, RED, length=5, width=2, min_width=2)
 
     def load_animations(self):
+        # Os frames são carregados uma única vez, guardados no atlas e compartilhados por todos os inimigos
+        key = ("enemy", self.sprite_config["scale"])
+        self.animations = enemy_animation_bank.get(key, Enemy.atlas_animations)
+        
+        # Definir sprite inicial
+        self.image = self.animations["idle"][0]
+        self.rect = self.image.get_rect()
+
+    @staticmethod
+    def build_fallback_sprite():
+        # Quadrado vermelho no tamanho do frame escalado
+        dimensions = ENEMY_SPRITE["dimensions"]
+        fallback_sprite = pygame.Surface((dimensions["width"], dimensions["height"]))
+        fallback_sprite.fill((255, 0, 0))  # Vermelho para fallback
+        return pygame.transform.scale(
+            fallback_sprite,
+            (int(dimensions["width"] * dimensions["scale"]),
+             int(dimensions["height"] * dimensions["scale"]))
+        )
+
+    @staticmethod
+    def atlas_animations():
+        # Animações do inimigo servidas a partir do atlas (empacotadas na primeira vez)
+        return sprite_atlas.animations(f"enemy@{ENEMY_SPRITE['dimensions']['scale']}", Enemy.build_animations)
+
+    @staticmethod
+    def build_animations():
+        """
+        Recorta as animações dos sprite sheets do inimigo (chamado pelo atlas na primeira vez)
+        :return: AnimationFrames com as variantes para os dois lados
+        """
+        scale = ENEMY_SPRITE["dimensions"]["scale"]
+        fallback_sprite = Enemy.build_fallback_sprite()
+        animations = {
+            "idle": [],
+            "walking": [],
+            "running": [],
+            "jumping": [],
+            "attacking": [],
+            "attacking2": [],
+            "attacking3": [],
+            "hurt": [],
+            "death": []
+        }
         try:
             print("Iniciando carregamento das animações do inimigo...")
-            self.animations = {
-                "idle": [],
-                "walking": [],
-                "running": [],
-                "jumping": [],
-                "attacking": [],
-                "attacking2": [],
-                "attacking3": [],
-                "hurt": [],
-                "death": []
-            }
 
             # Configurações específicas para cada animação
             animation_configs = {
@@ -935,91 +960,60 @@ class Enemy(pygame.sprite.Sprite):
 
             # Carregar cada sprite individual
             sprite_files = {
-                "idle": get_resource_path("assets/enemy/Idle.png"),
-                "walking": get_resource_path("assets/enemy/Walk.png"),
-                "running": get_resource_path("assets/enemy/Run.png"),
-                "jumping": get_resource_path("assets/enemy/Jump.png"),
-                "attacking": get_resource_path("assets/enemy/Attack_1.png"),
-                "attacking2": get_resource_path("assets/enemy/Attack_2.png"),
-                "attacking3": get_resource_path("assets/enemy/Attack_3.png"),
-                "hurt": get_resource_path("assets/enemy/Hurt.png"),
-                "death": get_resource_path("assets/enemy/Dead.png")
+                "idle": "enemy/idle",
+                "walking": "enemy/walk",
+                "running": "enemy/run",
+                "jumping": "enemy/jump",
+                "attacking": "enemy/attack_1",
+                "attacking2": "enemy/attack_2",
+                "attacking3": "enemy/attack_3",
+                "hurt": "enemy/hurt",
+                "death": "enemy/dead"
             }
 
-            for state, file_path in sprite_files.items():
+            for state, asset_key in sprite_files.items():
                 try:
-                    # Carregar o sprite sheet completo
-                    sprite_sheet = pygame.image.load(file_path).convert_alpha()
+                    # Obter o sprite sheet completo do carregador central
+                    sprite_sheet = enemy_animation_bank.load_sheet(asset_key, asset_manager.get)
                     config = animation_configs[state]
-                    frames = []
                     
-                    # Calcular o número total de frames na imagem
-                    sheet_width = sprite_sheet.get_width()
-                    frame_width = config["width"]
-                    
-                    # Extrair cada frame do sprite sheet
-                    for i in range(config["frames"]):
-                        # Criar uma nova superfície para o frame
-                        frame_surface = pygame.Surface((frame_width, config["height"]), pygame.SRCALPHA)
-                        
-                        # Copiar a região do frame do sprite sheet
-                        frame_surface.blit(sprite_sheet, 
-                                         (0, 0),  # Destino na nova superfície
-                                         (i * frame_width, 0, frame_width, config["height"]))  # Área do sprite sheet
-                        
-                        # Escalar o frame se necessário
-                        scaled_frame = pygame.transform.scale(
-                            frame_surface,
-                            (int(frame_width * self.sprite_config["scale"]),
-                             int(config["height"] * self.sprite_config["scale"]))
-                        )
-                        
-                        frames.append(scaled_frame)
+                    # O sprite sheet já vem escalado pelo carregamento (cache de assets); os frames
+                    # são views do sheet, copiadas uma única vez quando vão para o atlas
+                    frames = SpriteSheet.from_surface(sprite_sheet).get_animation_frames(
+                        0,
+                        config["frames"],
+                        int(config["width"] * scale),
+                        int(config["height"] * scale)
+                    )
                     
                     if frames:
-                        self.animations[state] = frames
+                        animations[state] = frames
                         print(f"Carregados {len(frames)} frames para {state}")
                     else:
                         print(f"Falha ao carregar frames para {state}")
-                        self.animations[state] = [self.fallback_sprite]
+                        animations[state] = [fallback_sprite]
                         
                 except Exception as e:
                     print(f"Erro ao carregar {state}: {e}")
-                    self.animations[state] = [self.fallback_sprite]
+                    animations[state] = [fallback_sprite]
 
             print("Carregamento das animações do inimigo concluído!")
             
-            # Definir sprite inicial
-            self.image = self.animations["idle"][0]
-            self.rect = self.image.get_rect()
-            
         except Exception as e:
             print(f"Erro ao carregar animações do inimigo: {e}")
             # Usar fallback para todas as animações em caso de erro
-            for state in self.animations.keys():
-                self.animations[state] = [self.fallback_sprite]
-            self.image = self.fallback_sprite
-            self.rect = self.image.get_rect()
+            for state in animations.keys():
+                animations[state] = [fallback_sprite]
+        # Pré-calcular as variantes viradas para a esquerda
+        return AnimationFrames(animations)
 
-    def update_animation(self):
+    def update_animation(self, dt=FRAME_MS):
         try:
-            # Atualizar animation_speed baseado no estado atual
-            self.animation_speed = ENEMY_SPRITE["animations"][self.current_state]["duration"] / 1000  # Converter para segundos
-            
-            # Incrementar o timer de animação
-            self.animation_timer += 1
-            
-            # Atualizar frame se o timer atingir o limite
-            if self.animation_timer >= self.animation_speed * 60:  # 60 FPS
-                self.animation_timer = 0
-                self.current_frame = (self.current_frame + 1) % len(self.animations[self.current_state])
-                
-                # Obter o próximo frame
-                self.image = self.animations[self.current_state][self.current_frame].copy()
-                
-                # Virar o sprite baseado na direção do movimento
-                if self.direction == -1:  # Movendo para a esquerda
-                    self.image = pygame.transform.flip(self.image, True, False)
+            # Trocar de estado reinicia a animação; o frame avança pelo tempo decorrido
+            state_changed = self.animation.set_state(self.current_state)
+            if self.animation.update(dt) or state_changed:
+                # Obter o próximo frame, já virado para a direção do movimento
+                self.image = self.animation.image(self.direction == 1)
                 
                 # Manter o retângulo na mesma posição
                 old_center = self.rect.center
@@ -1031,13 +1025,14 @@ class Enemy(pygame.sprite.Sprite):
             # Em caso de erro, usar o fallback
             self.image = self.fallback_sprite
 
-    def update(self, player, ground, platforms):
+    def update(self, player, ground, platforms, dt=FRAME_MS):
+        self.previous_position = self.rect.topleft
         if self.is_dead:
             self.current_state = "death"
             self.death_timer += 1
             if self.death_timer >= self.death_duration:
                 self.kill()
-            self.update_animation()
+            self.update_animation(dt)
             return
 
         # Atualizar cooldowns
@@ -1077,14 +1072,7 @@ class Enemy(pygame.sprite.Sprite):
                abs(self.rect.centery - self.player.rect.centery) < 50:  # Verificar também a altura
                 self.player.health -= 10  # Dano do inimigo
                 # Criar efeito de dano
-                effect_manager.create_particles(
-                    self.player.rect.centerx,
-                    self.player.rect.centery,
-                    (220, 40, 40),  # Vermelho
-                    count=5,
-                    alpha=160,
-                    size=3
-                )
+                effect_manager.emit_burst(self.player.rect.centerx, self.player.rect.centery, "enemy.attack")
         else:
             # Mover em direção ao jogador
             if self.world_x < self.player.world_x:
@@ -1104,27 +1092,30 @@ class Enemy(pygame.sprite.Sprite):
                 # Alternar entre correr e andar baseado na distância
                 self.current_state = "running" if dist_to_player < 200 else "walking"
 
-        # Atualizar posição na tela baseado na posição mundial
-        self.rect.x = self.world_x - camera_scroll
+        # O rect acompanha a posição no mundo
+        self.rect.x = self.world_x
 
         # Atualizar trail effect
         if self.trail_timer >= self.trail_interval:
-            self.trail.append((self.rect.centerx, self.rect.centery))
-            if len(self.trail) > self.trail_length:
-                self.trail.pop(0)
+            effect_manager.update_trail(self.trail_name, self.rect.centerx, self.rect.centery)
             self.trail_timer = 0
         self.trail_timer += 1
 
         # Atualizar animação
-        self.update_animation()
+        self.update_animation(dt)
+
+    def kill(self):
+        # Remover o rastro junto com o inimigo
+        effect_manager.remove_trail(self.trail_name)
+        super().kill()
 
     def take_damage(self, damage):
         self.health -= damage
         if self.health <= 0:
             self.health = 0
             self.is_dead = True
-            self.current_state = "death"
-            self.current_frame = 0
+            self.current_state = "death"  # O AnimationPlayer recomeça do primeiro frame
+            effect_manager.remove_trail(self.trail_name)
             # Aumentar chance de drop para 60%
             if random.random() < 0.6:  # 60% de chance de drop
                 power_up_type = "vida" if random.random() < 0.7 else "mana"  # 70% vida, 30% mana
@@ -1132,11 +1123,14 @@ class Enemy(pygame.sprite.Sprite):
                 power_ups.add(power_up)
                 all_sprites.add(power_up)
 
-    def draw_health_bar(self, surface):
+    def draw_health_bar(self, surface, offset=(0, 0)):
+        """
+        :param offset: Deslocamento (x, y) subtraído do rect, ex.: camera.sprite_offset(enemy)
+        """
         if not self.is_dead:
             bar_width = 40
             bar_height = 5
-            bar_position = [self.rect.centerx - bar_width//2, self.rect.top - 10]
+            bar_position = [self.rect.centerx - offset[0] - bar_width//2, self.rect.top - offset[1] - 10]
             
             # Desenhar fundo da barra (vermelho)
             pygame.draw.rect(surface, RED, (*bar_position, bar_width, bar_height))
@@ -1147,16 +1141,7 @@ class Enemy(pygame.sprite.Sprite):
                 pygame.draw.rect(surface, GREEN, (*bar_position, health_width, bar_height))
             
             # Desenhar borda da barra
-            pygame.draw.rect(surface, WHITE, (*bar_position, bar_width, bar_height), 1)
-            
-            # Desenhar trail effect
-            if len(self.trail) > 1:
-                for i in range(len(self.trail) - 1):
-                    alpha = int(255 * (i / len(self.trail)))
-                    color = (*RED, alpha)
-                    start_pos = self.trail[i]
-                    end_pos = self.trail[i + 1]
-                    pygame.draw.line(surface, color, start_pos, end_pos, 2)
+            return pygame.draw.rect(surface, WHITE, (*bar_position, bar_width, bar_height), 1)
 
 
 # Grupos de sprites
@@ -1181,18 +1166,9 @@ platform_positions = [
     (1950, HEIGHT - 340)   # Plataforma final
 ]
 
-for pos in platform_positions:
-    platform = Platform(pos[0], pos[1])
-    platforms.add(platform)
-    all_sprites.add(platform)
-
-# Criar chão
-ground = Ground()
-all_sprites.add(ground)
-
-# Criar jogador em uma posição mais segura
-player = Player(100, HEIGHT - 60)
-all_sprites.add(player)
+# Jogador, chão e spawner são criados em build_world(), depois do carregamento dos assets
+ground = None
+player = None
 
 # Criar tela de game over
 game_over_screen = GameOverScreen()
@@ -1209,16 +1185,19 @@ class EnemySpawner:
         self.positions = positions
         self.platforms = platforms
         self.player = player
-        self.spawn_timer = {}  # Dicionário para controlar tempo de respawn por posição
-        self.respawn_delay = 1800  # 30 segundos (60 FPS * 30)
+        self.spawn_timer = {}  # Dicionário para controlar tempo de respawn por posição (tempo simulado)
+        self.respawn_delay = 1800 * FRAME_MS  # 1800 frames (30 s) em milissegundos de simulação
         self.max_enemies = 3  # Número máximo de inimigos simultâneos
         
         # Inicializar timers
         for pos in self.positions:
             self.spawn_timer[str(pos)] = 0
     
-    def update(self):
-        current_time = pygame.time.get_ticks()
+    def update(self, current_time):
+        """
+        :param current_time: Tempo simulado em milissegundos (não o relógio real, para o
+                             respawn não adiantar quando o desenho atrasa)
+        """
         
         # Se já tiver o número máximo de inimigos, não spawnar mais
         if len(enemies) >= self.max_enemies:
@@ -1242,8 +1221,72 @@ class EnemySpawner:
                 all_sprites.add(new_enemy)
                 self.spawn_timer[pos_key] = current_time + self.respawn_delay
 
-# Criar spawner de inimigos (atualizar a inicialização)
-enemy_spawner = EnemySpawner(enemy_positions, platforms, player)
+enemy_spawner = None
+
+def build_world():
+    """
+    Monta plataformas, chão, jogador e spawner com os assets já carregados.
+    Chamado uma única vez, quando o asset_manager termina o carregamento.
+    """
+    global ground, player, enemy_spawner, arrow, world_built
+    build_sprite_atlas()
+    load_world_assets()
+    
+    for pos in platform_positions:
+        platform = Platform(pos[0], pos[1])
+        platforms.add(platform)
+        all_sprites.add(platform)
+    
+    # Criar chão (desenhado à parte pelo tilemap, fora de all_sprites)
+    ground = Ground()
+    
+    # Criar jogador em uma posição mais segura
+    player = Player(100, HEIGHT - 60)
+    all_sprites.add(player)
+    
+    # Criar spawner de inimigos
+    enemy_spawner = EnemySpawner(enemy_positions, platforms, player)
+    
+    # Criar seta indicativa
+    arrow = Arrow()
+    
+    world_built = True
+
+def build_sprite_atlas():
+    """
+    Empacota no atlas todas as imagens do jogo de uma vez (tiles, animações do jogador e do
+    inimigo, plataforma, power-ups e seta) e grava o atlas. Com um atlas válido em disco não
+    há nada a fazer. Roda antes de o mundo pedir qualquer frame ao atlas, para que a
+    redução da última página (trim) não deixe recortes apontando para a página antiga.
+    No jogo roda em segundo plano (ver poll_assets): não usa o display, e os sprite sheets
+    de origem já foram convertidos na thread principal.
+    """
+    global atlas_built
+    if atlas_built:
+        return
+    for name in TILESET_TILES:
+        try:
+            tileset_tile(name)
+        except Exception as e:
+            print(f"Erro ao recortar o tile {name}: {e}")
+    sprite_atlas.animations("player", Player.build_animations)
+    Enemy.atlas_animations()
+    sprite_atlas.image("platform", "default", Platform.build_image)
+    PowerUp.build_images()
+    sprite_atlas.image("arrow", "default", Arrow.build_image)
+    # Com tudo empacotado, a última página fica só com a altura ocupada
+    sprite_atlas.trim()
+    save_sprite_atlas()
+    atlas_built = True
+
+def save_sprite_atlas():
+    # Gravar o atlas quando houver frames novos, para a próxima execução carregá-lo pronto
+    if sprite_atlas.dirty:
+        try:
+            sprite_atlas.save(ATLAS_DIR)
+            print(f"Atlas de texturas salvo: {sprite_atlas.stats()}")
+        except OSError as e:
+            print(f"Não foi possível salvar o atlas de texturas: {e}")
 
 # Loop principal do jogo
 running = True
@@ -1251,16 +1294,18 @@ game_over = False
 clock = pygame.time.Clock()
 
 def reset_game():
-    global player, enemies, camera_scroll
+    global player, enemies
     # Resetar câmera
-    camera_scroll = 0
+    camera.reset()
     
     # Resetar jogador em posição segura
     player.health = player.max_health
     player.mana = player.max_mana
     player.world_x = 100
-    player.rect.centerx = 100
+    player.rect.x = player.world_x
     player.rect.bottom = HEIGHT - 60
+    player.previous_position = player.rect.topleft
+    timestep.reset()
     
     # Remover inimigos antigos
     for enemy in enemies:
@@ -1272,42 +1317,13 @@ def reset_game():
         enemies.add(enemy)
         all_sprites.add(enemy)
 
-# Inicializar posições iniciais das plataformas
-for platform in platforms:
-    platform.initial_x = platform.rect.x
-
-def update_world_positions():
-    # Atualizar posições dos sprites baseado no scroll
-    for sprite in all_sprites:
-        if isinstance(sprite, (Player, Enemy)):
-            # Atualizar posição na tela baseado na posição mundial
-            sprite.rect.x = sprite.world_x - camera_scroll
-        elif isinstance(sprite, Platform):
-            # Atualizar posição da plataforma mantendo sua posição mundial
-            sprite.rect.x = sprite.initial_x - camera_scroll
-        elif isinstance(sprite, Ground):
-            # O chão sempre segue a câmera
-            sprite.rect.x = -camera_scroll
-        elif isinstance(sprite, PowerUp):
-            # Power-ups seguem o scroll mantendo sua posição mundial
-            sprite.rect.centerx = sprite.initial_x - camera_scroll
-
-def sync_world_positions():
-    # Sincronizar posições mundiais com posições na tela
-    for sprite in all_sprites:
-        if isinstance(sprite, (Player, Enemy)):
-            # Atualizar posição na tela baseado na posição mundial
-            sprite.rect.x = sprite.world_x - camera_scroll
-        elif isinstance(sprite, Platform):
-            # Garantir que a plataforma mantenha sua posição relativa ao mundo
-            sprite.rect.x = sprite.initial_x - camera_scroll
-
 # Classe da Seta Indicativa
 class Arrow:
+    width = 40
+    height = 30
+    color = YELLOW
+    
     def __init__(self):
-        self.width = 40
-        self.height = 30
-        self.color = YELLOW
         self.pulse_speed = 0.05
         self.pulse_min = 0.7
         self.pulse_max = 1.0
@@ -1315,17 +1331,22 @@ class Arrow:
         self.pulse_growing = True
         self.visible = False
         
-        # Criar superfície da seta
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        # Imagem da seta (desenhada uma vez e guardada no atlas)
+        self.image = sprite_atlas.image("arrow", "default", Arrow.build_image)
+    
+    @classmethod
+    def build_image(cls):
+        image = pygame.Surface((cls.width, cls.height), pygame.SRCALPHA)
         points = [
-            (0, self.height//2),  # Ponta esquerda
-            (self.width*0.7, self.height//2),  # Corpo
-            (self.width*0.7, 0),  # Topo da ponta
-            (self.width, self.height//2),  # Ponta direita
-            (self.width*0.7, self.height),  # Base da ponta
-            (self.width*0.7, self.height//2)  # Volta ao corpo
+            (0, cls.height//2),  # Ponta esquerda
+            (cls.width*0.7, cls.height//2),  # Corpo
+            (cls.width*0.7, 0),  # Topo da ponta
+            (cls.width, cls.height//2),  # Ponta direita
+            (cls.width*0.7, cls.height),  # Base da ponta
+            (cls.width*0.7, cls.height//2)  # Volta ao corpo
         ]
-        pygame.draw.polygon(self.image, self.color, points)
+        pygame.draw.polygon(image, cls.color, points)
+        return image
     
     def update(self):
         # Efeito de pulsar
@@ -1349,15 +1370,49 @@ class Arrow:
             offset_x = (scaled_width - self.width) // 2
             offset_y = (scaled_height - self.height) // 2
             
-            surface.blit(scaled_image, (x - offset_x, y - offset_y))
-
-# Criar seta indicativa
-arrow = Arrow()
+            return surface.blit(scaled_image, (x - offset_x, y - offset_y))
+
+# Seta indicativa (criada por build_world)
+arrow = None
+
+# Simulação em passos fixos, independente da velocidade do desenho
+timestep = FixedTimestep(FRAME_MS, max_steps=5)
+MAX_FPS = 120  # Limite do desenho; a simulação continua a 60 passos por segundo
+
+def simulation_step(keys):
+    """
+    Avança o jogo um passo fixo (timestep.step_ms). Os contadores do jogo (cooldowns,
+    durações, gravidade) são por passo, então valem o mesmo em qualquer taxa de desenho
+    """
+    camera.begin_step()
+    player.update(keys, platforms, ground, enemies, timestep.step_ms)
+    
+    # Atualizar inimigos
+    for enemy in enemies:
+        enemy.update(player, ground, platforms, timestep.step_ms)
+    
+    # Verificar se a seção atual foi limpa
+    check_section_cleared()
+    
+    # Atualizar seta
+    arrow.update()
+    
+    # Remover inimigos mortos e adicionar pontos
+    for enemy in enemies:
+        if enemy.health <= 0:
+            player.score += enemy.points_value
+            enemy.kill()
+    
+    # Atualizar efeitos
+    effect_manager.update()
+    
+    # Atualizar spawner de inimigos
+    enemy_spawner.update(timestep.time_ms)
 
 def check_section_cleared():
     # Verificar se há inimigos vivos na seção atual
     section_width = WIDTH
-    current_section = int(camera_scroll / section_width)
+    current_section = int(camera.scroll / section_width)
     section_start = current_section * section_width
     section_end = section_start + section_width
     
@@ -1372,62 +1427,72 @@ def check_section_cleared():
 
 # Classe do PowerUp
 class PowerUp(pygame.sprite.Sprite):
+    width = 24  # Aumentado o tamanho
+    height = 24
+    # Aparência e valor de cada tipo: cor, cor do brilho, valor
+    TYPES = {
+        "vida": ((220, 40, 40), (255, 150, 150), 35),  # Vermelho para vida (valor de cura aumentado)
+        "mana": ((40, 40, 220), (150, 150, 255), 50)   # Azul para mana
+    }
+    
     def __init__(self, x, y, tipo):
         super().__init__()
         self.tipo = tipo
-        self.width = 24  # Aumentado o tamanho
-        self.height = 24
-        self.image = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.color, self.glow_color, self.valor = PowerUp.TYPES[tipo]
         
-        # Definir aparência baseada no tipo
-        if tipo == "vida":
-            self.color = (220, 40, 40)  # Vermelho para vida
-            self.glow_color = (255, 150, 150)  # Cor do brilho para vida
-            self.valor = 35  # Aumentado o valor de cura
-        else:  # tipo == "mana"
-            self.color = (40, 40, 220)  # Azul para mana
-            self.glow_color = (150, 150, 255)  # Cor do brilho para mana
-            self.valor = 50
+        # Imagem do power-up (desenhada uma vez por tipo e guardada no atlas)
+        self.image = sprite_atlas.image("powerup", tipo, lambda: PowerUp.build_image(tipo))
         
+        self.rect = self.image.get_rect(center=(x, y))
+        self.initial_y = y
+        self.float_offset = 0
+        self.float_speed = 0.08  # Velocidade reduzida para movimento mais suave
+        self.pulse_scale = 1.0
+        self.pulse_speed = 0.04
+        self.pulse_min = 0.85
+        self.pulse_max = 1.15
+        self.pulse_growing = True
+        
+    @classmethod
+    def build_images(cls):
+        # Empacotar no atlas as imagens de todos os tipos (os power-ups só aparecem durante o jogo)
+        return {tipo: sprite_atlas.image("powerup", tipo, lambda tipo=tipo: cls.build_image(tipo))
+                for tipo in cls.TYPES}
+
+    @classmethod
+    def build_image(cls, tipo):
+        width, height = cls.width, cls.height
+        color, glow_color, _ = cls.TYPES[tipo]
+        image = pygame.Surface((width, height), pygame.SRCALPHA)
         # Desenhar o power-up com efeito de brilho
         # Primeiro o brilho externo
-        pygame.draw.circle(self.image, self.glow_color, (self.width//2, self.height//2), self.width//2)
+        pygame.draw.circle(image, glow_color, (width//2, height//2), width//2)
         # Depois o círculo interno
-        pygame.draw.circle(self.image, self.color, (self.width//2, self.height//2), self.width//2 - 2)
+        pygame.draw.circle(image, color, (width//2, height//2), width//2 - 2)
         # Adicionar um símbolo baseado no tipo
         if tipo == "vida":
             # Desenhar um símbolo de "+" para vida
             cross_color = (255, 255, 255)
             thickness = 3
             # Linha vertical
-            pygame.draw.rect(self.image, cross_color, 
-                           (self.width//2 - thickness//2, self.height//4,
-                            thickness, self.height//2))
+            pygame.draw.rect(image, cross_color, 
+                           (width//2 - thickness//2, height//4,
+                            thickness, height//2))
             # Linha horizontal
-            pygame.draw.rect(self.image, cross_color,
-                           (self.width//4, self.height//2 - thickness//2,
-                            self.width//2, thickness))
+            pygame.draw.rect(image, cross_color,
+                           (width//4, height//2 - thickness//2,
+                            width//2, thickness))
         else:
             # Desenhar um símbolo de "M" para mana
-            pygame.draw.lines(self.image, (255, 255, 255), False, [
-                (self.width//4, self.height//4),  # Início do M
-                (self.width//3, self.height*3//4),  # Primeira perna
-                (self.width//2, self.height//4),  # Meio
-                (self.width*2//3, self.height*3//4),  # Segunda perna
-                (self.width*3//4, self.height//4)  # Fim do M
+            pygame.draw.lines(image, (255, 255, 255), False, [
+                (width//4, height//4),  # Início do M
+                (width//3, height*3//4),  # Primeira perna
+                (width//2, height//4),  # Meio
+                (width*2//3, height*3//4),  # Segunda perna
+                (width*3//4, height//4)  # Fim do M
             ], 2)
-        
-        self.rect = self.image.get_rect(center=(x, y))
-        self.initial_x = x
-        self.initial_y = y
-        self.float_offset = 0
-        self.float_speed = 0.08  # Velocidade reduzida para movimento mais suave
-        self.pulse_scale = 1.0
-        self.pulse_speed = 0.04
-        self.pulse_min = 0.85
-        self.pulse_max = 1.15
-        self.pulse_growing = True
-        
+        return image
+
     def update(self):
         # Efeito de flutuação suave
         self.float_offset = math.sin(pygame.time.get_ticks() * self.float_speed) * 6
@@ -1442,9 +1507,7 @@ class PowerUp(pygame.sprite.Sprite):
             self.pulse_scale -= self.pulse_speed
             if self.pulse_scale <= self.pulse_min:
                 self.pulse_growing = True
-        
-        # Atualizar posição x baseado no scroll
-        self.rect.centerx = self.initial_x - camera_scroll
+
 
     def draw(self, surface):
         # Criar uma cópia escalada da imagem para o efeito de pulsar
@@ -1459,6 +1522,57 @@ class PowerUp(pygame.sprite.Sprite):
 # Adicionar grupo de power-ups
 power_ups = pygame.sprite.Group()
 
+def draw_backdrop(surface):
+    # Cenário estático da câmera atual: background parallax e chão, desenhados no
+    # framebuffer interno (na escala de renderização) e ampliados uma vez para a superfície
+    target = framebuffer.target(surface)
+    background.draw(target, camera.render_scroll, framebuffer.scale)
+    ground.draw(target, camera.render_scroll, framebuffer.scale)
+    framebuffer.present(surface)
+
+def draw_world(surface, game_over=False):
+    """
+    Desenha o jogo (sem apresentar a tela): cenário, sprites, efeitos e HUD. Só o que está
+    dentro do viewport da câmera é desenhado, deslocado pelo scroll.
+    :param surface: Superfície da tela (a mesma do renderer)
+    :param game_over: Desenhar também o overlay de game over
+    """
+    # Background e chão formam o cenário: com a câmera parada, o renderer só restaura
+    # as áreas que mudaram em vez de redesenhá-lo
+    camera.begin_frame()
+    renderer.begin(camera.render_scroll, draw_backdrop)
+    
+    # Desenhar plataformas e outros sprites
+    tracking = renderer.tracking
+    renderer.add_many(camera.draw_sprites(surface, all_sprites, doreturn=tracking))
+    renderer.add_many(camera.draw_sprites(surface, attack_sprites, "attacks", tracking))
+    renderer.add_many(camera.draw_sprites(surface, magic_sprites, "magic", tracking))
+    # Desenhar escudo por último para ficar visível
+    renderer.add_many(camera.draw_sprites(surface, shield_sprites, "shield", tracking))
+    
+    # Desenhar escudo mágico do jogador
+    renderer.add(player.draw(surface, camera.sprite_offset(player)))
+    
+    # Desenhar efeitos (partículas e rastros também ficam em coordenadas do mundo)
+    effect_manager.draw(surface, camera.view, camera.offset)
+    camera.count("effects", effect_manager.last_drawn, effect_manager.last_culled)
+    renderer.add(effect_manager.last_bounds)
+    
+    # Desenhar barras de vida (a do jogador é HUD e sempre aparece)
+    renderer.add(player.draw_health_bar(surface))
+    for enemy in camera.visible(enemies.sprites(), "health_bars"):
+        renderer.add(enemy.draw_health_bar(surface, camera.sprite_offset(enemy)))
+    
+    # Desenhar seta indicativa
+    if arrow.visible:
+        arrow_x = WIDTH - 100  # Posição da seta próxima à borda direita
+        arrow_y = HEIGHT // 2  # Centralizada verticalmente
+        renderer.add(arrow.draw(surface, arrow_x, arrow_y))
+    
+    # Desenhar tela de game over se necessário
+    if game_over:
+        game_over_screen.draw(surface)
+
 def main():
     # Inicializar estado do jogo
     global current_state
@@ -1470,11 +1584,20 @@ def main():
     clock = pygame.time.Clock()
     
     while running:
-        # Controle de FPS
-        clock.tick(60)
+        # Tempo real desde o último frame em milissegundos (o desenho é limitado a MAX_FPS)
+        dt = clock.tick(MAX_FPS)
+        # Informar ao orçamento de partículas o tempo real gasto no último frame
+        effect_manager.record_frame_time(clock.get_rawtime())
+        # No modo automático a resolução do cenário acompanha o tempo de frame do jogo
+        if current_state == PLAYING and framebuffer.record_frame_time(clock.get_rawtime()):
+            renderer.invalidate()
+        
+        # Converter os assets que terminaram de decodificar em segundo plano (e montar o atlas, se preciso)
+        assets_ready = poll_assets()
         
         # Eventos
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
                 
@@ -1482,7 +1605,8 @@ def main():
             if current_state == MENU:
                 action = main_menu.handle_input(event)
                 if action == 'iniciar':
-                    current_state = PLAYING
+                    # Sem os assets prontos, esperar na tela de carregamento
+                    current_state = PLAYING if world_built else LOADING
                 elif action == 'opcoes':
                     current_state = OPTIONS
                 elif action == 'creditos':
@@ -1494,7 +1618,9 @@ def main():
                     
             elif current_state == OPTIONS:
                 action = options_menu.handle_input(event)
-                if action == 'voltar':
+                if action == 'resolucao':
+                    framebuffer.set_mode(options_menu.next_render_scale())
+                elif action == 'voltar':
                     current_state = MENU
                     
             elif current_state == CREDITS:
@@ -1523,17 +1649,37 @@ def main():
         
         # Atualizar baseado no estado atual
         if current_state == MENU:
+            # Menu animado: sempre a tela inteira
+            renderer.invalidate()
             main_menu.update()
             main_menu.draw(screen)
+            if not assets_ready:
+                loading_screen.draw_bar(screen, asset_manager.progress)
             
+        elif current_state == LOADING:
+            renderer.invalidate()
+            loading_screen.draw(screen, asset_manager.progress)
+            if assets_ready:
+                build_world()
+                current_state = PLAYING
+            
+        # Telas paradas: enviadas inteiras quando algum evento pode tê-las mudado; entre
+        # eventos, só o brilho do botão em hover (que pulsa a cada desenho) é enviado
         elif current_state == OPTIONS:
-            options_menu.draw(screen)
+            if renderer.begin_static(OPTIONS, bool(events), options_menu.animated_rects()):
+                options_menu.draw(screen)
             
         elif current_state == CREDITS:
-            credits_menu.draw(screen)
+            if renderer.begin_static(CREDITS, bool(events), credits_menu.animated_rects()):
+                credits_menu.draw(screen)
             
         elif current_state == CONTROLS:
-            draw_controls_screen(screen)
+            if renderer.begin_static(CONTROLS, bool(events)):
+                draw_controls_screen(screen)
+            
+        elif current_state == GAME_OVER:
+            # O último frame do jogo (com o overlay) continua na tela
+            renderer.begin_static(GAME_OVER)
             
         elif current_state == PLAYING:
             # Verificar se o jogador morreu
@@ -1541,86 +1687,25 @@ def main():
                 current_state = GAME_OVER
                 game_over = True
             
-            # Input e atualização apenas se não estiver em game over
+            # Input e atualização apenas se não estiver em game over: o tempo do frame
+            # vira passos fixos da simulação (no máximo timestep.max_steps por frame)
             if not game_over:
-                # Input
                 keys = pygame.key.get_pressed()
-                
-                # Atualizar
-                player.update(keys, platforms, ground, enemies)
-                
-                # Atualizar inimigos
-                for enemy in enemies:
-                    enemy.update(player, ground, platforms)
-                
-                # Sincronizar posições do mundo
-                sync_world_positions()
-                
-                # Atualizar posições do mundo baseado no scroll
-                update_world_positions()
-                
-                # Atualizar plataformas
-                for platform in platforms:
-                    platform.update()
-                
-                # Verificar se a seção atual foi limpa
-                check_section_cleared()
-                
-                # Atualizar seta
-                arrow.update()
-                
-                # Remover inimigos mortos e adicionar pontos
-                for enemy in enemies:
-                    if enemy.health <= 0:
-                        player.score += enemy.points_value
-                        enemy.kill()
-                
-                # Atualizar efeitos
-                effect_manager.update()
-                
-                # Atualizar power-ups
-                for power_up in power_ups:
-                    power_up.draw(screen)
-                
-                # Atualizar spawner de inimigos
-                enemy_spawner.update()
-            
-            # Desenhar
-            screen.blit(background, (0, 0))
-            
-            # Desenhar chão
-            ground.draw(screen)
+                for _ in range(timestep.advance(dt)):
+                    simulation_step(keys)
             
-            # Desenhar plataformas com seus efeitos
-            for platform in platforms:
-                platform.draw(screen)
+            # Desenhar entre o passo anterior e o atual
+            camera.interpolate(timestep.alpha)
             
-            # Desenhar outros sprites
-            all_sprites.draw(screen)
-            attack_sprites.draw(screen)
-            magic_sprites.draw(screen)
-            shield_sprites.draw(screen)  # Desenhar escudo por último para ficar visível
-            
-            # Desenhar efeitos
-            effect_manager.draw(screen)
-            
-            # Desenhar barras de vida
-            player.draw_health_bar(screen)
-            for enemy in enemies:
-                enemy.draw_health_bar(screen)
-            
-            # Desenhar seta indicativa
-            if arrow.visible:
-                arrow_x = WIDTH - 100  # Posição da seta próxima à borda direita
-                arrow_y = HEIGHT // 2  # Centralizada verticalmente
-                arrow.draw(screen, arrow_x, arrow_y)
-            
-            # Desenhar tela de game over se necessário
+            # O overlay de game over cobre a tela inteira
             if game_over:
-                game_over_screen.draw(screen)
+                renderer.invalidate()
+            
+            # Desenhar cenário, sprites, efeitos e HUD
+            draw_world(screen, game_over)
         
-        # Atualizar tela
-        pygame.display.flip()
+        # Atualizar tela (inteira, ou só as áreas alteradas no modo dirty rects)
+        renderer.present()
     
     # Encerrar Pygame
     pygame.quit()
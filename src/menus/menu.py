@@ -1,6 +1,7 @@
 import pygame
 import random
 import time
+from src.utils.renderer import RENDER_SCALES
 
 class Button:
     def __init__(self, x, y, width, height, text):
@@ -27,6 +28,10 @@ class Button:
             if event.button == 1 and self.rect.collidepoint(event.pos):
                 return True
         return False
+    
+    def animated_rect(self):
+        # Área do brilho pulsante, que muda a cada draw enquanto o mouse está em cima
+        return self.rect.inflate(10, 10) if self.is_hovered else None
         
     def draw(self, surface):
         # Criar superfície para o botão com suporte a transparência
@@ -137,6 +142,40 @@ class Tutorial:
         
         return True  # Tutorial ainda visível
 
+class LoadingScreen:
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.font = pygame.font.SysFont("Arial", 24)
+        self.text_color = (220, 220, 220)
+        self.bar_color = (200, 40, 40)
+        self.bar_background = (40, 40, 40)
+        
+        # Criar background com gradiente (mesmo estilo dos menus)
+        self.background = pygame.Surface((width, height))
+        for y in range(height):
+            color_value = int(30 + (y / height) * 25)
+            pygame.draw.line(self.background, (color_value, color_value, color_value + 10), 
+                           (0, y), (width, y))
+        
+        self.text = self.font.render("Carregando...", True, self.text_color)
+        self.text_rect = self.text.get_rect(center=(width//2, height//2 - 30))
+    
+    def draw_bar(self, surface, progress, rect=None):
+        # Barra de progresso (usada também sobre o menu enquanto os assets carregam)
+        if rect is None:
+            rect = pygame.Rect(self.width//4, self.height - 30, self.width//2, 8)
+        pygame.draw.rect(surface, self.bar_background, rect, border_radius=rect.height//2)
+        progress_width = int(rect.width * max(0.0, min(1.0, progress)))
+        if progress_width > 0:
+            pygame.draw.rect(surface, self.bar_color, (rect.x, rect.y, progress_width, rect.height),
+                           border_radius=rect.height//2)
+    
+    def draw(self, surface, progress):
+        surface.blit(self.background, (0, 0))
+        surface.blit(self.text, self.text_rect)
+        self.draw_bar(surface, progress, pygame.Rect(self.width//4, self.height//2, self.width//2, 20))
+
 class Menu:
     def __init__(self, width, height):
         self.width = width
@@ -341,9 +380,14 @@ class OptionsMenu:
         self.buttons = {
             'som': Button(button_x, start_y, button_width, button_height, "Som: Ligado"),
             'dificuldade': Button(button_x, start_y + spacing + button_height, button_width, button_height, "Dificuldade: Normal"),
-            'voltar': Button(button_x, start_y + (spacing + button_height) * 2, button_width, button_height, "Voltar")
+            'resolucao': Button(button_x, start_y + (spacing + button_height) * 2, button_width, button_height, "Resolução: 100%"),
+            'voltar': Button(button_x, start_y + (spacing + button_height) * 3, button_width, button_height, "Voltar")
         }
         
+        # Modos da resolução interna do cenário: automático ou fração fixa da janela
+        self.render_scale_modes = ["auto"] + list(RENDER_SCALES)
+        self.render_scale_index = self.render_scale_modes.index(1.0)
+        
         # Partículas de fundo
         self.particles = []
         for _ in range(20):  # Menos partículas
@@ -362,6 +406,25 @@ class OptionsMenu:
                 return button_name
         return None
     
+    def animated_rects(self):
+        # Áreas que mudam mesmo sem eventos (brilho do botão em hover)
+        return [button.animated_rect() for button in self.buttons.values() if button.is_hovered]
+    
+    def set_render_scale(self, mode):
+        """
+        Atualiza o botão de resolução interna
+        :param mode: "auto" ou fração da resolução da janela
+        """
+        self.render_scale_index = self.render_scale_modes.index(mode)
+        label = "Auto" if mode == "auto" else f"{int(mode * 100)}%"
+        self.buttons['resolucao'].text = f"Resolução: {label}"
+    
+    def next_render_scale(self):
+        # Avança para o próximo modo da lista (voltando ao primeiro no fim)
+        mode = self.render_scale_modes[(self.render_scale_index + 1) % len(self.render_scale_modes)]
+        self.set_render_scale(mode)
+        return mode
+    
     def update(self):
         # Atualizar partículas
         for particle in self.particles:
@@ -483,6 +546,10 @@ class CreditsMenu:
             return 'voltar'
         return None
     
+    def animated_rects(self):
+        # Áreas que mudam mesmo sem eventos (brilho do botão em hover)
+        return [self.button.animated_rect()] if self.button.is_hovered else []
+    
     def update(self):
         # Atualizar scroll com limite
         self.scroll_offset -= self.scroll_speed
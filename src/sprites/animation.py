@@ -0,0 +1,67 @@
+"""
+Reprodução de animações baseada em tempo, compartilhada por Player e Enemy
+"""
+
+# Intervalo de um frame a 60 FPS, usado quando o chamador não informa o tempo decorrido
+FRAME_MS = 1000 / 60
+
+def compile_animation_timings(sprite_config):
+    """
+    Pré-compila as durações das animações de uma configuração de sprite
+    :param sprite_config: Configuração com a seção "animations" (ex.: PLAYER_SPRITE)
+    :return: Dicionário {estado: (duração do frame em ms, número de frames)}
+    """
+    return {
+        state: (float(config["duration"]), config["frames"])
+        for state, config in sprite_config["animations"].items()
+    }
+
+class AnimationPlayer:
+    """
+    Avança a animação pelo tempo decorrido em milissegundos, independente do FPS
+    :param frames: AnimationFrames com as variantes para cada lado
+    :param timings: Tabela de compile_animation_timings
+    :param state: Estado inicial
+    """
+    def __init__(self, frames, timings, state="idle"):
+        self.frames = frames
+        # Usar o número de frames realmente carregados (o fallback tem apenas um)
+        self.timings = {
+            state_name: (duration, len(frames[state_name]))
+            for state_name, (duration, _) in timings.items()
+            if state_name in frames
+        }
+        self.state = state
+        self.frame_index = 0
+        self.elapsed = 0.0
+        self.frame_duration, self.frame_count = self.timings[state]
+
+    def set_state(self, state):
+        """
+        Troca o estado atual; trocar de estado sempre recomeça a animação do primeiro frame
+        :return: True se o estado mudou
+        """
+        if state == self.state:
+            return False
+        self.state = state
+        self.frame_index = 0
+        self.elapsed = 0.0
+        self.frame_duration, self.frame_count = self.timings[state]
+        return True
+
+    def update(self, dt_ms):
+        """
+        Avança a animação
+        :param dt_ms: Tempo decorrido desde a última atualização em milissegundos
+        :return: True se o frame mudou
+        """
+        self.elapsed += dt_ms
+        if self.elapsed < self.frame_duration:
+            return False
+        steps = int(self.elapsed // self.frame_duration)
+        self.elapsed -= steps * self.frame_duration
+        self.frame_index = (self.frame_index + steps) % self.frame_count
+        return True
+
+    def image(self, facing_right=True):
+        return self.frames.get(self.state, facing_right)[self.frame_index]
@@ -0,0 +1,295 @@
+import os
+import sys
+import struct
+import hashlib
+import pygame
+from src.sprites.sprite_manager import AnimationFrames
+from src.utils.asset_cache import write_raw, read_raw
+from src.utils.asset_pack import open_resource
+
+# Manifesto binário do atlas:
+#   cabeçalho: assinatura, versão, digest das fontes, nº de páginas, de nomes e de entradas
+#   páginas:   largura e altura de cada página (pixels em atlas_<n>.raw)
+#   nomes:     tabela de strings (tamanho + utf-8) usada pelos campos asset e estado
+#   entradas:  (asset, estado, frame, flip) -> (página, x, y, largura, altura)
+MANIFEST_MAGIC = b"SLAT"
+MANIFEST_VERSION = 1
+MANIFEST_HEADER = struct.Struct("<4sH16sHHI")
+MANIFEST_PAGE = struct.Struct("<HH")
+MANIFEST_ENTRY = struct.Struct("<HHHBBHHHH")
+MANIFEST_FILE = "atlas.bin"
+
+class TextureAtlas:
+    """
+    Empacota os frames do jogo em poucas páginas grandes (empacotamento em prateleiras).
+    Cada frame vira uma subsurface da sua página, então desenhar um frame é blitar um
+    recorte do atlas. O conteúdo pode ser salvo com um manifesto binário e recarregado
+    sem abrir os sprite sheets de origem.
+    :param page_size: Largura e altura de cada página
+    :param padding: Espaço entre frames (evita vazamento de pixels vizinhos ao escalar)
+    """
+    def __init__(self, page_size=2048, padding=1, digest=""):
+        self.page_size = page_size
+        self.padding = padding
+        self.digest = digest
+        self.pages = []
+        self.entries = {}   # (asset, estado, frame, flip) -> (página, Rect)
+        self.assets = set() # Assets com frames no atlas (has() sem percorrer as entradas)
+        self.views = {}     # (asset, estado, frame, flip) -> subsurface da página
+        self.cursor = None  # (x, y, altura da prateleira) na última página
+        self.dirty = False
+        self.loaded = False
+
+    @staticmethod
+    def hash_sources(paths, *configs):
+        """
+        Digest que identifica o conteúdo do atlas: arquivos de origem e configurações
+        :param paths: Caminhos dos sprite sheets usados pelo atlas
+        """
+        digest = hashlib.sha1(repr(configs).encode("utf-8"))
+        for path in paths:
+            try:
+                with open_resource(path) as f:
+                    digest.update(hashlib.sha1(f.read()).digest())
+            except OSError:
+                digest.update(b"missing:" + path.encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def new_page(self):
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        self.pages.append(page)
+        self.cursor = (0, 0, 0)
+        return page
+
+    def allocate(self, width, height):
+        # Próxima posição livre: mesma prateleira, nova prateleira ou nova página
+        if width > self.page_size or height > self.page_size:
+            raise ValueError(f"Frame {width}x{height} maior que a página do atlas")
+        if not self.pages:
+            self.new_page()
+        x, y, shelf_height = self.cursor
+        if x + width > self.page_size:
+            x, y, shelf_height = 0, y + shelf_height + self.padding, 0
+        if y + height > self.page_size:
+            self.new_page()
+            x, y, shelf_height = 0, 0, 0
+        self.cursor = (x + width + self.padding, y, max(shelf_height, height))
+        return len(self.pages) - 1, pygame.Rect(x, y, width, height)
+
+    def add(self, key, surface):
+        """
+        Copia a superfície para o atlas
+        :param key: (asset, estado, frame, flip)
+        :return: Subsurface do atlas com o frame
+        """
+        page_index, rect = self.allocate(*surface.get_size())
+        page = self.pages[page_index]
+        if not surface.get_flags() & pygame.SRCALPHA:
+            # Cópia com canal alpha sem convert_alpha(), que exige o display: o atlas pode
+            # ser montado fora da thread principal (colorkey vira alpha zero, como no convert)
+            with_alpha = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+            with_alpha.blit(surface, (0, 0))
+            surface = with_alpha
+        # Somar sobre a área zerada copia os pixels exatamente (inclusive o alpha)
+        page.blit(surface, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.entries[key] = (page_index, rect)
+        self.assets.add(key[0])
+        self.dirty = True
+        return self.view(key)
+
+    def view(self, key):
+        view = self.views.get(key)
+        if view is None:
+            page_index, rect = self.entries[key]
+            view = self.pages[page_index].subsurface(rect)
+            self.views[key] = view
+        return view
+
+    def frame(self, asset, state, index=0, flip=False):
+        return self.view((asset, state, index, int(flip)))
+
+    def has(self, asset):
+        return asset in self.assets
+
+    def animations(self, asset, builder):
+        """
+        Animações do asset servidas a partir do atlas; na primeira vez chama o builder
+        e empacota os frames (virados para a direita e para a esquerda)
+        :param builder: Função sem argumentos que retorna um AnimationFrames
+        :return: AnimationFrames cujos frames são recortes do atlas
+        """
+        if self.has(asset):
+            right, left = {}, {}
+            for (key_asset, state, index, flip) in self.entries:
+                if key_asset == asset:
+                    side = left if flip else right
+                    side.setdefault(state, []).append(self.frame(asset, state, index, flip))
+            return AnimationFrames.from_sides(right, left)
+
+        animations = builder()
+        packed = {}  # Frames repetidos (ex.: fallback) ocupam um único lugar
+        right, left = {}, {}
+        for flip, side, source in ((0, right, animations.right), (1, left, animations.left)):
+            for state, frames in source.items():
+                side[state] = []
+                for index, frame in enumerate(frames):
+                    key = (asset, state, index, flip)
+                    if id(frame) in packed:
+                        self.entries[key] = self.entries[packed[id(frame)]]
+                    else:
+                        self.add(key, frame)
+                        packed[id(frame)] = key
+                    side[state].append(self.view(key))
+        return AnimationFrames.from_sides(right, left)
+
+    def image(self, asset, state, builder):
+        """
+        Imagem avulsa (tile, power-up, seta) servida a partir do atlas
+        :param builder: Função sem argumentos que desenha a imagem na primeira vez
+        """
+        key = (asset, state, 0, 0)
+        if key not in self.entries:
+            return self.add(key, builder())
+        return self.view(key)
+
+    def trim(self):
+        """
+        Reduz a última página à altura das prateleiras ocupadas, liberando a área vazia.
+        Deve ser chamado depois de empacotar tudo e antes de entregar os frames: recortes
+        já entregues continuam apontando para a página antiga.
+        Frames empacotados depois disso vão para uma página nova.
+        """
+        if not self.pages or self.cursor is None or self.cursor[1] >= self.page_size:
+            return
+        page = self.pages[-1]
+        used_height = min(page.get_height(), self.cursor[1] + self.cursor[2])
+        if used_height < page.get_height():
+            self.pages[-1] = page.subsurface((0, 0, page.get_width(), used_height)).copy()
+            last_page = len(self.pages) - 1
+            self.views = {key: view for key, view in self.views.items() if self.entries[key][0] != last_page}
+        self.cursor = (self.page_size, self.page_size, 0)
+
+    def convert_pages(self):
+        # Converter as páginas para o formato da tela (exige o display; thread principal)
+        self.pages = [page.convert_alpha() for page in self.pages]
+        self.views.clear()
+
+    def memory_bytes(self):
+        return sum(page.get_width() * page.get_height() * page.get_bytesize() for page in self.pages)
+
+    def used_bytes(self):
+        # Área efetivamente ocupada por frames (entradas repetidas contam uma vez)
+        rects = {(page, tuple(rect)) for page, rect in self.entries.values()}
+        return sum(rect[2] * rect[3] * 4 for _, rect in rects)
+
+    def stats(self):
+        return {
+            'pages': len(self.pages),
+            'entries': len(self.entries),
+            'assets': len({key[0] for key in self.entries}),
+            'memory_bytes': self.memory_bytes(),
+            'used_bytes': self.used_bytes()
+        }
+
+    def save(self, directory):
+        """
+        Grava as páginas (buffers crus) e o manifesto binário
+        :param directory: Pasta do atlas
+        """
+        names = {}
+        def name_id(name):
+            return names.setdefault(name, len(names))
+
+        entries = bytearray()
+        for (asset, state, index, flip), (page_index, rect) in self.entries.items():
+            entries += MANIFEST_ENTRY.pack(name_id(asset), name_id(str(state)), index, flip,
+                                           page_index, rect.x, rect.y, rect.width, rect.height)
+
+        # A última página é gravada só até a última prateleira ocupada
+        pages = list(self.pages)
+        if pages and self.cursor is not None and self.cursor[1] < self.page_size:
+            used_height = min(self.page_size, self.cursor[1] + self.cursor[2])
+            pages[-1] = pages[-1].subsurface((0, 0, pages[-1].get_width(), used_height))
+
+        manifest = bytearray(MANIFEST_HEADER.pack(MANIFEST_MAGIC, MANIFEST_VERSION,
+                                                  self.digest.encode("ascii").ljust(16, b"\0"),
+                                                  len(self.pages), len(names), len(self.entries)))
+        for page in pages:
+            manifest += MANIFEST_PAGE.pack(*page.get_size())
+        for name in names:
+            encoded = name.encode("utf-8")
+            manifest += struct.pack("<B", len(encoded)) + encoded
+        manifest += entries
+
+        os.makedirs(directory, exist_ok=True)
+        for page_index, page in enumerate(pages):
+            write_raw(os.path.join(directory, f"atlas_{page_index}.raw"), page, "RGBA")
+        with open(os.path.join(directory, MANIFEST_FILE), "wb") as f:
+            f.write(manifest)
+        self.dirty = False
+
+    @classmethod
+    def load(cls, directory, digest="", convert=True):
+        """
+        Carrega um atlas salvo por save()
+        :param digest: Digest esperado das fontes; um atlas com digest diferente é ignorado
+        :param convert: Converter as páginas para o formato da tela; fora da thread principal
+                        passe False e chame convert_pages() depois
+        :return: TextureAtlas, ou None se não existe, está desatualizado ou corrompido
+        """
+        manifest_path = os.path.join(directory, MANIFEST_FILE)
+        if not os.path.exists(manifest_path):
+            return None
+        try:
+            with open(manifest_path, "rb") as f:
+                data = f.read()
+            magic, version, stored_digest, page_count, name_count, entry_count = MANIFEST_HEADER.unpack_from(data)
+            if magic != MANIFEST_MAGIC or version != MANIFEST_VERSION:
+                return None
+            if stored_digest.rstrip(b"\0").decode("ascii") != digest:
+                return None
+
+            offset = MANIFEST_HEADER.size
+            sizes = []
+            for _ in range(page_count):
+                sizes.append(MANIFEST_PAGE.unpack_from(data, offset))
+                offset += MANIFEST_PAGE.size
+            names = []
+            for _ in range(name_count):
+                length = data[offset]
+                names.append(data[offset + 1:offset + 1 + length].decode("utf-8"))
+                offset += 1 + length
+
+            atlas = cls(digest=digest)
+            for page_index, size in enumerate(sizes):
+                page = read_raw(os.path.join(directory, f"atlas_{page_index}.raw"), "RGBA")
+                if page is None or page.get_size() != size:
+                    return None
+                atlas.pages.append(page.convert_alpha() if convert else page)
+            for _ in range(entry_count):
+                asset, state, index, flip, page_index, x, y, w, h = MANIFEST_ENTRY.unpack_from(data, offset)
+                offset += MANIFEST_ENTRY.size
+                atlas.entries[(names[asset], names[state], index, flip)] = (page_index, pygame.Rect(x, y, w, h))
+                atlas.assets.add(names[asset])
+        except (OSError, struct.error, IndexError, UnicodeDecodeError, ValueError) as e:
+            print(f"Atlas de texturas inválido em {directory}: {e}")
+            return None
+
+        # Novos frames empacotados depois do carregamento vão para uma página nova
+        atlas.cursor = (atlas.page_size, atlas.page_size, 0)
+        atlas.loaded = True
+        return atlas
+
+def main():
+    # Gerar o atlas de sprites antecipadamente (python -m src.sprites.atlas)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from src.game import main as game
+    game.asset_manager.wait()
+    game.build_world()
+    game.save_sprite_atlas()
+    print(f"Atlas: {game.sprite_atlas.stats()} em {game.ATLAS_DIR}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -70,15 +70,58 @@ PLAYER_SPRITE = {
             "color": (128, 0, 255),    # Roxo para ataque corpo a corpo
             "alpha": 200,              # Transparência mais alta
             "particles": True,         # Efeito de partículas
+            "particle_count": 3,       # Partículas por ponto do arco
+            "particle_size": 3,
+            "particle_speed": 2,
             "trail_length": 5,         # Rastro mais longo
-            "glow": True              # Efeito de brilho
+            "glow": True,             # Efeito de brilho
+            "impact": {                # Explosão no ponto de impacto
+                "alpha": 230,
+                "particle_count": 12,
+                "particle_size": 5,
+                "particle_speed": 6
+            }
         },
         "magic": {
             "color": (255, 255, 100),  # Amarelo brilhante para magia
             "alpha": 180,              # Transparência
             "particles": True,         # Efeito de partículas
+            "particle_alpha": 200,     # Partículas da espiral mais opacas que o efeito
+            "particle_count": 2,       # Partículas por ponto da espiral
+            "particle_size": 4,
+            "particle_speed": 3,
             "trail_length": 3,         # Rastro mais curto
-            "glow": False             # Sem efeito de brilho
+            "glow": False,            # Sem efeito de brilho
+            "impact": {                # Círculo interno da explosão mágica
+                "alpha": 230,
+                "particle_count": 15,
+                "particle_size": 6,
+                "particle_speed": 7
+            },
+            "impact_glow": {           # Círculo externo com cor mais clara
+                "color": (255, 255, 150),
+                "alpha": 180,
+                "particle_count": 10,
+                "particle_size": 4,
+                "particle_speed": 5
+            }
+        },
+        "shield": {
+            "color": (150, 200, 255),  # Azul claro para o escudo mágico
+            "alpha": 150,
+            "particle_count": 2,       # Partículas de proteção ao redor do escudo
+            "particle_size": 3,
+            "particle_speed": 1.5,
+            "activate": {              # Explosão ao ativar o escudo
+                "alpha": 180,
+                "particle_count": 20,
+                "particle_speed": (2, 4)
+            },
+            "hit": {                   # Dano absorvido pelo escudo
+                "particle_count": 8,
+                "particle_size": 2,
+                "particle_speed": 2
+            }
         }
     }
 }
@@ -157,6 +200,7 @@ ENEMY_SPRITE = {
     "effects": {
         "attack": {
             "color": (255, 50, 50),
+            "particle_color": (220, 40, 40),  # Partículas de dano no jogador (vermelho mais escuro que o efeito)
             "alpha": 160,
             "size": [60, 40],
             "particles": True,
@@ -1,4 +1,5 @@
 import pygame
+from src.utils.asset_pack import load_image
 
 class SpriteSheet:
     def __init__(self, filename):
@@ -7,34 +8,63 @@ class SpriteSheet:
         :param filename: Caminho para a imagem do sprite sheet
         """
         try:
-            self.sheet = pygame.image.load(filename).convert_alpha()
+            self.sheet = load_image(filename).convert_alpha()
         except pygame.error as e:
             print(f"Não foi possível carregar o sprite sheet: {filename}")
             print(f"Erro: {e}")
             # Criar uma superfície vazia como fallback
             self.sheet = pygame.Surface((32, 32))
             self.sheet.fill((255, 0, 0))
+        self.images = {}  # (rect, escala, colorkey) -> imagem já recortada/escalada
+
+    @classmethod
+    def from_surface(cls, surface):
+        """
+        Cria o sprite sheet a partir de uma superfície já carregada (ex.: pelo AssetManager)
+        :param surface: Superfície do sprite sheet
+        """
+        if surface is None:
+            raise pygame.error("Sprite sheet não carregado")
+        sprite_sheet = cls.__new__(cls)
+        sprite_sheet.sheet = surface
+        sprite_sheet.images = {}
+        return sprite_sheet
 
     def get_image(self, x, y, width, height, scale=1, colorkey=None):
+        """
+        Retorna a imagem da região do sprite sheet.
+        Sem escala nem colorkey é uma subsurface (view sem cópia dos pixels); com escala
+        ou colorkey o resultado é calculado uma vez e memorizado por (região, escala, colorkey).
+        A imagem é compartilhada: quem precisar modificá-la deve usar materialize().
+        """
+        rect = (x, y, width, height)
+        key = (rect, scale, colorkey)
+        image = self.images.get(key)
+        if image is not None:
+            return image
         try:
-            # Criar uma nova superfície com o tamanho especificado
-            image = pygame.Surface((width, height), pygame.SRCALPHA)
-            
-            # Copiar a parte específica do sprite sheet
-            image.blit(self.sheet, (0, 0), (x, y, width, height))
+            if self.sheet.get_rect().contains(rect):
+                image = self.sheet.subsurface(rect)
+            else:
+                # Região saindo do sheet: copiar só a parte que existe (como um blit recortado)
+                image = pygame.Surface((width, height), pygame.SRCALPHA)
+                image.blit(self.sheet, (0, 0), rect)
             
-            # Escalar a imagem se necessário
+            # Escalar a imagem se necessário (direto da view, sem cópia intermediária)
             if scale != 1:
                 new_width = int(width * scale)
                 new_height = int(height * scale)
                 image = pygame.transform.scale(image, (new_width, new_height))
             
-            # Definir colorkey se especificado
+            # Definir colorkey se especificado (em uma cópia, para não afetar o sheet)
             if colorkey is not None:
+                if image.get_parent() is not None:
+                    image = image.copy()
                 if colorkey == -1:
                     colorkey = image.get_at((0, 0))
                 image.set_colorkey(colorkey)
             
+            self.images[key] = image
             return image
         except Exception as e:
             print(f"Erro ao obter imagem do sprite sheet: {e}")
@@ -43,6 +73,13 @@ class SpriteSheet:
             fallback.fill((255, 0, 0))
             return fallback
 
+    def materialize(self, x, y, width, height, scale=1, colorkey=None):
+        """
+        Cópia independente da imagem da região, para quem precisa desenhar sobre ela
+        :return: Nova superfície que não compartilha pixels com o sprite sheet
+        """
+        return self.get_image(x, y, width, height, scale, colorkey).copy()
+
     def get_animation_frames(self, row, num_frames, frame_width, frame_height, scale=1):
         """
         Obtém uma sequência de frames para animação
@@ -58,4 +95,140 @@ class SpriteSheet:
             x = frame * frame_width
             y = row * frame_height
             frames.append(self.get_image(x, y, frame_width, frame_height, scale))
-        return frames 
\ No newline at end of file
+        return frames 
+
+class AnimationFrames:
+    """
+    Frames de animação com as variantes virada para a direita e para a esquerda
+    pré-calculadas no carregamento, para que trocar de frame seja só uma consulta de lista.
+    :param animations: Dicionário {estado: [frames virados para a direita]}
+    """
+    def __init__(self, animations):
+        self.right = animations
+        # Frames repetidos (ex.: fallback) são virados uma única vez
+        flipped = {}
+        self.left = {}
+        for state, frames in animations.items():
+            left_frames = []
+            for frame in frames:
+                if id(frame) not in flipped:
+                    flipped[id(frame)] = pygame.transform.flip(frame, True, False)
+                left_frames.append(flipped[id(frame)])
+            self.left[state] = left_frames
+
+    @classmethod
+    def from_sides(cls, right, left):
+        """
+        Cria a partir de frames dos dois lados já prontos (ex.: recortes de um atlas)
+        :param right: Dicionário {estado: [frames virados para a direita]}
+        :param left: Dicionário {estado: [frames virados para a esquerda]}
+        """
+        animations = cls.__new__(cls)
+        animations.right = right
+        animations.left = left
+        return animations
+
+    def get(self, state, facing_right=True):
+        return self.right[state] if facing_right else self.left[state]
+
+    def __getitem__(self, state):
+        return self.right[state]
+
+    def __contains__(self, state):
+        return state in self.right
+
+    def keys(self):
+        return self.right.keys()
+
+    def all_frames(self):
+        for frames in self.right.values():
+            yield from frames
+        for frames in self.left.values():
+            yield from frames
+
+class AnimationBank:
+    """
+    Banco de animações compartilhado pelo processo (flyweight).
+    Cada conjunto de animações é carregado e escalado uma única vez e as mesmas
+    listas de frames são entregues a todas as instâncias que pedirem a mesma chave.
+    """
+    def __init__(self):
+        self.sets = {}
+        self.builds = 0        # Quantas vezes um conjunto precisou ser montado
+        self.requests = 0      # Quantas vezes um conjunto foi pedido
+        self.sheet_requests = 0  # Quantos sprite sheets foram pedidos (ao disco ou ao loader)
+        self.sheet_loads = 0   # Quantos arquivos de sprite sheet o banco leu ele mesmo do disco
+
+    def get(self, key, builder):
+        """
+        Retorna o conjunto de animações da chave, montando-o na primeira vez
+        :param key: Identificador do conjunto (ex.: ("enemy", escala))
+        :param builder: Função sem argumentos que monta o AnimationFrames do conjunto
+        :return: AnimationFrames compartilhado (não deve ser modificado)
+        """
+        self.requests += 1
+        animations = self.sets.get(key)
+        if animations is None:
+            animations = builder()
+            self.sets[key] = animations
+            self.builds += 1
+        return animations
+
+    def load_sheet(self, filename, loader=None):
+        """
+        :param filename: Caminho do arquivo, ou chave do asset quando loader é informado
+        :param loader: Função opcional que retorna a superfície já carregada (ex.: AssetManager.get)
+        """
+        self.sheet_requests += 1
+        if loader is not None:
+            # O loader decide de onde vem a superfície (cache em memória, cache cozido ou disco)
+            sheet = loader(filename)
+            if sheet is None:
+                raise pygame.error(f"Sprite sheet não carregado: {filename}")
+            return sheet
+        self.sheet_loads += 1
+        return load_image(filename).convert_alpha()
+
+    def frame_bytes(self):
+        """
+        Memória dos frames únicos do banco, separada entre pixels próprios e recortes
+        (subsurfaces) de outra superfície, como as páginas do atlas, cujos pixels
+        pertencem à superfície-mãe e já são contados por ela (TextureAtlas.stats)
+        :return: (bytes próprios, bytes em recortes)
+        """
+        # Frames repetidos (ex.: fallback usado em vários estados) contam uma vez
+        seen = {}
+        for animations in self.sets.values():
+            for frame in animations.all_frames():
+                seen[id(frame)] = frame
+        owned = views = 0
+        for frame in seen.values():
+            size = frame.get_width() * frame.get_height() * frame.get_bytesize()
+            if frame.get_parent() is None:
+                owned += size
+            else:
+                views += size
+        return owned, views
+
+    def memory_bytes(self):
+        # Só os pixels que o banco mantém vivos sozinho
+        return self.frame_bytes()[0]
+
+    def stats(self):
+        owned, views = self.frame_bytes()
+        return {
+            'sets': len(self.sets),
+            'frames': sum(len(list(animations.all_frames())) for animations in self.sets.values()),
+            'builds': self.builds,
+            'requests': self.requests,
+            'sheet_requests': self.sheet_requests,
+            'sheet_loads': self.sheet_loads,
+            'memory_bytes': owned,
+            'view_bytes': views
+        }
+
+    def clear(self):
+        self.sets.clear()
+
+# Banco compartilhado pelas animações de todos os inimigos
+enemy_animation_bank = AnimationBank()
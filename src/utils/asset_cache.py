@@ -0,0 +1,158 @@
+import os
+import sys
+import struct
+import hashlib
+import pygame
+from src.utils.asset_pack import open_resource, load_image
+
+# Cabeçalho dos arquivos cozidos: assinatura, largura, altura e formato dos pixels
+CACHE_MAGIC = b"SLCK"
+CACHE_HEADER = struct.Struct("<4sII4s")
+
+class AssetCache:
+    """
+    Cache em disco de imagens "cozidas": já escaladas para o tamanho usado no jogo
+    e gravadas como buffer de pixels cru, recarregado com pygame.image.frombuffer.
+    A chave de cada entrada combina o hash do PNG de origem, o tamanho final e o hash
+    das configurações de sprite, então entradas velhas são invalidadas sozinhas.
+    :param cache_dir: Pasta onde os buffers são gravados
+    :param config_hash: Hash das configurações que influenciam o cozimento
+    """
+    def __init__(self, cache_dir=".asset_cache", config_hash=""):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.config_hash = config_hash
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @staticmethod
+    def hash_config(*configs):
+        # repr de dicionários é estável (ordem de inserção), basta para detectar mudanças
+        return hashlib.sha1(repr(configs).encode("utf-8")).hexdigest()[:16]
+
+    @staticmethod
+    def hash_file(path):
+        digest = hashlib.sha1()
+        with open_resource(path) as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                digest.update(chunk)
+        return digest.hexdigest()[:16]
+
+    def entry_path(self, name, path, target, pixel_format):
+        """
+        Caminho do buffer cozido de uma imagem
+        :param name: Nome legível do asset (prefixo do arquivo)
+        :param target: Fator de escala ou tamanho final (largura, altura)
+        """
+        digest = hashlib.sha1(
+            f"{self.hash_file(path)}|{target}|{pixel_format}|{self.config_hash}".encode("utf-8")
+        ).hexdigest()[:20]
+        prefix = name.replace("/", "_").replace(" ", "_")
+        return os.path.join(self.cache_dir, f"{prefix}-{digest}.raw"), prefix
+
+    def load(self, name, path, target=None, pixel_format="RGBA"):
+        """
+        Carrega a imagem do cache ou cozinha (decodifica, escala e grava) na primeira vez.
+        Não converte para o formato da tela, então pode rodar fora da thread principal.
+        :param name: Nome do asset
+        :param path: Caminho do PNG de origem
+        :param target: Fator de escala, tamanho (largura, altura) ou None para o tamanho original
+        :param pixel_format: "RGBA" para imagens com alpha, "RGB" para opacas
+        :return: Superfície com os pixels cozidos
+        """
+        cache_path, prefix = self.entry_path(name, path, target, pixel_format)
+        image = read_raw(cache_path, pixel_format)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = scale_image(load_image(path), target)
+        self.store(cache_path, prefix, image, pixel_format)
+        return image
+
+    def store(self, cache_path, prefix, image, pixel_format):
+        try:
+            write_raw(cache_path, image, pixel_format)
+            self.writes += 1
+            self.remove_stale(prefix, cache_path)
+        except OSError as e:
+            print(f"Não foi possível gravar o cache do asset {prefix}: {e}")
+
+    def remove_stale(self, prefix, current_path):
+        # Entradas antigas do mesmo asset (PNG ou configuração alterados)
+        for filename in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, filename)
+            if filename.startswith(prefix + "-") and filename.endswith(".raw") and path != current_path:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'writes': self.writes}
+
+def write_raw(path, image, pixel_format="RGBA"):
+    """
+    Grava a superfície como buffer de pixels cru (cabeçalho + pixels)
+    :param pixel_format: "RGBA" ou "RGB"
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    header = CACHE_HEADER.pack(CACHE_MAGIC, image.get_width(), image.get_height(),
+                               pixel_format.encode("ascii").ljust(4, b"\0"))
+    # Gravar em arquivo temporário e renomear para nunca deixar uma entrada pela metade
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        f.write(header)
+        f.write(pygame.image.tobytes(image, pixel_format))
+    os.replace(temp_path, path)
+
+def read_raw(path, pixel_format="RGBA"):
+    """
+    Lê um buffer gravado por write_raw sem copiar os pixels
+    :return: Superfície sobre o buffer lido, ou None se o arquivo não existe ou não confere
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, width, height, stored_format = CACHE_HEADER.unpack_from(data)
+    except (OSError, struct.error):
+        return None
+    if magic != CACHE_MAGIC or stored_format.rstrip(b"\0").decode("ascii") != pixel_format:
+        return None
+    return pygame.image.frombuffer(memoryview(data)[CACHE_HEADER.size:], (width, height), pixel_format)
+
+def scale_image(image, target):
+    """
+    Escala a imagem para o alvo de cozimento
+    :param target: Fator de escala, tamanho (largura, altura) ou None; uma das
+                   dimensões do tamanho pode ser None para manter a proporção
+    """
+    if target is None or target == 1:
+        return image
+    if isinstance(target, (tuple, list)):
+        width, height = target
+        if width is None:
+            width = image.get_width() * height / image.get_height()
+        elif height is None:
+            height = image.get_height() * width / image.get_width()
+        size = (int(width), int(height))
+    else:
+        size = (int(image.get_width() * target), int(image.get_height() * target))
+    if size == image.get_size():
+        return image
+    return pygame.transform.scale(image, size)
+
+def main():
+    # Cozinhar todos os assets do jogo antecipadamente (python -m src.utils.asset_cache)
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    from src.game.main import asset_manager
+    asset_manager.wait()
+    for key, ms in asset_manager.report():
+        print(f"{key:20s} {ms:8.1f} ms")
+    print(f"Cache: {asset_manager.cache.stats()} em {asset_manager.cache.cache_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
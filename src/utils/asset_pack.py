@@ -0,0 +1,200 @@
+import io
+import os
+import sys
+import mmap
+import zlib
+import struct
+import pygame
+
+# Formato do pack:
+#   cabeçalho: assinatura, versão, nº de entradas, tamanho do índice
+#   índice:    para cada arquivo, caminho (tamanho + utf-8), offset, tamanho gravado,
+#              tamanho original e se está comprimido com zlib
+#   dados:     conteúdo dos arquivos, na ordem do índice
+PACK_MAGIC = b"SLPK"
+PACK_VERSION = 1
+PACK_HEADER = struct.Struct("<4sHII")
+PACK_ENTRY = struct.Struct("<QIIB")
+PACK_FILE = "assets.pak"
+PACK_PREFIX = "pack:"
+
+# Pack montado pelo jogo (None quando os assets vêm direto da pasta assets/)
+active_pack = None
+
+class PackFile(io.RawIOBase):
+    """
+    Arquivo somente leitura sobre um trecho do pack mapeado em memória.
+    Só copia os bytes que forem de fato lidos (ex.: pelo pygame.image.load).
+    """
+    def __init__(self, view):
+        super().__init__()
+        self.view = view
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), len(self.view) - self.position)
+        if size <= 0:
+            return 0
+        buffer[:size] = self.view[self.position:self.position + size]
+        self.position += size
+        return size
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.view)
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def close(self):
+        self.view = memoryview(b"")
+        super().close()
+
+class AssetPack:
+    """
+    Pack de assets aberto com mmap: o índice é lido na abertura e o conteúdo de cada
+    arquivo só é tocado quando ele é aberto.
+    :param path: Caminho do arquivo .pak
+    """
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.entries = {}  # caminho relativo -> (offset, tamanho gravado, tamanho original, comprimido)
+
+        magic, version, count, index_size = PACK_HEADER.unpack_from(self.data)
+        if magic != PACK_MAGIC or version != PACK_VERSION:
+            self.close()
+            raise ValueError(f"Arquivo de pack inválido: {path}")
+        offset = PACK_HEADER.size
+        for _ in range(count):
+            (length,) = struct.unpack_from("<H", self.data, offset)
+            name = self.data[offset + 2:offset + 2 + length].decode("utf-8")
+            offset += 2 + length
+            self.entries[name] = PACK_ENTRY.unpack_from(self.data, offset)
+            offset += PACK_ENTRY.size
+
+    def __contains__(self, relative_path):
+        return normalize_path(relative_path) in self.entries
+
+    def open(self, relative_path):
+        """
+        :return: Objeto tipo arquivo com o conteúdo original do asset
+        """
+        offset, stored_size, size, compressed = self.entries[normalize_path(relative_path)]
+        view = memoryview(self.data)[offset:offset + stored_size]
+        if compressed:
+            return io.BytesIO(zlib.decompress(view, bufsize=size))
+        return PackFile(view)
+
+    def stats(self):
+        stored = sum(entry[1] for entry in self.entries.values())
+        original = sum(entry[2] for entry in self.entries.values())
+        return {'files': len(self.entries), 'stored_bytes': stored, 'original_bytes': original}
+
+    def close(self):
+        try:
+            self.data.close()
+        except BufferError:
+            # Ainda há PackFiles abertos apontando para o mapa; ele é liberado com eles
+            pass
+        self.file.close()
+
+def normalize_path(relative_path):
+    relative_path = relative_path.replace("\\", "/")
+    while relative_path.startswith("./"):
+        relative_path = relative_path[2:]
+    return relative_path
+
+def build_pack(output, relative_paths, base_path=".", compress=True, min_saving=0.1):
+    """
+    Gera o pack com os arquivos informados
+    :param output: Caminho do arquivo .pak
+    :param relative_paths: Caminhos relativos a base_path (os mesmos usados pelo jogo)
+    :param compress: Comprimir com zlib os arquivos em que isso compensa
+    :param min_saving: Economia mínima (fração) para gravar o arquivo comprimido
+    :return: Lista de (caminho, tamanho gravado, tamanho original)
+    """
+    names, blobs, flags, sizes = [], [], [], []
+    for relative_path in dict.fromkeys(normalize_path(path) for path in relative_paths):
+        with open(os.path.join(base_path, relative_path), "rb") as f:
+            content = f.read()
+        stored, compressed = content, 0
+        if compress:
+            packed = zlib.compress(content, 9)
+            # PNGs já são comprimidos; só vale a pena para o que realmente encolhe
+            if len(packed) <= len(content) * (1 - min_saving):
+                stored, compressed = packed, 1
+        names.append(relative_path.encode("utf-8"))
+        blobs.append(stored)
+        flags.append(compressed)
+        sizes.append(len(content))
+
+    index_size = sum(2 + len(name) + PACK_ENTRY.size for name in names)
+    offset = PACK_HEADER.size + index_size
+    index = bytearray()
+    for name, blob, compressed, size in zip(names, blobs, flags, sizes):
+        index += struct.pack("<H", len(name)) + name
+        index += PACK_ENTRY.pack(offset, len(blob), size, compressed)
+        offset += len(blob)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "wb") as f:
+        f.write(PACK_HEADER.pack(PACK_MAGIC, PACK_VERSION, len(names), index_size))
+        f.write(index)
+        for blob in blobs:
+            f.write(blob)
+    return [(name.decode("utf-8"), len(blob), size) for name, blob, size in zip(names, blobs, sizes)]
+
+def mount(path):
+    """
+    Monta o pack para que get_resource_path resolva os assets dentro dele
+    :return: True se o pack foi montado
+    """
+    global active_pack
+    if not os.path.exists(path):
+        return False
+    try:
+        active_pack = AssetPack(path)
+        return True
+    except (OSError, ValueError, struct.error) as e:
+        print(f"Não foi possível abrir o pack de assets {path}: {e}")
+        return False
+
+def open_resource(path):
+    """
+    Abre um caminho devolvido por get_resource_path (arquivo comum ou entrada do pack)
+    """
+    if path.startswith(PACK_PREFIX):
+        return active_pack.open(path[len(PACK_PREFIX):])
+    return open(path, "rb")
+
+def load_image(path):
+    if not path.startswith(PACK_PREFIX):
+        return pygame.image.load(path)
+    # pygame lê direto do objeto tipo arquivo; o caminho serve de dica do formato
+    with open_resource(path) as f:
+        return pygame.image.load(f, os.path.basename(path))
+
+def main():
+    # Gerar o pack com os assets referenciados pelo jogo (python -m src.utils.asset_pack [saída])
+    from src.utils.assets import GAME_ASSETS
+    output = sys.argv[1] if len(sys.argv) > 1 else os.path.join("build", "pack", PACK_FILE)
+    files = build_pack(output, [path for path, _ in GAME_ASSETS.values() if os.path.exists(path)])
+    for name, stored, size in files:
+        print(f"{name:50s} {stored:>10d} / {size:>10d}")
+    print(f"Pack: {len(files)} arquivos, {os.path.getsize(output)} bytes em {output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from src.utils import asset_pack
+from src.utils.asset_pack import load_image
+from src.utils.asset_cache import scale_image
+
+# Função para resolver caminhos de recursos
+def get_resource_path(relative_path):
+    try:
+        # PyInstaller cria um temp folder e armazena o caminho em _MEIPASS
+        base_path = sys._MEIPASS
+    except Exception:
+        base_path = os.path.abspath(".")
+    path = os.path.join(base_path, relative_path)
+    # Em builds empacotados os assets ficam dentro do pack (ver asset_pack.py)
+    if asset_pack.active_pack is not None and not os.path.exists(path) and relative_path in asset_pack.active_pack:
+        return asset_pack.PACK_PREFIX + asset_pack.normalize_path(relative_path)
+    return path
+
+# Montar o pack de assets, se o build trouxer um
+asset_pack.mount(get_resource_path(asset_pack.PACK_FILE))
+
+# Imagens usadas pelo jogo: chave -> (caminho relativo, modo de conversão)
+# "alpha" usa convert_alpha(), "opaque" usa convert() (sem canal alpha)
+GAME_ASSETS = {
+    "tileset": ("assets/oak_woods_v1.0/oak_woods_tileset.png", "alpha"),
+    "background/1": ("assets/backgrounds/city 1/1.png", "opaque"),
+    "background/2": ("assets/backgrounds/city 1/2.png", "alpha"),
+    "background/3": ("assets/backgrounds/city 1/3.png", "alpha"),
+    "background/4": ("assets/backgrounds/city 1/4.png", "alpha"),
+    "background/5": ("assets/backgrounds/city 1/5.png", "alpha"),
+    "player": ("assets/player.png", "alpha"),
+    "platform": ("assets/dark_stone_platform.png", "alpha"),
+    "enemy/idle": ("assets/enemy/Idle.png", "alpha"),
+    "enemy/walk": ("assets/enemy/Walk.png", "alpha"),
+    "enemy/run": ("assets/enemy/Run.png", "alpha"),
+    "enemy/jump": ("assets/enemy/Jump.png", "alpha"),
+    "enemy/attack_1": ("assets/enemy/Attack_1.png", "alpha"),
+    "enemy/attack_2": ("assets/enemy/Attack_2.png", "alpha"),
+    "enemy/attack_3": ("assets/enemy/Attack_3.png", "alpha"),
+    "enemy/hurt": ("assets/enemy/Hurt.png", "alpha"),
+    "enemy/dead": ("assets/enemy/Dead.png", "alpha")
+}
+
+class AssetManager:
+    """
+    Carrega imagens em segundo plano e entrega as superfícies por chave.
+    A decodificação dos arquivos roda em um pool de threads enquanto o menu já está
+    animando; a conversão para o formato da tela (convert/convert_alpha) precisa do
+    display e por isso é feita na thread principal, em poll().
+    Com um AssetCache, as imagens vêm já escaladas do cache em disco em vez de
+    decodificar o PNG e reescalar a cada execução.
+    :param max_workers: Número de threads de decodificação
+    :param cache: AssetCache opcional para as imagens cozidas
+    """
+    def __init__(self, max_workers=4, cache=None):
+        self.max_workers = max_workers
+        self.cache = cache
+        self.entries = {}     # chave -> (caminho, modo de conversão, escala ou tamanho final)
+        self.surfaces = {}    # chave -> superfície pronta (None se falhou)
+        self.errors = {}      # chave -> mensagem de erro
+        self.timings = {}     # chave -> tempo de carregamento em ms
+        self.pending = {}     # chave -> Future da decodificação
+        self.tasks = {}       # nome -> (Future, função chamada na thread principal com o resultado)
+        self.executor = None
+        self.started_at = None
+        self.finished_at = None
+
+    def register(self, key, relative_path, convert="alpha", target=None):
+        """
+        :param target: Fator de escala ou tamanho final (largura, altura) aplicado no carregamento
+        """
+        self.entries[key] = (get_resource_path(relative_path), convert, target)
+
+    def register_many(self, assets, targets=None):
+        targets = targets or {}
+        for key, (relative_path, convert) in assets.items():
+            self.register(key, relative_path, convert, targets.get(key))
+
+    def start(self):
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="assets")
+        if self.started_at is None:
+            self.started_at = time.perf_counter()
+
+    def preload(self, keys=None):
+        """
+        Dispara a decodificação das imagens em segundo plano (não bloqueia)
+        :param keys: Chaves a carregar (padrão: todas as registradas)
+        """
+        self.start()
+        for key in (keys if keys is not None else self.entries.keys()):
+            if key not in self.surfaces and key not in self.pending:
+                self.pending[key] = self.executor.submit(self.decode, key)
+
+    def submit(self, name, func, on_done=None):
+        """
+        Roda um trabalho de carregamento que não usa o display (ler arquivos, calcular hashes)
+        nas threads do pool. O carregamento só fica pronto depois dele.
+        :param name: Nome do trabalho
+        :param func: Função sem argumentos executada em segundo plano
+        :param on_done: Função chamada com o resultado na thread principal, em poll();
+                        pode pedir mais assets com preload()
+        """
+        self.start()
+        self.tasks[name] = (self.executor.submit(func), on_done)
+
+    def decode(self, key):
+        # Executado nas threads do pool: apenas ler, decodificar e escalar o arquivo
+        path, convert, target = self.entries[key]
+        start = time.perf_counter()
+        if self.cache is not None:
+            image = self.cache.load(key, path, target, "RGB" if convert == "opaque" else "RGBA")
+        else:
+            image = scale_image(load_image(path), target)
+        return image, (time.perf_counter() - start) * 1000
+
+    def finalize(self, key, future):
+        path, convert = self.entries[key][:2]
+        start = time.perf_counter()
+        try:
+            image, decode_ms = future.result()
+            if convert == "alpha":
+                image = image.convert_alpha()
+            elif convert == "opaque":
+                image = image.convert()
+            self.surfaces[key] = image
+        except Exception as e:
+            print(f"Erro ao carregar asset {key} ({path}): {e}")
+            self.surfaces[key] = None
+            self.errors[key] = str(e)
+            decode_ms = 0.0
+        self.timings[key] = decode_ms + (time.perf_counter() - start) * 1000
+
+    def poll(self):
+        """
+        Converte na thread principal as imagens que já terminaram de decodificar.
+        Deve ser chamado uma vez por frame enquanto houver carregamento pendente.
+        :return: True se todos os assets pedidos estão prontos
+        """
+        for name, (future, on_done) in list(self.tasks.items()):
+            if future.done():
+                del self.tasks[name]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    print(f"Erro no carregamento {name}: {e}")
+                    self.errors[name] = str(e)
+                    result = None
+                if on_done is not None:
+                    on_done(result)
+        for key, future in list(self.pending.items()):
+            if future.done():
+                del self.pending[key]
+                self.finalize(key, future)
+        if self.ready and self.started_at is not None and self.finished_at is None:
+            self.finished_at = time.perf_counter()
+            print(f"Assets carregados: {len(self.surfaces)} em {self.total_ms():.0f} ms")
+        return self.ready
+
+    def wait(self):
+        # Bloquear até todos os assets pendentes estarem prontos (trabalhos podem pedir outros)
+        while not self.poll():
+            wait(list(self.pending.values()) + [future for future, _ in self.tasks.values()])
+        return True
+
+    @property
+    def ready(self):
+        return not self.pending and not self.tasks
+
+    @property
+    def progress(self):
+        total = len(self.surfaces) + len(self.pending) + len(self.tasks)
+        return len(self.surfaces) / total if total else 1.0
+
+    def get(self, key):
+        """
+        Retorna a superfície da chave, carregando-a na hora se ainda não estiver pronta
+        :return: Superfície convertida, ou None se o arquivo não pôde ser carregado
+        """
+        if key not in self.surfaces:
+            if key not in self.pending:
+                self.preload([key])
+            future = self.pending.pop(key)
+            self.finalize(key, future)
+        return self.surfaces[key]
+
+    def total_ms(self):
+        end = self.finished_at if self.finished_at is not None else time.perf_counter()
+        return (end - self.started_at) * 1000 if self.started_at is not None else 0.0
+
+    def report(self):
+        # Assets ordenados do mais lento para o mais rápido
+        return sorted(self.timings.items(), key=lambda item: item[1], reverse=True)
+
+    def shutdown(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False)
+            self.executor = None
@@ -0,0 +1,153 @@
+import pygame
+
+class Camera:
+    """
+    Câmera de rolagem horizontal: guarda o scroll, o viewport e responde se algo está
+    visível. As entidades ficam sempre em coordenadas do mundo; o deslocamento da câmera
+    só é aplicado na passada de desenho, que também pula o que está fora da tela (mais
+    uma margem) e conta quantos objetos foram descartados em cada frame.
+    :param width: Largura da tela
+    :param height: Altura da tela
+    :param world_width: Largura total do mapa
+    :param margin: Margem em pixels ao redor da tela que ainda conta como visível
+    """
+    def __init__(self, width, height, world_width, margin=64):
+        self.width = width
+        self.height = height
+        self.world_width = world_width
+        self.max_scroll = max(0, world_width - width)
+        self.margin = margin
+        self.scroll = 0
+        # Com simulação de passo fixo o desenho interpola entre o scroll do passo anterior e
+        # o atual; render_scroll é o scroll usado pela passada de desenho
+        self.previous_scroll = 0
+        self.render_scroll = 0
+        self.alpha = 1.0
+        # Área visível mais a margem, em coordenadas do mundo (acompanha o scroll)
+        self.view = pygame.Rect(-margin, -margin, width + 2 * margin, height + 2 * margin)
+        self.culled = {}  # Tipo de objeto -> quantos ficaram fora da tela neste frame
+        self.drawn = {}   # Tipo de objeto -> quantos foram desenhados neste frame
+
+    @property
+    def viewport(self):
+        # Área visível em coordenadas do mundo
+        return pygame.Rect(self.render_scroll, 0, self.width, self.height)
+
+    @property
+    def offset(self):
+        # Deslocamento a subtrair de uma posição do mundo para obter a posição na tela
+        return (self.render_scroll, 0)
+
+    def scroll_to(self, scroll):
+        # Scroll inteiro para que os sprites caiam em pixels exatos
+        self.scroll = int(max(0, min(scroll, self.max_scroll)))
+        self.render_scroll = self.scroll
+        self.alpha = 1.0
+        self.view.x = self.scroll - self.margin
+        return self.scroll
+
+    def begin_step(self):
+        # Guardar o scroll antes de um passo da simulação (ponto de partida da interpolação)
+        self.previous_scroll = self.scroll
+
+    def interpolate(self, alpha):
+        """
+        Posiciona a câmera de desenho entre o passo anterior e o atual
+        :param alpha: Fração do próximo passo já decorrida (0 a 1)
+        """
+        self.alpha = alpha
+        self.render_scroll = round(self.previous_scroll + (self.scroll - self.previous_scroll) * alpha)
+        self.view.x = self.render_scroll - self.margin
+
+    def position(self, sprite):
+        """
+        :return: Posição (x, y) do sprite no mundo interpolada para o desenho; sprites sem
+                 previous_position (estáticos) ficam na posição do rect
+        """
+        x, y = sprite.rect.topleft
+        previous = getattr(sprite, "previous_position", None)
+        if previous is None or self.alpha >= 1.0:
+            return x, y
+        alpha = self.alpha
+        return round(previous[0] + (x - previous[0]) * alpha), round(previous[1] + (y - previous[1]) * alpha)
+
+    def sprite_offset(self, sprite):
+        # Deslocamento (x, y) a subtrair do rect do sprite para obter onde ele é desenhado na tela
+        x, y = self.position(sprite)
+        return self.render_scroll - (x - sprite.rect.x), sprite.rect.y - y
+
+    def scroll_by(self, dx):
+        return self.scroll_to(self.scroll + dx)
+
+    def follow(self, x, left=0.3, right=0.7):
+        """
+        Rola a câmera para manter x dentro da zona morta [left, right] da tela
+        :param x: Posição horizontal do alvo no mundo
+        :param left: Limite esquerdo da zona morta (fração da largura da tela)
+        :param right: Limite direito da zona morta (fração da largura da tela)
+        """
+        screen_x = x - self.scroll
+        if screen_x > self.width * right:
+            return self.scroll_to(x - self.width * right)
+        if screen_x < self.width * left:
+            return self.scroll_to(x - self.width * left)
+        return self.scroll
+
+    def reset(self):
+        self.scroll_to(0)
+        self.previous_scroll = 0
+
+    def to_screen(self, rect):
+        return rect.move(-self.render_scroll, 0)
+
+    def is_visible(self, rect):
+        """
+        :param rect: Retângulo em coordenadas do mundo
+        :return: True se o retângulo cruza a tela (incluindo a margem)
+        """
+        return self.view.colliderect(rect)
+
+    def begin_frame(self):
+        self.culled = {}
+        self.drawn = {}
+
+    def count(self, kind, drawn, culled):
+        self.drawn[kind] = self.drawn.get(kind, 0) + drawn
+        self.culled[kind] = self.culled.get(kind, 0) + culled
+
+    def visible(self, objects, kind):
+        """
+        Filtra os objetos (com .rect) que estão na tela e registra os descartados
+        :param kind: Nome usado no relatório de culling
+        """
+        view = self.view
+        visible = [obj for obj in objects if view.colliderect(obj.rect)]
+        self.count(kind, len(visible), len(objects) - len(visible))
+        return visible
+
+    def draw_sprites(self, surface, group, kind="sprites", doreturn=False):
+        """
+        Equivalente a group.draw(surface), mas só com os sprites visíveis e já deslocados
+        para a tela; os rects dos sprites continuam em coordenadas do mundo
+        :param doreturn: Devolver as áreas da tela desenhadas (para o envio por dirty rects)
+        """
+        sprites = self.visible(group.sprites(), kind)
+        scroll = self.render_scroll
+        if self.alpha >= 1.0:
+            blits = [(sprite.image, (sprite.rect.x - scroll, sprite.rect.y)) for sprite in sprites]
+        else:
+            # Posições interpoladas entre os dois últimos passos da simulação
+            blits = []
+            for sprite in sprites:
+                x, y = self.position(sprite)
+                blits.append((sprite.image, (x - scroll, y)))
+        return surface.blits(blits, doreturn=doreturn)
+
+    def stats(self):
+        return {
+            'scroll': self.scroll,
+            'render_scroll': self.render_scroll,
+            'drawn': dict(self.drawn),
+            'culled': dict(self.culled),
+            'total_culled': sum(self.culled.values())
+        }
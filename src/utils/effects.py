@@ -1,6 +1,141 @@
 import pygame
 import random
 import math
+from collections import OrderedDict, namedtuple
+import numpy as np
+
+# Modos de mistura suportados na renderização em lote das partículas
+BLEND_ALPHA = 'alpha'
+BLEND_ADD = 'add'
+BLEND_PREMULTIPLIED = 'premultiplied'
+BLEND_FLAGS = {
+    BLEND_ALPHA: 0,
+    BLEND_ADD: pygame.BLEND_RGB_ADD,
+    BLEND_PREMULTIPLIED: pygame.BLEND_PREMULTIPLIED
+}
+
+class GlowSpriteCache:
+    """
+    Cache LRU de sprites de brilho pré-renderizados.
+    A chave é quantizada (cor, raio, faixa de alpha, intensidade), então partículas
+    parecidas compartilham o mesmo sprite e desenhar vira um único blit.
+    :param max_entries: Número máximo de sprites mantidos em memória
+    :param color_step: Passo de quantização de cada canal de cor
+    :param alpha_bands: Número de faixas em que o alpha (0-255) é dividido
+    """
+    def __init__(self, max_entries=1024, color_step=32, alpha_bands=8):
+        self.max_entries = max_entries
+        self.color_step = color_step
+        self.alpha_bands = alpha_bands
+        self.sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def make_key(self, color, radius, alpha, intensity=0.3):
+        step = self.color_step
+        quantized_color = tuple(min(255, (int(c) + step // 2) // step * step) for c in color)
+        band = min(self.alpha_bands - 1, max(0, int(alpha)) * self.alpha_bands // 256)
+        return 'glow', quantized_color, int(radius), band, intensity
+
+    def particle_keys(self, colors, glow_radii, core_radii, alphas, blend_mode=BLEND_ALPHA):
+        """
+        Monta as chaves dos sprites completos (brilho + núcleo) de várias partículas de uma vez
+        :param colors: Array (n, 3) com as cores das partículas
+        :param glow_radii: Array com o raio do brilho de cada partícula
+        :param core_radii: Array com o raio do núcleo de cada partícula
+        :param alphas: Array com o alpha de cada partícula
+        :param blend_mode: Modo de mistura para o qual o sprite será preparado
+        :return: Lista de chaves, na mesma ordem das partículas
+        """
+        step = self.color_step
+        quantized = np.minimum((colors.astype(np.int32) + step // 2) // step * step, 255)
+        bands = np.clip(alphas.astype(np.int32) * self.alpha_bands // 256, 0, self.alpha_bands - 1)
+        return [
+            ('particle', tuple(color), glow, core, band, blend_mode)
+            for color, glow, core, band in zip(quantized.tolist(), glow_radii.tolist(),
+                                                core_radii.tolist(), bands.tolist())
+        ]
+
+    def get(self, color, radius, alpha, intensity=0.3):
+        """
+        Retorna o sprite de brilho para os parâmetros dados, renderizando-o se necessário
+        :param color: Cor RGB da partícula
+        :param radius: Raio do brilho em pixels
+        :param alpha: Alpha da partícula (0-255)
+        :param intensity: Fator aplicado ao alpha no gradiente
+        :return: Superfície SRCALPHA de tamanho (2 * radius, 2 * radius)
+        """
+        return self.lookup(self.make_key(color, radius, alpha, intensity))
+
+    def lookup(self, key):
+        sprite = self.sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self.sprites.move_to_end(key)
+            return sprite
+
+        self.misses += 1
+        if key[0] == 'glow':
+            sprite = self.render_glow(*key[1:])
+        else:
+            sprite = self.render_particle(*key[1:])
+        self.sprites[key] = sprite
+        if len(self.sprites) > self.max_entries:
+            self.sprites.popitem(last=False)
+            self.evictions += 1
+        return sprite
+
+    def band_alpha(self, band):
+        # Usar o centro da faixa como alpha representativo
+        return (band + 0.5) * 256 / self.alpha_bands
+
+    def draw_gradient(self, sprite, color, center, radius, alpha, intensity):
+        for r in range(radius, 0, -1):
+            pygame.draw.circle(sprite, (*color, int((r / radius) * alpha * intensity)), center, r)
+
+    def render_glow(self, color, radius, band, intensity):
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        self.draw_gradient(sprite, color, (radius, radius), radius, self.band_alpha(band), intensity)
+        return sprite
+
+    def render_particle(self, color, glow_radius, core_radius, band, blend_mode):
+        # Brilho externo e núcleo combinados em um único sprite
+        radius = max(glow_radius, core_radius)
+        center = (radius, radius)
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        if glow_radius > 0:
+            self.draw_gradient(sprite, color, center, glow_radius, self.band_alpha(band), 0.3)
+        if core_radius > 0:
+            # Núcleo opaco com centro mais brilhante, como era desenhado direto na tela
+            bright_color = tuple(min(c + 50, 255) for c in color)
+            pygame.draw.circle(sprite, (*color, 255), center, core_radius)
+            pygame.draw.circle(sprite, (*bright_color, 255), center, max(1, core_radius // 2))
+
+        if blend_mode == BLEND_ADD:
+            # Para soma aditiva o RGB precisa estar pré-multiplicado sobre fundo preto
+            additive = pygame.Surface(sprite.get_size())
+            additive.blit(sprite, (0, 0))
+            return additive
+        if blend_mode == BLEND_PREMULTIPLIED:
+            return sprite.premul_alpha()
+        return sprite
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            'entries': len(self.sprites),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0
+        }
+
+    def clear(self):
+        self.sprites.clear()
+
+# Cache compartilhado por todas as partículas do jogo
+glow_cache = GlowSpriteCache()
 
 class Particle:
     def __init__(self, x, y, color, alpha=255, size=3, speed=2, lifetime=30):
@@ -27,148 +162,666 @@ class Particle:
 
     def draw(self, surface):
         if self.alpha > 0:
-            particle_surface = pygame.Surface((self.size * 2, self.size * 2), pygame.SRCALPHA)
-            # Criar um gradiente circular para cada partícula
-            for r in range(self.size, 0, -1):
-                alpha = int(self.alpha * (r / self.size))
-                pygame.draw.circle(particle_surface, (*self.color, alpha), (self.size, self.size), r)
-            surface.blit(particle_surface, (int(self.x - self.size), int(self.y - self.size)))
+            # Gradiente circular pré-renderizado e compartilhado pelo cache
+            size = int(self.size)
+            if size > 0:
+                particle_surface = glow_cache.get(self.color, size, self.alpha, 1.0)
+                surface.blit(particle_surface, (int(self.x - size), int(self.y - size)))
 
 class Trail:
-    def __init__(self, color, alpha=255, length=5):
+    """
+    Rastro formado por segmentos de linha com gradiente de alpha e largura
+    :param color: Cor RGB do rastro
+    :param alpha: Alpha do segmento mais recente
+    :param length: Número máximo de pontos guardados
+    :param width: Largura do segmento mais recente
+    :param min_width: Largura do segmento mais antigo
+    :param fade_delay: Frames sem novos pontos até o rastro começar a sumir
+    """
+    def __init__(self, color, alpha=255, length=5, width=7, min_width=2, fade_delay=10):
         self.color = color
         self.alpha = alpha
         self.length = length
+        self.width = width
+        self.min_width = min_width
+        self.fade_delay = fade_delay
+        self.idle_frames = 0
         self.points = []
 
     def add_point(self, x, y):
         self.points.append((x, y))
         if len(self.points) > self.length:
             self.points.pop(0)
+        self.idle_frames = 0
+
+    def fade(self):
+        # Remover o ponto mais antigo quando o rastro para de receber pontos
+        self.idle_frames += 1
+        if self.idle_frames > self.fade_delay and self.points:
+            self.points.pop(0)
+
+    def bounds(self):
+        """
+        Retângulo que contém todos os segmentos do rastro (ou None se não há o que desenhar)
+        """
+        if len(self.points) < 2:
+            return None
+        xs = [p[0] for p in self.points]
+        ys = [p[1] for p in self.points]
+        margin = self.width
+        left = int(min(xs)) - margin
+        top = int(min(ys)) - margin
+        return pygame.Rect(left, top, int(max(xs)) + margin - left + 1, int(max(ys)) + margin - top + 1)
+
+    def draw_into(self, target, offset):
+        # Desenhar segmentos do trail com gradiente, deslocados por `offset`
+        last = len(self.points) - 1
+        ox, oy = offset
+        for i in range(last):
+            progress = i / last
+            current_alpha = int(self.alpha * progress)
+            width = int(self.min_width + (self.width - self.min_width) * progress)
+
+            start_x, start_y = self.points[i]
+            end_x, end_y = self.points[i + 1]
+            pygame.draw.line(target, (*self.color, current_alpha),
+                             (start_x + ox, start_y + oy), (end_x + ox, end_y + oy), width)
 
     def draw(self, surface):
-        if len(self.points) >= 2:
-            # Criar uma superfície para o trail com transparência
-            trail_surface = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
-            
-            # Desenhar segmentos do trail com gradiente
-            for i in range(len(self.points) - 1):
-                progress = i / (len(self.points) - 1)
-                current_alpha = int(self.alpha * progress)
-                width = int(5 * progress + 2)  # Largura diminui gradualmente
-                
-                start_pos = self.points[i]
-                end_pos = self.points[i + 1]
-                
-                # Desenhar linha com gradiente
-                pygame.draw.line(trail_surface, (*self.color, current_alpha),
-                               start_pos, end_pos, width)
-            
-            surface.blit(trail_surface, (0, 0))
+        trail_renderer.draw(surface, (self,))
+
+class TrailRenderer:
+    """
+    Desenha vários rastros em uma única passada.
+    Cada rastro é desenhado apenas dentro do seu retângulo envolvente em uma região de
+    um buffer de rascunho reaproveitado entre frames, e todas as regiões são enviadas
+    para a tela com um único Surface.blits.
+    :param row_width: Largura máxima de uma linha de regiões no buffer
+    """
+    def __init__(self, row_width=1024):
+        self.row_width = row_width
+        self.scratch = pygame.Surface((256, 64), pygame.SRCALPHA)
+        self.last_pixels = 0  # Pixels desenhados no último frame (para instrumentação)
+        self.last_culled = 0  # Rastros fora do viewport no último frame
+        self.last_bounds = None  # Área da tela coberta pelos rastros no último frame
+
+    def ensure_scratch(self, width, height):
+        current_width, current_height = self.scratch.get_size()
+        if width > current_width or height > current_height:
+            self.scratch = pygame.Surface((max(width, current_width), max(height, current_height)),
+                                          pygame.SRCALPHA)
+
+    def draw(self, surface, trails, offset=(0, 0), viewport=None):
+        """
+        :param offset: Deslocamento subtraído dos pontos dos rastros (ex.: scroll da câmera)
+        :param viewport: Retângulo (nas coordenadas dos rastros, antes do offset) fora do qual
+                         os rastros são descartados
+        """
+        # Distribuir os retângulos dos rastros em linhas dentro do buffer
+        jobs = []
+        x = y = row_height = max_width = 0
+        self.last_culled = 0
+        for trail in trails:
+            bounds = trail.bounds()
+            if bounds is None:
+                continue
+            if viewport is not None and not viewport.colliderect(bounds):
+                self.last_culled += 1
+                continue
+            if x and x + bounds.width > self.row_width:
+                x, y, row_height = 0, y + row_height, 0
+            jobs.append((trail, bounds, pygame.Rect(x, y, bounds.width, bounds.height)))
+            x += bounds.width
+            row_height = max(row_height, bounds.height)
+            max_width = max(max_width, x)
+
+        self.last_pixels = 0
+        self.last_bounds = None
+        if not jobs:
+            return
+        self.ensure_scratch(max_width, y + row_height)
+
+        scratch = self.scratch
+        batch = []
+        for trail, bounds, area in jobs:
+            scratch.fill((0, 0, 0, 0), area)
+            scratch.set_clip(area)
+            trail.draw_into(scratch, (area.x - bounds.x, area.y - bounds.y))
+            batch.append((scratch, (bounds.x - offset[0], bounds.y - offset[1]), area))
+            self.last_pixels += area.width * area.height
+        scratch.set_clip(None)
+        rects = [pygame.Rect(position, area.size) for _, position, area in batch]
+        self.last_bounds = rects[0].unionall(rects[1:])
+
+        surface.blits(batch, doreturn=False)
+
+# Buffer de rastros compartilhado
+trail_renderer = TrailRenderer()
+
+class ShieldAnimationCache:
+    """
+    Anel de frames pré-renderizados da animação do escudo mágico.
+    Cada frame guarda a bolha (camadas com ondulação) e o brilho externo já combinados
+    para uma fase da ondulação; o pulso de transparência é aplicado com set_alpha, então
+    desenhar o escudo vira um único blit. Os frames são renderizados no primeiro uso e
+    descartados quando o raio, a cor ou o número de camadas mudam.
+    :param frame_count: Número de fases da ondulação guardadas no anel
+    :param reference_alpha: Alpha usado na renderização (o maior alpha do pulso)
+    """
+    def __init__(self, frame_count=32, reference_alpha=100):
+        self.frame_count = frame_count
+        self.reference_alpha = reference_alpha
+        self.config = None
+        self.frames = [None] * frame_count
+        self.rendered = 0
+
+    def configure(self, radius, color, layers):
+        config = (radius, tuple(color), layers)
+        if config != self.config:
+            self.config = config
+            self.invalidate()
+
+    def invalidate(self):
+        self.frames = [None] * self.frame_count
+
+    def prerender(self):
+        for index in range(self.frame_count):
+            self.get_frame_by_index(index)
+
+    def get_frame(self, wave, alpha):
+        """
+        Retorna o frame para a fase de ondulação e o alpha de pulso atuais
+        :param wave: Fase da ondulação em radianos
+        :param alpha: Alpha atual do escudo (pulso)
+        :return: Superfície com bolha e brilho, centrada no jogador
+        """
+        phase = (wave % (math.pi * 2)) / (math.pi * 2)
+        frame = self.get_frame_by_index(int(phase * self.frame_count) % self.frame_count)
+        frame.set_alpha(min(255, int(255 * alpha / self.reference_alpha)))
+        return frame
+
+    def get_frame_by_index(self, index):
+        frame = self.frames[index]
+        if frame is None:
+            frame = self.render_frame(index / self.frame_count * math.pi * 2)
+            self.frames[index] = frame
+            self.rendered += 1
+        return frame
+
+    def render_frame(self, wave):
+        radius, color, layers = self.config
+        alpha_ref = self.reference_alpha
+
+        # Criar superfície para a bolha com gradiente
+        shield_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+
+        # Desenhar múltiplas camadas para criar efeito de aura
+        for i in range(layers):
+            # Calcular raio e ondulação para cada camada
+            layer_radius = radius - (i * 8)
+            if layer_radius <= 0:
+                break
+            wave_offset = math.sin(wave + i * math.pi / 2) * 4
+
+            # Desenhar círculos concêntricos com ondulação
+            for r in range(layer_radius, 0, -2):
+                # Calcular alpha baseado na distância do centro
+                ratio = r / layer_radius
+                alpha = int(alpha_ref * ratio * 0.9)
+                # Cor variável baseada na distância
+                layer_color = tuple(int(c * (0.8 + 0.2 * ratio)) for c in color)
+                pygame.draw.circle(shield_surface, (*layer_color, alpha),
+                                   (radius, radius), r + wave_offset)
+
+        # Brilho externo mais intenso (bolha desenhada por cima)
+        glow_radius = radius + 8
+        frame = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+        glow_color = tuple(min(255, int(c * 1.2)) for c in color)
+        for r in range(glow_radius, 0, -1):
+            alpha = int((r / glow_radius) * alpha_ref * 0.5)
+            pygame.draw.circle(frame, (*glow_color, alpha), (glow_radius, glow_radius), r)
+        frame.blit(shield_surface, (glow_radius - radius, glow_radius - radius))
+        return frame
+
+class ParticlePool:
+    """
+    Armazenamento de partículas em estrutura de arrays (NumPy) com capacidade fixa.
+    As partículas vivas ocupam sempre as primeiras `count` posições dos arrays.
+    :param capacity: Número máximo de partículas vivas ao mesmo tempo
+    """
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.count = 0
+        self.dropped = 0  # Partículas descartadas por falta de espaço no pool
+        self.rng = np.random.default_rng()
+
+        self.pos = np.zeros((capacity, 2), dtype=np.float64)
+        self.vel = np.zeros((capacity, 2), dtype=np.float64)
+        self.lifetime = np.zeros(capacity, dtype=np.int32)
+        self.alpha = np.zeros(capacity, dtype=np.int32)
+        self.size = np.zeros(capacity, dtype=np.float64)
+        self.original_size = np.zeros(capacity, dtype=np.float64)
+        self.glow_size = np.zeros(capacity, dtype=np.float64)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, speed_x, speed_y, color, alpha, size, lifetime):
+        """
+        Adiciona um lote de partículas ao pool
+        :param x, y: Posições iniciais (escalar ou array)
+        :param speed_x, speed_y: Velocidades iniciais (arrays de mesmo tamanho)
+        :param color: Array (n, 3) com as cores já variadas
+        :param alpha, size, lifetime: Escalar ou array com valores por partícula
+        :return: Número de partículas efetivamente criadas
+        """
+        requested = len(speed_x)
+        n = min(requested, self.capacity - self.count)
+        self.dropped += requested - n
+        if n <= 0:
+            return 0
+
+        start, end = self.count, self.count + n
+        self.pos[start:end, 0] = x if np.isscalar(x) else x[:n]
+        self.pos[start:end, 1] = y if np.isscalar(y) else y[:n]
+        self.vel[start:end, 0] = speed_x[:n]
+        self.vel[start:end, 1] = speed_y[:n]
+        self.color[start:end] = color[:n]
+        self.alpha[start:end] = alpha if np.isscalar(alpha) else alpha[:n]
+        self.lifetime[start:end] = lifetime if np.isscalar(lifetime) else lifetime[:n]
+        particle_size = size if np.isscalar(size) else size[:n]
+        self.size[start:end] = particle_size
+        self.original_size[start:end] = particle_size
+        self.glow_size[start:end] = self.size[start:end] * 2  # Tamanho do brilho externo
+        self.count = end
+        return n
+
+    def update(self):
+        n = self.count
+        if n == 0:
+            return
+
+        self.pos[:n] += self.vel[:n]
+        lifetime = self.lifetime[:n]
+        lifetime -= 1
+
+        # Fade mais suave no início e mais rápido no final
+        life_ratio = lifetime / 10  # Assumindo tempo de vida máximo de 10
+        alpha = self.alpha[:n]
+        alpha[:] = np.minimum(alpha * (0.7 + life_ratio * 0.3), 255)
+
+        # Encolher partícula conforme envelhece, mas manter tamanho mínimo
+        self.size[:n] = self.original_size[:n] * (0.3 + life_ratio * 0.7)
+        self.glow_size[:n] = self.size[:n] * (1.5 + life_ratio)  # Brilho diminui mais rápido
+
+        # Adicionar movimento aleatório sutil
+        self.vel[:n] += self.rng.uniform(-0.1, 0.1, (n, 2))
+
+        # Remover partículas mortas compactando os arrays
+        self.compact((lifetime > 0) & (alpha >= 30))
+
+    def compact(self, alive):
+        """
+        Mantém apenas as partículas marcadas em `alive`, preservando a ordem
+        :param alive: Máscara booleana com tamanho igual a `count`
+        """
+        keep = np.flatnonzero(alive)
+        kept = len(keep)
+        if kept == self.count:
+            return
+        for array in (self.pos, self.vel, self.lifetime, self.alpha,
+                      self.size, self.original_size, self.glow_size, self.color):
+            array[:kept] = array[keep]
+        self.count = kept
+
+    def cull(self, max_count):
+        """
+        Reduz o pool para no máximo `max_count` partículas, descartando primeiro
+        as de menor alpha e menor tempo de vida restante
+        :return: Número de partículas removidas
+        """
+        n = self.count
+        excess = n - max(0, int(max_count))
+        if excess <= 0:
+            return 0
+        priority = self.alpha[:n] * np.minimum(self.lifetime[:n], 10)
+        alive = np.ones(n, dtype=bool)
+        alive[np.argpartition(priority, excess - 1)[:excess]] = False
+        self.compact(alive)
+        return excess
+
+    def clear(self):
+        self.count = 0
+
+class ParticleBudget:
+    """
+    Governador do orçamento de partículas baseado no tempo de frame.
+    Mede o tempo de trabalho dos frames recentes e ajusta um fator de escala
+    aplicado às emissões: com o frame acima do orçamento o efeito perde
+    partículas (começando pelas mais fracas e curtas) em vez de perder FPS.
+    :param target_frame_ms: Orçamento de tempo por frame em milissegundos
+    :param max_particles: Limite de partículas vivas quando a escala é 1.0
+    :param min_scale: Menor fator de escala permitido
+    :param reject_below: Escala efetiva abaixo da qual a emissão é rejeitada
+    """
+    def __init__(self, target_frame_ms=1000 / 60, max_particles=2000, min_scale=0.05, reject_below=0.15):
+        self.target_frame_ms = target_frame_ms
+        self.max_particles = max_particles
+        self.min_scale = min_scale
+        self.reject_below = reject_below
+        self.smoothing = 0.1
+        self.frames_measured = 0
+        self.average_frame_ms = 0.0
+        self.scale = 1.0
+        self.requested = 0
+        self.emitted = 0
+        self.rejected = 0
+        self.culled = 0
+
+    def record_frame_time(self, frame_ms):
+        # Média móvel exponencial para não reagir a picos isolados
+        if self.frames_measured == 0:
+            self.average_frame_ms = frame_ms
+        else:
+            self.average_frame_ms += (frame_ms - self.average_frame_ms) * self.smoothing
+        self.frames_measured += 1
+
+        if self.average_frame_ms > self.target_frame_ms:
+            # Acima do orçamento: reduzir proporcionalmente ao excesso
+            overload = self.average_frame_ms / self.target_frame_ms - 1
+            self.scale = max(self.min_scale, self.scale - 0.05 * overload)
+        elif self.average_frame_ms < self.target_frame_ms * 0.8:
+            # Com folga: recuperar aos poucos para evitar oscilação
+            self.scale = min(1.0, self.scale + 0.01)
+
+    def emission_scale(self, alpha, lifetime):
+        # Emissões fracas (alpha baixo) e curtas são reduzidas mais cedo
+        if self.scale >= 1.0:
+            return 1.0
+        priority = 0.5 * min(alpha, 250) / 250 + 0.5 * min(lifetime, 10) / 10
+        return self.scale ** (2 - priority)
+
+    def scale_count(self, count, alpha, lifetime, rng):
+        """
+        Calcula quantas partículas de uma emissão cabem no orçamento atual
+        :param count: Número de partículas pedido
+        :param alpha: Alpha inicial da emissão
+        :param lifetime: Tempo de vida (em frames) das partículas
+        :param rng: Gerador aleatório usado no arredondamento
+        :return: Número de partículas a criar (0 se a emissão foi rejeitada)
+        """
+        self.requested += count
+        scale = self.emission_scale(alpha, lifetime)
+        if scale < self.reject_below:
+            self.rejected += count
+            return 0
+        # Arredondamento estocástico para não zerar emissões pequenas
+        scaled = count * scale
+        allowed = int(scaled) + (1 if rng.random() < scaled - int(scaled) else 0)
+        self.emitted += allowed
+        self.rejected += count - allowed
+        return allowed
+
+    def particle_limit(self):
+        return int(self.max_particles * self.scale)
+
+    def stats(self):
+        return {
+            'scale': self.scale,
+            'average_frame_ms': self.average_frame_ms,
+            'requested': self.requested,
+            'emitted': self.emitted,
+            'rejected': self.rejected,
+            'culled': self.culled
+        }
+
+# Parâmetros de um emissor de partículas. `speed` pode ser um valor fixo ou
+# um intervalo (min, max) sorteado por partícula; `lifetime` None usa o padrão (6-10 frames)
+EmitterPreset = namedtuple('EmitterPreset', ['color', 'alpha', 'size', 'speed', 'count', 'lifetime'])
+
+def compile_emitter_presets(sprite_configs):
+    """
+    Compila os presets de emissores a partir das seções "effects" das configurações de sprite.
+    Sub-dicionários (ex.: "impact") viram presets próprios que herdam os valores do efeito pai.
+    :param sprite_configs: Dicionário {prefixo: configuração}, ex.: {"player": PLAYER_SPRITE}
+    :return: Dicionário {"prefixo.efeito[.sub]": EmitterPreset}
+    """
+    presets = {}
+
+    def compile_effect(name, config, parent):
+        preset = EmitterPreset(
+            color=tuple(config.get("particle_color", config.get("color", parent.color))),
+            alpha=config.get("particle_alpha", config.get("alpha", parent.alpha)),
+            size=config.get("particle_size", parent.size),
+            speed=config.get("particle_speed", parent.speed),
+            count=config.get("particle_count", parent.count),
+            lifetime=config.get("particle_lifetime", parent.lifetime)
+        )
+        presets[name] = preset
+        for key, value in config.items():
+            if isinstance(value, dict):
+                compile_effect(f"{name}.{key}", value, preset)
+
+    default = EmitterPreset(color=(255, 255, 255), alpha=255, size=3, speed=2, count=5, lifetime=None)
+    for prefix, sprite_config in sprite_configs.items():
+        for effect_name, config in sprite_config.get("effects", {}).items():
+            compile_effect(f"{prefix}.{effect_name}", config, default)
+    return presets
 
 class EffectManager:
-    def __init__(self):
-        self.particles = []
+    def __init__(self, max_particles=4096, sprite_cache=None, blend_mode=BLEND_ALPHA, presets=None):
+        self.particles = ParticlePool(max_particles)
+        self.presets = presets if presets is not None else {}
+        self.glow_cache = sprite_cache if sprite_cache is not None else glow_cache
+        self.blend_mode = blend_mode
+        self.budget = ParticleBudget(max_particles=max_particles)
         self.trails = {}
+        self.trail_renderer = trail_renderer
+        self.last_culled = 0  # Partículas e rastros fora do viewport no último draw
+        self.last_drawn = 0   # Partículas desenhadas no último draw
+        self.last_bounds = None  # Área da tela coberta por partículas e rastros no último draw
+
+    @property
+    def particle_scale(self):
+        # Fator de escala atual do orçamento (para instrumentação)
+        return self.budget.scale
+
+    def record_frame_time(self, frame_ms):
+        self.budget.record_frame_time(frame_ms)
 
     def create_particles(self, x, y, color, count=5, speed=2, alpha=255, size=3, lifetime=None):
-        for _ in range(count):
-            angle = random.uniform(0, math.pi * 2)
-            speed_x = math.cos(angle) * speed
-            speed_y = math.sin(angle) * speed
-            # Tempo de vida um pouco maior para efeitos de ataque
-            particle_lifetime = lifetime if lifetime is not None else random.randint(6, 10)
-            
-            # Criar partícula com tamanho aleatório para mais dinamismo
-            particle_size = random.uniform(size * 0.8, size * 1.2)
-            
-            # Adicionar variação de cor para mais dinamismo
-            color_variation = 20
-            varied_color = tuple(
-                min(255, max(0, c + random.randint(-color_variation, color_variation)))
-                for c in color
-            )
-            
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'speed_x': speed_x,
-                'speed_y': speed_y,
-                'color': varied_color,
-                'alpha': min(alpha, 250),  # Permitir alpha mais alto inicialmente
-                'size': particle_size,
-                'lifetime': particle_lifetime,
-                'original_size': particle_size,  # Guardar tamanho original para efeito de encolhimento
-                'glow_size': particle_size * 2  # Tamanho do brilho externo
-            })
-
-    def create_trail(self, name, color):
-        self.trails[name] = {
-            'positions': [],
-            'max_length': 3,  # Aumentado para 3 para trail mais visível
-            'color': color,
-            'fade_speed': 20
-        }
+        preset = EmitterPreset(color=color, alpha=alpha, size=size, speed=speed, count=count, lifetime=lifetime)
+        self.emit_points(x, y, preset)
+
+    def resolve_preset(self, preset, overrides):
+        if isinstance(preset, str):
+            preset = self.presets[preset]
+        return preset._replace(**overrides) if overrides else preset
+
+    def emit_points(self, xs, ys, preset, count=None):
+        """
+        Cria partículas em lote a partir de um ou mais pontos de origem
+        :param xs, ys: Coordenadas dos pontos (escalares ou arrays)
+        :param preset: EmitterPreset com cor, alpha, tamanho, velocidade e tempo de vida
+        :param count: Partículas por ponto (padrão: preset.count)
+        :return: Número de partículas criadas
+        """
+        xs = np.atleast_1d(np.asarray(xs, dtype=np.float64))
+        ys = np.atleast_1d(np.asarray(ys, dtype=np.float64))
+        per_point = preset.count if count is None else count
+        requested = per_point * len(xs)
+        if requested <= 0:
+            return 0
+
+        rng = self.particles.rng
+        lifetime = preset.lifetime
+        total = self.budget.scale_count(requested, preset.alpha, lifetime if lifetime is not None else 8, rng)
+        if total <= 0:
+            return 0
+
+        # Distribuir as partículas entre os pontos (sorteando quais sobram se o orçamento cortou)
+        origin = np.repeat(np.arange(len(xs)), per_point)
+        if total < requested:
+            origin = rng.choice(origin, total, replace=False)
+
+        angle = rng.uniform(0, math.pi * 2, total)
+        if isinstance(preset.speed, (tuple, list)):
+            speed = rng.uniform(preset.speed[0], preset.speed[1], total)
+        else:
+            speed = preset.speed
+        speed_x = np.cos(angle) * speed
+        speed_y = np.sin(angle) * speed
+        # Tempo de vida um pouco maior para efeitos de ataque
+        particle_lifetime = lifetime if lifetime is not None else rng.integers(6, 11, total)
+
+        # Criar partícula com tamanho aleatório para mais dinamismo
+        particle_size = rng.uniform(preset.size * 0.8, preset.size * 1.2, total)
+
+        # Adicionar variação de cor para mais dinamismo
+        color_variation = 20
+        varied_color = np.clip(
+            np.asarray(preset.color, dtype=np.int32) + rng.integers(-color_variation, color_variation + 1, (total, 3)),
+            0, 255
+        )
+
+        return self.particles.emit(
+            xs[origin], ys[origin], speed_x, speed_y, varied_color,
+            min(preset.alpha, 250),  # Permitir alpha mais alto inicialmente
+            particle_size, particle_lifetime
+        )
+
+    def emit_burst(self, x, y, preset, count=None, bursts=1, spread=0, **overrides):
+        """
+        Explosão de partículas em um ponto
+        :param bursts: Número de explosões sobrepostas
+        :param spread: Deslocamento aleatório máximo (em pixels) do centro de cada explosão
+        :param overrides: Campos do preset a substituir (ex.: color=...)
+        """
+        preset = self.resolve_preset(preset, overrides)
+        rng = self.particles.rng
+        xs = x + rng.integers(-spread, spread + 1, bursts) if spread else np.full(bursts, x, dtype=np.float64)
+        ys = y + rng.integers(-spread, spread + 1, bursts) if spread else np.full(bursts, y, dtype=np.float64)
+        return self.emit_points(xs, ys, preset, count)
+
+    def emit_arc(self, start, end, preset, points=8, height=20, count=None, **overrides):
+        """
+        Partículas distribuídas ao longo de um arco entre dois pontos
+        :param start, end: Pontos (x, y) inicial e final do arco
+        :param points: Número de pontos de emissão no arco
+        :param height: Altura máxima do arco (positivo curva para baixo)
+        """
+        preset = self.resolve_preset(preset, overrides)
+        progress = np.linspace(0, 1, points)
+        xs = start[0] + (end[0] - start[0]) * progress
+        ys = start[1] + (end[1] - start[1]) * progress + np.sin(progress * math.pi) * height
+        return self.emit_points(xs, ys, preset, count)
+
+    def emit_ring(self, x, y, radius, preset, points=12, count=None, **overrides):
+        """
+        Partículas distribuídas em um anel ao redor de um centro
+        :param radius: Raio do anel
+        :param points: Número de pontos de emissão no anel
+        """
+        preset = self.resolve_preset(preset, overrides)
+        angle = np.arange(points) / points * math.pi * 2
+        return self.emit_points(x + np.cos(angle) * radius, y + np.sin(angle) * radius, preset, count)
+
+    def emit_spiral(self, x, y, preset, radius=30, arms=12, step=5, count=None, **overrides):
+        """
+        Partículas em raios concêntricos (espiral de energia) ao redor de um centro
+        :param radius: Raio máximo (exclusivo)
+        :param arms: Número de direções (ângulos) da espiral
+        :param step: Distância entre pontos consecutivos de cada direção
+        """
+        preset = self.resolve_preset(preset, overrides)
+        angle = np.repeat(np.arange(arms) / arms * math.pi * 2, len(range(0, radius, step)))
+        distance = np.tile(np.arange(0, radius, step), arms)
+        return self.emit_points(x + np.cos(angle) * distance, y + np.sin(angle) * distance, preset, count)
+
+    def create_trail(self, name, color, length=3, **options):
+        # Comprimento padrão 3 para trail mais visível
+        self.trails[name] = Trail(color, length=length, **options)
+        return self.trails[name]
+
+    def remove_trail(self, name):
+        self.trails.pop(name, None)
 
     def update(self):
-        # Atualizar partículas com fade e encolhimento
-        for particle in self.particles[:]:
-            particle['x'] += particle['speed_x']
-            particle['y'] += particle['speed_y']
-            particle['lifetime'] -= 1
-            
-            # Fade mais suave no início e mais rápido no final
-            life_ratio = particle['lifetime'] / 10  # Assumindo tempo de vida máximo de 10
-            particle['alpha'] = int(particle['alpha'] * (0.7 + life_ratio * 0.3))
-            
-            # Encolher partícula conforme envelhece, mas manter tamanho mínimo
-            size_ratio = 0.3 + (life_ratio * 0.7)  # Manter pelo menos 30% do tamanho
-            particle['size'] = particle['original_size'] * size_ratio
-            particle['glow_size'] = particle['size'] * (1.5 + life_ratio)  # Brilho diminui mais rápido
-            
-            # Adicionar movimento aleatório sutil
-            particle['speed_x'] += random.uniform(-0.1, 0.1)
-            particle['speed_y'] += random.uniform(-0.1, 0.1)
-            
-            # Remover partículas
-            if particle['lifetime'] <= 0 or particle['alpha'] < 30:
-                self.particles.remove(particle)
+        # Atualizar partículas com fade e encolhimento (vetorizado)
+        self.particles.update()
+
+        # Sob carga, descartar as partículas menos visíveis acima do limite
+        self.budget.culled += self.particles.cull(self.budget.particle_limit())
+
+        # Rastros que pararam de receber pontos somem aos poucos
+        for trail in self.trails.values():
+            trail.fade()
 
     def update_trail(self, name, x, y):
         if name in self.trails:
-            self.trails[name]['positions'].append((x, y))
-            if len(self.trails[name]['positions']) > self.trails[name]['max_length']:
-                self.trails[name]['positions'].pop(0)
+            self.trails[name].add_point(x, y)
 
-    def draw(self, surface):
-        # Desenhar partículas com efeito de brilho melhorado
-        for particle in self.particles:
-            # Desenhar brilho externo com gradiente
-            glow_radius = int(particle['glow_size'])
-            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            
-            # Criar gradiente de brilho
-            for r in range(glow_radius, 0, -1):
-                alpha = int((r / glow_radius) * particle['alpha'] * 0.3)
-                pygame.draw.circle(glow_surface, (*particle['color'], alpha),
-                                (glow_radius, glow_radius), r)
-            
-            # Posicionar o brilho
-            glow_pos = (int(particle['x'] - glow_radius), int(particle['y'] - glow_radius))
-            surface.blit(glow_surface, glow_pos)
-            
-            # Desenhar partícula principal com brilho interno
-            core_size = int(particle['size'])
-            if core_size > 0:
-                # Brilho interno mais intenso
-                pygame.draw.circle(surface, (*particle['color'], particle['alpha']),
-                                (int(particle['x']), int(particle['y'])),
-                                core_size)
-                # Centro mais brilhante
-                bright_color = tuple(min(c + 50, 255) for c in particle['color'])
-                pygame.draw.circle(surface, (*bright_color, particle['alpha']),
-                                (int(particle['x']), int(particle['y'])),
-                                max(1, core_size // 2))
+    def draw(self, surface, viewport=None, offset=(0, 0)):
+        """
+        :param viewport: Retângulo (em coordenadas do mundo) fora do qual partículas e
+                         rastros não são desenhados; None desenha tudo
+        :param offset: Deslocamento da câmera subtraído das posições do mundo ao desenhar
+        """
+        # Todos os rastros (dash do jogador e inimigos) em uma única passada
+        self.trail_renderer.draw(surface, self.trails.values(), offset, viewport)
+        self.last_culled = self.trail_renderer.last_culled
+        self.last_drawn = 0
+        self.last_bounds = self.trail_renderer.last_bounds
+
+        pool = self.particles
+        n = pool.count
+        if n == 0:
+            return
+
+        # Raios e posições calculados de forma vetorizada
+        glow_radii = pool.glow_size[:n].astype(np.int32)
+        core_radii = pool.size[:n].astype(np.int32)
+        radii = np.maximum(glow_radii, core_radii)
+        drawable = radii > 0
+        if viewport is not None:
+            # Descartar de uma vez as partículas cujo círculo não cruza o viewport
+            xs = pool.pos[:n, 0]
+            ys = pool.pos[:n, 1]
+            on_screen = ((xs + radii >= viewport.left) & (xs - radii < viewport.right) &
+                         (ys + radii >= viewport.top) & (ys - radii < viewport.bottom))
+            self.last_culled += int(np.count_nonzero(drawable & ~on_screen))
+            drawable &= on_screen
+        visible = np.flatnonzero(drawable)
+        self.last_drawn = len(visible)
+        if len(visible) == 0:
+            return
+        dest_x = (pool.pos[visible, 0] - (radii[visible] + offset[0])).astype(np.int32)
+        dest_y = (pool.pos[visible, 1] - (radii[visible] + offset[1])).astype(np.int32)
+
+        # Retângulo que envolve todas as partículas (cada sprite tem 2 * raio de lado)
+        sizes = radii[visible] * 2
+        left, top = int(dest_x.min()), int(dest_y.min())
+        particle_bounds = pygame.Rect(left, top, int((dest_x + sizes).max()) - left,
+                                      int((dest_y + sizes).max()) - top)
+        self.last_bounds = particle_bounds.union(self.last_bounds) if self.last_bounds else particle_bounds
+        dest_x = dest_x.tolist()
+        dest_y = dest_y.tolist()
+
+        # Cada partícula vira um único sprite (brilho + núcleo) vindo do cache
+        keys = self.glow_cache.particle_keys(
+            pool.color[visible], glow_radii[visible], core_radii[visible],
+            pool.alpha[visible], self.blend_mode
+        )
+        lookup = self.glow_cache.lookup
+        flags = BLEND_FLAGS[self.blend_mode]
+        if flags:
+            batch = [(lookup(key), (x, y), None, flags) for key, x, y in zip(keys, dest_x, dest_y)]
+        else:
+            batch = [(lookup(key), (x, y)) for key, x, y in zip(keys, dest_x, dest_y)]
+
+        # Enviar todos os blits em uma única chamada
+        surface.blits(batch, doreturn=False)
 
     def create_attack_effect(self, rect, config, direction="right"):
         surface = pygame.Surface((rect.width, rect.height), pygame.SRCALPHA)
@@ -0,0 +1,105 @@
+import pygame
+
+# Cor transparente das camadas convertidas para colorkey
+PARALLAX_COLORKEY = (255, 0, 255)
+
+class ParallaxLayer:
+    """
+    Camada do background com fator de rolagem próprio.
+    Camadas com transparência são recortadas para a faixa horizontal que tem pixels
+    visíveis, então as linhas vazias (céu das camadas de prédios) não são blitadas.
+    :param image: Imagem da camada, já na altura da tela
+    :param factor: Fração do scroll da câmera aplicada à camada (0 = parada, 1 = junto com o mundo)
+    :param screen_width: Largura da tela; a camada é alargada se for mais estreita
+    """
+    def __init__(self, image, factor, screen_width):
+        self.factor = factor
+        self.opaque = not image.get_flags() & pygame.SRCALPHA
+
+        # Garantir que a camada cobre a tela inteira com no máximo duas cópias
+        if image.get_width() < screen_width:
+            height = int(image.get_height() * screen_width / image.get_width())
+            image = pygame.transform.scale(image, (screen_width, height))
+
+        self.y = 0
+        if not self.opaque:
+            bounds = image.get_bounding_rect()
+            if bounds.height > 0 and bounds.height < image.get_height():
+                # Manter a largura inteira para a camada continuar emendando nas bordas
+                self.y = bounds.top
+                image = image.subsurface((0, bounds.top, image.get_width(), bounds.height)).copy()
+            # Pixel art costuma ter alpha só 0 ou 255: nesse caso um colorkey com RLE
+            # desenha muito mais rápido que alpha por pixel
+            if pygame.mask.from_surface(image, 0).count() == pygame.mask.from_surface(image, 254).count():
+                keyed = pygame.Surface(image.get_size()).convert()
+                keyed.fill(PARALLAX_COLORKEY)
+                keyed.blit(image, (0, 0))
+                keyed.set_colorkey(PARALLAX_COLORKEY, pygame.RLEACCEL)
+                image = keyed
+        self.image = image
+        self.width = image.get_width()
+
+    def scaled(self, scale):
+        # Cópia da camada para um framebuffer de resolução reduzida
+        layer = ParallaxLayer.__new__(ParallaxLayer)
+        layer.factor = self.factor * scale
+        layer.opaque = self.opaque
+        layer.width = max(1, round(self.width * scale))
+        layer.image = pygame.transform.scale(self.image, (layer.width, max(1, round(self.image.get_height() * scale))))
+        colorkey = self.image.get_colorkey()
+        if colorkey is not None:
+            layer.image.set_colorkey(colorkey, pygame.RLEACCEL)
+        layer.y = round(self.y * scale)
+        return layer
+
+    def positions(self, scroll, screen_width):
+        # Deslocamento da camada e, se a borda direita aparecer, a cópia seguinte
+        x = -int(scroll * self.factor) % self.width
+        if x > 0:
+            x -= self.width
+        positions = [(x, self.y)]
+        if x + self.width < screen_width:
+            positions.append((x + self.width, self.y))
+        return positions
+
+class ParallaxBackground:
+    """
+    Background em camadas com rolagem parallax.
+    Cada camada é carregada e escalada uma única vez e desenhada com no máximo dois
+    blits por frame, todos enviados em uma única chamada de blits().
+    :param width: Largura da tela
+    :param height: Altura da tela
+    :param layers: Lista de (imagem, fator de rolagem), do fundo para a frente
+    """
+    def __init__(self, width, height, layers):
+        self.width = width
+        self.height = height
+        self.layers = [ParallaxLayer(image, factor, width) for image, factor in layers]
+        self.scaled_layers = {}  # Escala -> camadas reduzidas (criadas no primeiro uso)
+        self.last_blits = 0
+
+    def layers_for(self, scale):
+        if scale == 1:
+            return self.layers
+        layers = self.scaled_layers.get(scale)
+        if layers is None:
+            layers = [layer.scaled(scale) for layer in self.layers]
+            self.scaled_layers[scale] = layers
+        return layers
+
+    def draw(self, surface, scroll, scale=1.0):
+        """
+        :param scroll: Posição horizontal da câmera no mundo
+        :param scale: Escala do framebuffer em que o background é desenhado
+        """
+        blits = []
+        width = round(self.width * scale)
+        for layer in self.layers_for(scale):
+            for position in layer.positions(scroll, width):
+                blits.append((layer.image, position))
+        surface.blits(blits, doreturn=False)
+        self.last_blits = len(blits)
+
+    def memory_bytes(self):
+        return sum(layer.image.get_width() * layer.image.get_height() * layer.image.get_bytesize()
+                   for layer in self.layers)
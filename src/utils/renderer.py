@@ -0,0 +1,233 @@
+import pygame
+
+class DirtyRenderer:
+    """
+    Envio da tela por áreas alteradas (dirty rects).
+    Enquanto a câmera está parada, o cenário estático (background e chão) fica guardado em
+    uma superfície: a cada frame só as áreas desenhadas no frame anterior são restauradas a
+    partir dela, e só essas áreas mais as do frame atual vão para pygame.display.update(rects).
+    Quando o scroll muda (ou o frame é invalidado), o cenário é redesenhado e a tela inteira
+    é enviada com flip. Desligado, todo frame é desenhado e enviado por inteiro.
+    :param screen: Superfície da janela
+    :param enabled: Ativa o modo de áreas alteradas
+    :param max_rects: Acima desse número de áreas, enviar a tela inteira sai mais barato
+    """
+    def __init__(self, screen, enabled=False, max_rects=64):
+        self.screen = screen
+        self.enabled = enabled
+        self.max_rects = max_rects
+        self.bounds = screen.get_rect()
+        self.backdrop = pygame.Surface(screen.get_size()).convert() if enabled else None
+        self.scroll = None        # Scroll com que o cenário guardado foi desenhado
+        self.static_key = None    # Tela parada (menu de opções etc.) já enviada
+        self.full = True          # O frame atual precisa ser enviado por inteiro
+        self.skip = False         # Nada mudou: não há o que enviar
+        self.previous = []        # Áreas desenhadas no frame anterior
+        self.current = []         # Áreas desenhadas no frame atual
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.skipped_frames = 0
+        self.last_pixels = 0      # Pixels enviados no último frame
+
+    def invalidate(self):
+        # O próximo frame redesenha o cenário e envia a tela inteira (troca de estado, overlays)
+        self.scroll = None
+        self.static_key = None
+        self.full = True
+        self.skip = False
+        self.current = []
+
+    def begin(self, scroll, draw_backdrop):
+        """
+        Prepara a tela para um frame do jogo
+        :param scroll: Posição da câmera; se mudou desde o último frame, tudo é redesenhado
+        :param draw_backdrop: Função que desenha o cenário estático na superfície recebida
+        """
+        self.current = []
+        self.skip = False
+        self.static_key = None
+        if not self.enabled:
+            draw_backdrop(self.screen)
+            self.full = True
+            return
+        self.full = scroll != self.scroll
+        if self.full:
+            draw_backdrop(self.backdrop)
+            self.screen.blit(self.backdrop, (0, 0))
+            self.scroll = scroll
+        else:
+            # Apagar o que foi desenhado no frame anterior restaurando o cenário por baixo
+            backdrop = self.backdrop
+            self.screen.blits([(backdrop, rect, rect) for rect in self.previous], doreturn=False)
+
+    def begin_static(self, key, changed=False, animated=()):
+        """
+        Para telas paradas (opções, créditos, controles): a tela inteira só é enviada quando
+        algum evento pode tê-la mudado; fora isso, só as áreas animadas (ex.: brilho do botão
+        em hover) são enviadas, e sem elas não há nada a enviar
+        :param key: Identificador da tela
+        :param changed: Houve evento neste frame que pode ter mudado a tela
+        :param animated: Áreas que mudam a cada desenho mesmo sem eventos
+        :return: True se a tela precisa ser desenhada neste frame
+        """
+        self.current = []
+        if not self.enabled or changed or key != self.static_key:
+            self.invalidate()
+            self.static_key = key
+            return True
+        if animated:
+            # O desenho é o mesmo fora dessas áreas: basta enviá-las
+            self.full = False
+            self.skip = False
+            self.current = list(animated)
+            return True
+        self.skip = True
+        return False
+
+    @property
+    def tracking(self):
+        # As chamadas de desenho só precisam devolver as áreas quando o modo está ativo
+        return self.enabled
+
+    def add(self, rect):
+        if rect and self.enabled:
+            self.current.append(rect)
+
+    def add_many(self, rects):
+        if rects and self.enabled:
+            self.current.extend(rect for rect in rects if rect)
+
+    def present(self):
+        if self.skip:
+            self.skipped_frames += 1
+            self.last_pixels = 0
+            return
+        bounds = self.bounds
+        current = [rect.clip(bounds) for rect in self.current]
+        current = [rect for rect in current if rect]
+        rects = self.previous + current
+        if self.full or len(rects) > self.max_rects:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.last_pixels = bounds.width * bounds.height
+        else:
+            pygame.display.update(rects)
+            self.partial_frames += 1
+            self.last_pixels = sum(rect.width * rect.height for rect in rects)
+        self.previous = current
+
+    def stats(self):
+        return {
+            'enabled': self.enabled,
+            'full_frames': self.full_frames,
+            'partial_frames': self.partial_frames,
+            'skipped_frames': self.skipped_frames,
+            'last_pixels': self.last_pixels
+        }
+
+# Escalas de renderização oferecidas (frações da resolução da janela). Só fatores inteiros de
+# ampliação: com 0.75 o transform.scale fracionário custa mais do que o preenchimento economizado
+RENDER_SCALES = (1.0, 0.5)
+
+class ScaledFramebuffer:
+    """
+    Framebuffer interno com resolução reduzida para as camadas que cobrem a tela inteira
+    (background parallax e chão), que concentram o custo de preenchimento. Elas são
+    desenhadas em uma superfície menor e ampliadas uma única vez por frame para o destino;
+    sprites, efeitos e HUD continuam na resolução da janela.
+    No modo automático a escala desce um nível quando o tempo de frame passa do orçamento
+    e volta a subir quando há folga.
+    :param size: Tamanho da janela (largura, altura)
+    :param scale: Escala inicial (1.0 = resolução da janela)
+    :param auto: Ajustar a escala automaticamente pelo tempo de frame
+    :param target_frame_ms: Orçamento de tempo por frame em milissegundos
+    :param levels: Escalas permitidas, da maior para a menor
+    """
+    def __init__(self, size, scale=1.0, auto=False, target_frame_ms=1000 / 60, levels=RENDER_SCALES):
+        self.size = size
+        self.levels = levels
+        self.auto = auto
+        self.target_frame_ms = target_frame_ms
+        self.smoothing = 0.1
+        self.cooldown_frames = 60  # Frames mínimos entre duas trocas automáticas
+        self.frames_since_change = 0
+        self.frames_measured = 0
+        self.average_frame_ms = 0.0
+        self.changes = 0
+        self.scale = 1.0
+        self.surface = None
+        self.set_scale(scale)
+
+    def set_mode(self, mode):
+        """
+        :param mode: "auto" ou uma das escalas de levels
+        :raises ValueError: Se a escala não é um dos níveis
+        """
+        if mode == "auto":
+            self.auto = True
+        elif mode not in self.levels:
+            raise ValueError(f"escala {mode} fora dos níveis suportados {self.levels}")
+        else:
+            self.auto = False
+            self.set_scale(mode)
+
+    @property
+    def mode(self):
+        return "auto" if self.auto else self.scale
+
+    def set_scale(self, scale):
+        """
+        :return: True se a escala mudou
+        """
+        scale = min(self.levels, key=lambda level: abs(level - scale))
+        if scale == self.scale:
+            return False
+        self.scale = scale
+        if scale == 1.0:
+            self.surface = None
+        else:
+            self.surface = pygame.Surface((round(self.size[0] * scale), round(self.size[1] * scale))).convert()
+        self.frames_since_change = 0
+        self.changes += 1
+        return True
+
+    def record_frame_time(self, frame_ms):
+        """
+        Média móvel exponencial do tempo de frame; no modo automático ajusta a escala
+        :return: True se a escala mudou (quem guarda o cenário desenhado deve invalidá-lo)
+        """
+        if self.frames_measured == 0:
+            self.average_frame_ms = frame_ms
+        else:
+            self.average_frame_ms += (frame_ms - self.average_frame_ms) * self.smoothing
+        self.frames_measured += 1
+        self.frames_since_change += 1
+        if not self.auto or self.frames_since_change < self.cooldown_frames:
+            return False
+
+        index = self.levels.index(self.scale)
+        if self.average_frame_ms > self.target_frame_ms and index + 1 < len(self.levels):
+            # Acima do orçamento: reduzir a resolução interna
+            return self.set_scale(self.levels[index + 1])
+        if self.average_frame_ms < self.target_frame_ms * 0.6 and index > 0:
+            # Com folga de sobra: voltar para a resolução maior (margem larga para não oscilar)
+            return self.set_scale(self.levels[index - 1])
+        return False
+
+    def target(self, destination):
+        # Superfície em que as camadas devem ser desenhadas neste frame
+        return destination if self.surface is None else self.surface
+
+    def present(self, destination):
+        # Ampliar o framebuffer direto para o destino (sem superfície intermediária)
+        if self.surface is not None:
+            pygame.transform.scale(self.surface, destination.get_size(), destination)
+
+    def stats(self):
+        return {
+            'mode': self.mode,
+            'scale': self.scale,
+            'resolution': self.surface.get_size() if self.surface is not None else self.size,
+            'average_frame_ms': self.average_frame_ms,
+            'changes': self.changes
+        }
@@ -0,0 +1,79 @@
+import pygame
+
+class TileMap:
+    """
+    Mapa de tiles guardado como índices e desenhado em blocos (chunks) pré-renderizados.
+    Cada chunk tem largura fixa e é renderizado uma única vez; por frame só os chunks que
+    cruzam a câmera são blitados, então o custo não cresce com o tamanho da fase.
+    :param tiles: Lista de superfícies dos tiles (o índice -1 é vazio)
+    :param grid: Lista de linhas, cada uma uma lista de índices de tiles
+    :param tile_size: Tamanho (em pixels) de cada tile
+    :param chunk_width: Largura de cada chunk em pixels (arredondada para tiles inteiros)
+    :param colorkey: Cor transparente dos chunks (acelerada com RLE)
+    """
+    def __init__(self, tiles, grid, tile_size, chunk_width=512, colorkey=(0, 0, 0)):
+        self.tiles = tiles
+        self.grid = grid
+        self.tile_size = tile_size
+        self.columns = max(len(row) for row in grid) if grid else 0
+        self.rows = len(grid)
+        self.chunk_columns = max(1, chunk_width // tile_size)
+        self.chunk_width = self.chunk_columns * tile_size
+        self.colorkey = colorkey
+        self.width = self.columns * tile_size
+        self.height = self.rows * tile_size
+        self.chunks = [self.render_chunk(start) for start in range(0, self.columns, self.chunk_columns)]
+        self.scaled_chunks = {}  # Escala -> chunks reduzidos (criados no primeiro uso)
+        self.last_blits = 0
+
+    def render_chunk(self, start_column):
+        columns = min(self.chunk_columns, self.columns - start_column)
+        chunk = pygame.Surface((columns * self.tile_size, self.height)).convert()
+        chunk.fill(self.colorkey)
+        for row_index, row in enumerate(self.grid):
+            for column in range(start_column, min(start_column + columns, len(row))):
+                tile_index = row[column]
+                if tile_index >= 0:
+                    chunk.blit(self.tiles[tile_index],
+                               ((column - start_column) * self.tile_size, row_index * self.tile_size))
+        chunk.set_colorkey(self.colorkey, pygame.RLEACCEL)
+        return chunk
+
+    def chunks_for(self, scale):
+        if scale == 1:
+            return self.chunks
+        chunks = self.scaled_chunks.get(scale)
+        if chunks is None:
+            chunks = []
+            for chunk in self.chunks:
+                scaled = pygame.transform.scale(chunk, (round(chunk.get_width() * scale),
+                                                        round(chunk.get_height() * scale)))
+                scaled.set_colorkey(self.colorkey, pygame.RLEACCEL)
+                chunks.append(scaled)
+            self.scaled_chunks[scale] = chunks
+        return chunks
+
+    def visible_chunks(self, scroll, view_width):
+        """
+        :return: Intervalo (primeiro, último + 1) dos chunks que cruzam a área visível
+        """
+        first = max(0, int(scroll) // self.chunk_width)
+        last = min(len(self.chunks), (int(scroll) + view_width - 1) // self.chunk_width + 1)
+        return first, last
+
+    def draw(self, surface, scroll, y, x=0, scale=1.0):
+        """
+        Desenha os chunks visíveis
+        :param scroll: Posição horizontal da câmera no mundo
+        :param y: Posição vertical do mapa na tela
+        :param x: Posição do início do mapa no mundo
+        :param scale: Escala do framebuffer em que o mapa é desenhado
+        """
+        first, last = self.visible_chunks(scroll - x, round(surface.get_width() / scale))
+        chunks = self.chunks_for(scale)
+        surface.blits([(chunks[index], (round((x + index * self.chunk_width - scroll) * scale), round(y * scale)))
+                       for index in range(first, last)], doreturn=False)
+        self.last_blits = max(0, last - first)
+
+    def memory_bytes(self):
+        return sum(chunk.get_width() * chunk.get_height() * chunk.get_bytesize() for chunk in self.chunks)
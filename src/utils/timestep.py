@@ -0,0 +1,56 @@
+from src.sprites.animation import FRAME_MS
+
+class FixedTimestep:
+    """
+    Acumulador de passo fixo: a simulação avança sempre em passos de step_ms, não importa
+    quanto tempo o desenho levou. O tempo real de cada frame entra no acumulador e sai em
+    passos inteiros; a sobra vira o fator de interpolação usado no desenho.
+    Se o frame demorar demais, no máximo max_steps passos são executados e o resto do
+    atraso é descartado, para o jogo não entrar em espiral tentando se recuperar.
+    :param step_ms: Duração de um passo da simulação em milissegundos
+    :param max_steps: Máximo de passos por frame
+    """
+    def __init__(self, step_ms=FRAME_MS, max_steps=5):
+        self.step_ms = step_ms
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.time_ms = 0.0       # Tempo simulado desde o início
+        self.steps = 0           # Passos executados desde o início
+        self.dropped_ms = 0.0    # Atraso descartado pelo limite de passos
+        self.last_steps = 0
+
+    def advance(self, dt_ms):
+        """
+        :param dt_ms: Tempo real desde o último frame em milissegundos
+        :return: Quantos passos da simulação executar neste frame
+        """
+        self.accumulator += dt_ms
+        steps = int(self.accumulator // self.step_ms)
+        if steps > self.max_steps:
+            self.dropped_ms += (steps - self.max_steps) * self.step_ms
+            self.accumulator -= (steps - self.max_steps) * self.step_ms
+            steps = self.max_steps
+        self.accumulator -= steps * self.step_ms
+        self.time_ms += steps * self.step_ms
+        self.steps += steps
+        self.last_steps = steps
+        return steps
+
+    @property
+    def alpha(self):
+        # Fração do próximo passo já decorrida (0 = último estado simulado, 1 = próximo)
+        return self.accumulator / self.step_ms
+
+    def reset(self):
+        # Descartar o tempo acumulado (ex.: ao voltar de um menu, para não simular a pausa)
+        self.accumulator = 0.0
+
+    def stats(self):
+        return {
+            'step_ms': self.step_ms,
+            'steps': self.steps,
+            'time_ms': self.time_ms,
+            'dropped_ms': self.dropped_ms,
+            'last_steps': self.last_steps,
+            'alpha': self.alpha
+        }
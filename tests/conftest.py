@@ -0,0 +1,15 @@
+import os
+# Sem janela nem áudio: o SDL usa os drivers dummy (precisa vir antes de importar o pygame)
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+import pygame
+import pytest
+
+@pytest.fixture(scope="session", autouse=True)
+def display():
+    # convert()/convert_alpha() exigem um modo de vídeo definido
+    pygame.display.init()
+    screen = pygame.display.set_mode((64, 64))
+    yield screen
+    pygame.display.quit()
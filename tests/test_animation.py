@@ -0,0 +1,56 @@
+import pygame
+from src.sprites.animation import AnimationPlayer, compile_animation_timings
+from src.sprites.sprite_manager import AnimationFrames
+
+CONFIG = {"animations": {
+    "idle": {"row": 0, "frames": 4, "duration": 100},
+    "running": {"row": 1, "frames": 3, "duration": 50}
+}}
+
+def make_player(idle_frames=4, running_frames=3):
+    frames = AnimationFrames({
+        "idle": [pygame.Surface((2, 1)) for _ in range(idle_frames)],
+        "running": [pygame.Surface((2, 1)) for _ in range(running_frames)]
+    })
+    return AnimationPlayer(frames, compile_animation_timings(CONFIG))
+
+def test_timings_are_compiled_in_milliseconds():
+    assert compile_animation_timings(CONFIG) == {"idle": (100.0, 4), "running": (50.0, 3)}
+
+def test_frame_holds_until_its_duration_has_elapsed():
+    player = make_player()
+    assert not player.update(60)
+    assert player.frame_index == 0
+    assert player.update(40)
+    assert player.frame_index == 1
+    assert player.elapsed == 0
+
+def test_long_updates_skip_frames_and_keep_the_remainder():
+    player = make_player()
+    assert player.update(250)
+    assert player.frame_index == 2
+    assert player.elapsed == 50
+
+def test_animation_loops_back_to_the_first_frame():
+    player = make_player()
+    player.update(400)
+    assert player.frame_index == 0
+    player.update(100)
+    assert player.frame_index == 1
+
+def test_frame_count_comes_from_the_loaded_frames():
+    # Fallback com um único frame: a animação fica parada nele
+    player = make_player(idle_frames=1)
+    player.update(1000)
+    assert player.frame_index == 0
+
+def test_changing_state_restarts_the_animation():
+    player = make_player()
+    player.update(150)
+    assert not player.set_state("idle")
+    assert player.frame_index == 1
+    assert player.set_state("running")
+    assert (player.frame_index, player.elapsed) == (0, 0)
+    player.update(50)
+    assert player.image() is player.frames.right["running"][1]
+    assert player.image(facing_right=False) is player.frames.left["running"][1]
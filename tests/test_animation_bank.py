@@ -0,0 +1,73 @@
+import pygame
+import pytest
+from src.sprites.sprite_manager import AnimationBank, AnimationFrames
+
+def build_set(calls):
+    def builder():
+        calls.append(1)
+        fallback = pygame.Surface((4, 2))
+        return AnimationFrames({"idle": [pygame.Surface((4, 2)), fallback], "hurt": [fallback]})
+    return builder
+
+def test_a_set_is_built_once_and_shared():
+    bank = AnimationBank()
+    calls = []
+    first = bank.get(("enemy", 2), build_set(calls))
+    second = bank.get(("enemy", 2), build_set(calls))
+    assert second is first
+    assert second["idle"] is first["idle"]
+    assert len(calls) == 1
+    assert bank.stats()['builds'] == 1
+    assert bank.stats()['requests'] == 2
+
+def test_each_key_gets_its_own_set():
+    bank = AnimationBank()
+    calls = []
+    assert bank.get(("enemy", 2), build_set(calls)) is not bank.get(("enemy", 3), build_set(calls))
+    assert bank.stats()['sets'] == 2
+
+def test_repeated_frames_count_once_in_memory():
+    bank = AnimationBank()
+    bank.get("enemy", build_set([]))
+    # Dois frames distintos de 4x2 por lado; o fallback repetido em "hurt" não conta de novo
+    frame_bytes = 4 * 2 * pygame.Surface((4, 2)).get_bytesize()
+    assert bank.memory_bytes() == 4 * frame_bytes
+    assert bank.stats()['frames'] == 6
+
+def test_frames_cut_from_an_atlas_page_are_reported_apart():
+    bank = AnimationBank()
+    page = pygame.Surface((16, 16), pygame.SRCALPHA)
+    views = {"idle": [page.subsurface((0, 0, 4, 2)), page.subsurface((4, 0, 4, 2))]}
+    bank.get("enemy", lambda: AnimationFrames.from_sides(views, views))
+    # Os pixels são da página do atlas, não do banco
+    assert bank.memory_bytes() == 0
+    assert bank.stats()['view_bytes'] == 2 * 4 * 2 * page.get_bytesize()
+
+def test_only_sheets_read_by_the_bank_count_as_loads(tmp_path):
+    bank = AnimationBank()
+    path = str(tmp_path / "sheet.png")
+    pygame.image.save(pygame.Surface((8, 4)), path)
+    assert bank.load_sheet(path).get_size() == (8, 4)
+    cached = pygame.Surface((8, 4))
+    assert bank.load_sheet("enemy/idle", lambda key: cached) is cached
+    with pytest.raises(pygame.error):
+        bank.load_sheet("enemy/missing", lambda key: None)
+    assert bank.stats()['sheet_loads'] == 1
+    assert bank.stats()['sheet_requests'] == 3
+
+@pytest.fixture(scope="module")
+def game():
+    from src.game import main as game
+    # Os inimigos precisam dos assets carregados e do mundo montado
+    if not game.world_built:
+        game.asset_manager.wait()
+        game.build_world()
+    return game
+
+def test_enemies_share_the_same_frame_lists(game):
+    first = game.Enemy(100, 500, game.player, game.platforms)
+    second = game.Enemy(300, 500, game.player, game.platforms)
+    assert second.animations is first.animations
+    for state in first.animations.keys():
+        assert second.animations[state] is first.animations[state]
+    assert second.image is first.image
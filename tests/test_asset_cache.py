@@ -0,0 +1,58 @@
+import os
+import pygame
+from src.utils.asset_cache import AssetCache, write_raw, read_raw
+
+def save_png(path, color, size=(8, 4)):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(color)
+    pygame.image.save(image, str(path))
+
+def cached_files(cache):
+    return sorted(os.listdir(cache.cache_dir))
+
+def test_second_load_comes_from_the_cache(tmp_path):
+    source = tmp_path / "sprite.png"
+    save_png(source, (255, 0, 0, 255))
+    cache = AssetCache(tmp_path / "cache", config_hash="a")
+    first = cache.load("enemy/idle", str(source), 2)
+    second = cache.load("enemy/idle", str(source), 2)
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'writes': 1}
+    assert second.get_size() == first.get_size() == (16, 8)
+    assert second.get_at((3, 3)) == (255, 0, 0, 255)
+    assert cached_files(cache)[0].startswith("enemy_idle-")
+
+def test_changed_source_invalidates_and_replaces_the_entry(tmp_path):
+    source = tmp_path / "sprite.png"
+    save_png(source, (255, 0, 0, 255))
+    cache = AssetCache(tmp_path / "cache")
+    cache.load("tileset", str(source))
+    old_files = cached_files(cache)
+    save_png(source, (0, 0, 255, 255))
+    image = cache.load("tileset", str(source))
+    assert cache.misses == 2
+    assert image.get_at((0, 0)) == (0, 0, 255, 255)
+    # A entrada antiga do mesmo asset é apagada
+    assert len(cached_files(cache)) == 1
+    assert cached_files(cache) != old_files
+
+def test_config_and_target_are_part_of_the_key(tmp_path):
+    source = tmp_path / "sprite.png"
+    save_png(source, (0, 255, 0, 255))
+    cache = AssetCache(tmp_path / "cache", config_hash=AssetCache.hash_config({"scale": 1}))
+    path, _ = cache.entry_path("player", str(source), None, "RGBA")
+    assert cache.entry_path("player", str(source), 2, "RGBA")[0] != path
+    assert cache.entry_path("player", str(source), None, "RGB")[0] != path
+    other = AssetCache(tmp_path / "cache", config_hash=AssetCache.hash_config({"scale": 2}))
+    assert other.entry_path("player", str(source), None, "RGBA")[0] != path
+    assert AssetCache.hash_config({"scale": 1}) == cache.config_hash
+
+def test_raw_buffer_round_trip_checks_the_pixel_format(tmp_path):
+    image = pygame.Surface((3, 2), pygame.SRCALPHA)
+    image.fill((10, 20, 30, 40))
+    path = str(tmp_path / "image.raw")
+    write_raw(path, image, "RGBA")
+    loaded = read_raw(path, "RGBA")
+    assert loaded.get_size() == (3, 2)
+    assert loaded.get_at((2, 1)) == (10, 20, 30, 40)
+    assert read_raw(path, "RGB") is None
+    assert read_raw(str(tmp_path / "missing.raw")) is None
@@ -0,0 +1,72 @@
+import pygame
+import pytest
+from src.utils import asset_pack
+from src.utils.asset_pack import AssetPack, build_pack, mount, open_resource, load_image, PACK_PREFIX
+
+@pytest.fixture
+def sources(tmp_path):
+    # Um PNG (não compensa comprimir) e um texto repetitivo (vai comprimido com zlib)
+    image = pygame.Surface((6, 5), pygame.SRCALPHA)
+    image.fill((30, 60, 90, 255))
+    image.set_at((1, 2), (250, 10, 10, 128))
+    (tmp_path / "assets" / "sub").mkdir(parents=True)
+    pygame.image.save(image, str(tmp_path / "assets" / "sub" / "tile.png"))
+    (tmp_path / "assets" / "notes.txt").write_bytes(b"solo leveling " * 200)
+    return tmp_path
+
+@pytest.fixture
+def pack_path(sources):
+    output = sources / "build" / "pack" / "assets.pak"
+    build_pack(str(output), ["assets/sub/tile.png", "./assets/notes.txt", "assets\\notes.txt"], str(sources))
+    return str(output)
+
+def test_build_stores_pngs_and_compresses_what_shrinks(sources):
+    files = build_pack(str(sources / "out.pak"), ["assets/sub/tile.png", "assets/notes.txt"], str(sources))
+    stored = {name: (stored, size) for name, stored, size in files}
+    png_size = (sources / "assets" / "sub" / "tile.png").stat().st_size
+    assert stored["assets/sub/tile.png"] == (png_size, png_size)
+    assert stored["assets/notes.txt"][0] < stored["assets/notes.txt"][1] == 14 * 200
+
+def test_paths_are_normalized_and_deduplicated(pack_path):
+    pack = AssetPack(pack_path)
+    try:
+        assert sorted(pack.entries) == ["assets/notes.txt", "assets/sub/tile.png"]
+        assert "./assets/sub/tile.png" in pack
+        assert "assets\\notes.txt" in pack
+        assert pack.entries["assets/notes.txt"][3] == 1
+        assert pack.entries["assets/sub/tile.png"][3] == 0
+    finally:
+        pack.close()
+
+def test_mounted_pack_round_trip(pack_path, sources, monkeypatch):
+    monkeypatch.setattr(asset_pack, "active_pack", None)
+    assert mount(pack_path)
+    try:
+        with open_resource(PACK_PREFIX + "assets/notes.txt") as f:
+            assert f.read() == b"solo leveling " * 200
+        with open_resource(PACK_PREFIX + "assets/sub/tile.png") as f:
+            assert f.read() == (sources / "assets" / "sub" / "tile.png").read_bytes()
+        image = load_image(PACK_PREFIX + "assets/sub/tile.png")
+        assert image.get_size() == (6, 5)
+        assert image.get_at((0, 0)) == (30, 60, 90, 255)
+        assert image.get_at((1, 2)) == (250, 10, 10, 128)
+    finally:
+        asset_pack.active_pack.close()
+
+def test_get_resource_path_prefers_the_pack_for_missing_files(pack_path, tmp_path, monkeypatch):
+    from src.utils.assets import get_resource_path
+    monkeypatch.setattr(asset_pack, "active_pack", AssetPack(pack_path))
+    monkeypatch.chdir(tmp_path / "build")
+    try:
+        assert get_resource_path("assets/sub/tile.png") == PACK_PREFIX + "assets/sub/tile.png"
+        assert get_resource_path("assets/other.png") == str(tmp_path / "build" / "assets" / "other.png")
+    finally:
+        asset_pack.active_pack.close()
+
+def test_invalid_pack_is_not_mounted(tmp_path, monkeypatch):
+    monkeypatch.setattr(asset_pack, "active_pack", None)
+    bogus = tmp_path / "bogus.pak"
+    bogus.write_bytes(b"NOPE" + bytes(16))
+    assert not mount(str(bogus))
+    assert not mount(str(tmp_path / "missing.pak"))
+    assert asset_pack.active_pack is None
@@ -0,0 +1,100 @@
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from src.sprites.atlas import TextureAtlas, MANIFEST_FILE
+from src.sprites.sprite_manager import AnimationFrames
+
+def solid(color, size=(10, 6)):
+    image = pygame.Surface(size, pygame.SRCALPHA)
+    image.fill(color)
+    return image
+
+def build_atlas(digest="abc123"):
+    atlas = TextureAtlas(page_size=64, digest=digest)
+    fallback = solid((255, 0, 0, 255))
+    atlas.animations("enemy", lambda: AnimationFrames({
+        "idle": [solid((0, 255, 0, 255)), solid((0, 0, 255, 128))],
+        "hurt": [fallback],
+        "death": [fallback]
+    }))
+    atlas.image("tiles", "grass", lambda: solid((10, 200, 10, 255), (16, 16)))
+    return atlas
+
+def test_frames_are_copied_exactly_into_the_pages():
+    atlas = build_atlas()
+    assert atlas.frame("enemy", "idle", 1).get_at((0, 0)) == (0, 0, 255, 128)
+    # Frames repetidos (ex.: fallback) ocupam um único lugar
+    assert atlas.entries[("enemy", "hurt", 0, 0)] == atlas.entries[("enemy", "death", 0, 0)]
+    assert atlas.has("enemy") and not atlas.has("player")
+    assert atlas.stats()['entries'] == 9
+
+def test_atlas_can_be_packed_in_a_worker_thread():
+    # Sem convert_alpha no empacotamento: o jogo monta o atlas num trabalho do asset_manager
+    opaque = pygame.Surface((4, 4))
+    opaque.fill((200, 10, 10))
+    opaque.set_colorkey((0, 0, 0))
+    opaque.fill((0, 0, 0), (0, 0, 2, 2))
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        atlas = executor.submit(build_atlas).result()
+        executor.submit(atlas.image, "arrow", "default", lambda: opaque).result()
+    assert atlas.frame("enemy", "idle", 0).get_at((0, 0)) == (0, 255, 0, 255)
+    arrow = atlas.frame("arrow", "default")
+    assert arrow.get_at((0, 0)) == (0, 0, 0, 0)
+    assert arrow.get_at((3, 3)) == (200, 10, 10, 255)
+    assert atlas.has("arrow")
+
+def test_animations_are_served_from_the_atlas_after_packing():
+    atlas = build_atlas()
+    animations = atlas.animations("enemy", lambda: 1 / 0)
+    assert animations.right["idle"][0].get_parent() is atlas.pages[0]
+    assert animations.left["idle"][1].get_at((9, 0)) == (0, 0, 255, 128)
+
+def test_trim_shrinks_the_last_page_to_the_used_height():
+    atlas = build_atlas()
+    height = atlas.cursor[1] + atlas.cursor[2]
+    atlas.trim()
+    assert atlas.pages[-1].get_size() == (64, height)
+    assert atlas.frame("tiles", "grass").get_at((15, 15)) == (10, 200, 10, 255)
+    # Depois do trim, novos frames vão para uma página nova
+    atlas.image("tiles", "dirt", lambda: solid((90, 60, 30, 255)))
+    assert len(atlas.pages) == 2
+
+def test_save_and_load_round_trip(tmp_path):
+    atlas = build_atlas()
+    atlas.trim()
+    atlas.save(str(tmp_path))
+    assert not atlas.dirty
+    loaded = TextureAtlas.load(str(tmp_path), "abc123")
+    assert loaded.loaded
+    assert loaded.entries == atlas.entries
+    assert loaded.has("enemy") and loaded.has("tiles") and not loaded.has("player")
+    assert [page.get_size() for page in loaded.pages] == [page.get_size() for page in atlas.pages]
+    for key in atlas.entries:
+        original, restored = atlas.view(key), loaded.view(key)
+        assert all(original.get_at((x, y)) == restored.get_at((x, y))
+                   for x in range(original.get_width()) for y in range(original.get_height()))
+
+def test_load_without_converting_keeps_the_pages_for_the_main_thread(tmp_path):
+    build_atlas().save(str(tmp_path))
+    loaded = TextureAtlas.load(str(tmp_path), "abc123", convert=False)
+    loaded.convert_pages()
+    assert loaded.frame("enemy", "idle", 0).get_at((0, 0)) == (0, 255, 0, 255)
+
+def test_digest_mismatch_or_damage_discards_the_saved_atlas(tmp_path):
+    build_atlas().save(str(tmp_path))
+    assert TextureAtlas.load(str(tmp_path), "other") is None
+    assert TextureAtlas.load(str(tmp_path / "missing"), "abc123") is None
+    (tmp_path / "atlas_0.raw").write_bytes(b"broken")
+    assert TextureAtlas.load(str(tmp_path), "abc123") is None
+    (tmp_path / MANIFEST_FILE).write_bytes(b"SLAT")
+    assert TextureAtlas.load(str(tmp_path), "abc123") is None
+
+def test_source_digest_follows_files_and_configs(tmp_path):
+    source = tmp_path / "sheet.png"
+    source.write_bytes(b"one")
+    digest = TextureAtlas.hash_sources([str(source)], {"scale": 2})
+    assert len(digest) == 16
+    assert TextureAtlas.hash_sources([str(source)], {"scale": 2}) == digest
+    assert TextureAtlas.hash_sources([str(source)], {"scale": 3}) != digest
+    source.write_bytes(b"two")
+    assert TextureAtlas.hash_sources([str(source)], {"scale": 2}) != digest
+    assert TextureAtlas.hash_sources([str(tmp_path / "missing.png")], {"scale": 2}) != digest
@@ -0,0 +1,70 @@
+import pygame
+import pytest
+from src.utils.camera import Camera
+
+class Thing(pygame.sprite.Sprite):
+    def __init__(self, x, y, width=10, height=10):
+        super().__init__()
+        self.image = pygame.Surface((width, height))
+        self.image.fill((255, 255, 255))
+        self.rect = self.image.get_rect(topleft=(x, y))
+
+@pytest.fixture
+def camera():
+    # Tela 100x50 num mundo de 400 de largura, margem de 8 pixels
+    return Camera(100, 50, 400, margin=8)
+
+def test_visible_keeps_objects_touching_the_margin(camera):
+    inside = [Thing(-17, 0), Thing(107, 0), Thing(0, -17), Thing(0, 57)]
+    outside = [Thing(-18, 0), Thing(108, 0), Thing(0, -18), Thing(0, 58)]
+    assert camera.visible(inside + outside, "sprites") == inside
+    assert camera.stats()['drawn'] == {'sprites': 4}
+    assert camera.stats()['culled'] == {'sprites': 4}
+
+def test_view_follows_the_scroll_in_world_coordinates(camera):
+    camera.scroll_to(150)
+    assert camera.viewport == pygame.Rect(150, 0, 100, 50)
+    assert camera.is_visible(Thing(133, 0).rect)
+    assert not camera.is_visible(Thing(132, 0).rect)
+    assert camera.is_visible(Thing(257, 0).rect)
+    assert not camera.is_visible(Thing(258, 0).rect)
+
+def test_scroll_is_clamped_to_the_world(camera):
+    assert camera.scroll_to(-30) == 0
+    assert camera.scroll_to(1000) == 300
+    assert camera.scroll_by(-50) == 250
+    assert camera.scroll_to(12.7) == 12
+
+def test_culling_counts_accumulate_until_the_next_frame(camera):
+    camera.visible([Thing(0, 0), Thing(500, 0)], "sprites")
+    camera.visible([Thing(0, 0)], "sprites")
+    camera.count("effects", 3, 2)
+    stats = camera.stats()
+    assert stats['drawn'] == {'sprites': 2, 'effects': 3}
+    assert stats['total_culled'] == 3
+    camera.begin_frame()
+    assert camera.stats()['total_culled'] == 0
+
+def test_follow_does_not_scroll_inside_the_dead_zone(camera):
+    camera.scroll_to(100)
+    for x in (130, 150, 170):
+        assert camera.follow(x) == 100
+
+def test_follow_pushes_the_camera_at_the_dead_zone_edges(camera):
+    camera.scroll_to(100)
+    # Alvo a 80% da tela: a câmera anda até ele ficar em 70%
+    assert camera.follow(180) == 110
+    # Alvo a 10% da tela: a câmera volta até ele ficar em 30%
+    assert camera.follow(120) == 90
+    # Nas pontas do mundo a câmera para e o alvo sai da zona morta
+    assert camera.follow(5) == 0
+    assert camera.follow(395) == 300
+
+def test_draw_sprites_blits_only_visible_sprites_at_screen_positions(camera):
+    surface = pygame.Surface((100, 50))
+    camera.scroll_to(200)
+    group = pygame.sprite.Group(Thing(210, 5), Thing(20, 5))
+    camera.draw_sprites(surface, group)
+    assert surface.get_at((15, 10)) == (255, 255, 255, 255)
+    assert surface.get_at((25, 10)) == (0, 0, 0, 255)
+    assert camera.stats()['culled'] == {'sprites': 1}
@@ -0,0 +1,113 @@
+import math
+import numpy as np
+import pytest
+from src.sprites.sprite_config import PLAYER_SPRITE, ENEMY_SPRITE
+from src.utils.effects import EffectManager, EmitterPreset, compile_emitter_presets
+
+# Parâmetros das chamadas create_particles que os emissores substituíram:
+# preset -> (cor, partículas por ponto, alpha, tamanho, velocidade)
+OLD_CALLS = {
+    "player.attack": ((128, 0, 255), 3, 200, 3, 2),
+    "player.attack.impact": ((128, 0, 255), 12, 230, 5, 6),
+    "player.magic": ((255, 255, 100), 2, 200, 4, 3),
+    "player.magic.impact": ((255, 255, 100), 15, 230, 6, 7),
+    "player.magic.impact_glow": ((255, 255, 150), 10, 180, 4, 5),
+    "player.shield": ((150, 200, 255), 2, 150, 3, 1.5),
+    "player.shield.activate": ((150, 200, 255), 20, 180, 3, (2, 4)),
+    "player.shield.hit": ((150, 200, 255), 8, 150, 2, 2),
+    "enemy.attack": ((220, 40, 40), 5, 160, 3, 2)
+}
+
+PRESET = EmitterPreset(color=(100, 150, 200), alpha=200, size=3, speed=2, count=3, lifetime=None)
+
+@pytest.fixture
+def manager():
+    manager = EffectManager(max_particles=4096)
+    manager.particles.rng = np.random.default_rng(0)
+    return manager
+
+def emitted(manager):
+    pool = manager.particles
+    n = len(pool)
+    return pool.pos[:n], pool.vel[:n], pool.color[:n].astype(int), pool.alpha[:n], pool.lifetime[:n]
+
+@pytest.fixture(scope="module")
+def presets():
+    return compile_emitter_presets({"player": PLAYER_SPRITE, "enemy": ENEMY_SPRITE})
+
+@pytest.mark.parametrize("name", sorted(OLD_CALLS))
+def test_presets_match_the_old_calls(presets, name):
+    color, count, alpha, size, speed = OLD_CALLS[name]
+    assert presets[name] == EmitterPreset(color=color, alpha=alpha, size=size, speed=speed,
+                                          count=count, lifetime=None)
+
+def test_sub_effects_inherit_from_their_parent():
+    presets = compile_emitter_presets({"hero": {"effects": {
+        "slash": {"color": [1, 2, 3], "alpha": 90, "particle_alpha": 120, "particle_count": 4,
+                  "spark": {"particle_size": 9}}
+    }}})
+    assert presets["hero.slash"] == EmitterPreset((1, 2, 3), 120, 3, 2, 4, None)
+    assert presets["hero.slash.spark"] == EmitterPreset((1, 2, 3), 120, 9, 2, 4, None)
+
+def test_arc_matches_the_old_point_loop(manager):
+    start_x, end_x, center_y = 100, 170, 300
+    assert manager.emit_arc((start_x, center_y), (end_x, center_y), PRESET, points=8, height=20) == 24
+    old_points = []
+    for i in range(8):
+        progress = i / 7
+        old_points += [(start_x + (end_x - start_x) * progress, center_y + math.sin(progress * math.pi) * 20)] * 3
+    positions, _, _, _, _ = emitted(manager)
+    assert positions == pytest.approx(np.array(old_points))
+
+def test_spiral_matches_the_old_nested_loop(manager):
+    assert manager.emit_spiral(400, 200, PRESET._replace(count=2), radius=30, arms=12, step=5) == 144
+    old_points = []
+    for i in range(12):
+        angle = (i / 12) * math.pi * 2
+        for r in range(0, 30, 5):
+            old_points += [(400 + math.cos(angle) * r, 200 + math.sin(angle) * r)] * 2
+    positions, _, _, _, _ = emitted(manager)
+    assert positions == pytest.approx(np.array(old_points))
+
+def test_ring_points_lie_on_the_circle(manager):
+    assert manager.emit_ring(50, 60, 25, PRESET, points=12, count=1) == 12
+    positions, _, _, _, _ = emitted(manager)
+    assert np.hypot(positions[:, 0] - 50, positions[:, 1] - 60) == pytest.approx(np.full(12, 25.0))
+    angles = np.arctan2(positions[:, 1] - 60, positions[:, 0] - 50) % (2 * math.pi)
+    assert angles == pytest.approx(np.arange(12) / 12 * 2 * math.pi)
+
+def test_bursts_are_spread_around_the_center(manager):
+    assert manager.emit_burst(500, 400, PRESET, count=12, bursts=3, spread=15) == 36
+    positions, _, _, _, _ = emitted(manager)
+    origins = {tuple(point) for point in positions.tolist()}
+    assert len(origins) <= 3
+    assert all(abs(x - 500) <= 15 and abs(y - 400) <= 15 for x, y in origins)
+    assert manager.emit_burst(10, 20, PRESET) == 3
+    assert emitted(manager)[0][-3:].tolist() == [[10, 20]] * 3
+
+def test_particles_get_the_preset_speed_color_alpha_and_lifetime(manager):
+    manager.emit_burst(0, 0, PRESET._replace(count=200))
+    _, velocity, colors, alpha, lifetime = emitted(manager)
+    assert np.hypot(velocity[:, 0], velocity[:, 1]) == pytest.approx(np.full(200, 2.0))
+    assert (np.abs(colors - PRESET.color) <= 20).all()
+    assert (alpha == 200).all()
+    assert lifetime.min() >= 6 and lifetime.max() <= 10
+
+def test_speed_range_and_overrides(manager, presets):
+    manager.presets = presets
+    manager.emit_burst(0, 0, "player.shield.activate", color=(0, 0, 0))
+    _, velocity, colors, alpha, _ = emitted(manager)
+    speed = np.hypot(velocity[:, 0], velocity[:, 1])
+    assert len(speed) == 20
+    assert speed.min() >= 2 and speed.max() <= 4
+    assert colors.max() <= 20
+    assert (alpha == 180).all()
+
+def test_budget_cuts_the_whole_shape_at_once(manager):
+    manager.budget.scale = 0.5
+    created = manager.emit_arc((0, 0), (70, 0), PRESET._replace(alpha=250, lifetime=10), points=8)
+    assert created == 12
+    positions, _, _, _, _ = emitted(manager)
+    # As partículas que sobram continuam saindo de pontos do arco
+    arc_x = set(np.linspace(0, 70, 8).round(6).tolist())
+    assert set(positions[:, 0].round(6).tolist()) <= arc_x
@@ -0,0 +1,32 @@
+import numpy as np
+from src.utils.effects import GlowSpriteCache
+
+def test_similar_particles_share_a_sprite():
+    cache = GlowSpriteCache(color_step=32, alpha_bands=8)
+    first = cache.get((200, 40, 40), 4, 200)
+    assert cache.get((205, 45, 38), 4, 210) is first
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+    assert first.get_size() == (8, 8)
+
+def test_least_recently_used_sprite_is_evicted():
+    cache = GlowSpriteCache(max_entries=2)
+    red = cache.get((255, 0, 0), 3, 200)
+    cache.get((0, 255, 0), 3, 200)
+    # Usar o vermelho de novo deixa o verde como o menos recente
+    assert cache.get((255, 0, 0), 3, 200) is red
+    cache.get((0, 0, 255), 3, 200)
+    stats = cache.stats()
+    assert stats['entries'] == 2
+    assert stats['evictions'] == 1
+    assert cache.make_key((255, 0, 0), 3, 200) in cache.sprites
+    assert cache.make_key((0, 255, 0), 3, 200) not in cache.sprites
+
+def test_particle_keys_match_the_scalar_quantization():
+    cache = GlowSpriteCache()
+    colors = np.array([[200, 40, 40], [10, 250, 130]], dtype=np.uint8)
+    keys = cache.particle_keys(colors, np.array([6, 4]), np.array([3, 2]), np.array([255, 0]))
+    for key, color, alpha in zip(keys, colors.tolist(), (255, 0)):
+        assert key[1] == cache.make_key(color, 0, alpha)[1]
+        assert key[4] == cache.make_key(color, 0, alpha)[3]
+    assert len({cache.lookup(key).get_size() for key in keys}) == 2
@@ -0,0 +1,48 @@
+import random
+from src.utils.effects import ParticleBudget
+
+def test_scale_degrades_only_above_the_frame_budget():
+    budget = ParticleBudget(target_frame_ms=10)
+    budget.record_frame_time(10)
+    assert budget.scale == 1.0
+    budget.record_frame_time(20)
+    # Média móvel: 10 + (20 - 10) * 0.1 = 11 ms, 10% acima do orçamento
+    assert budget.average_frame_ms == 11
+    assert budget.scale == 1.0 - 0.05 * 0.1
+
+def test_scale_never_goes_below_the_minimum():
+    budget = ParticleBudget(target_frame_ms=10, min_scale=0.2)
+    for _ in range(200):
+        budget.record_frame_time(100)
+    assert budget.scale == 0.2
+    assert budget.particle_limit() == int(budget.max_particles * 0.2)
+
+def test_scale_recovers_only_below_eighty_percent_of_the_budget():
+    budget = ParticleBudget(target_frame_ms=10)
+    budget.scale = 0.5
+    budget.record_frame_time(9)
+    assert budget.scale == 0.5
+    budget.frames_measured = 0
+    budget.record_frame_time(7)
+    assert budget.scale == 0.51
+    for _ in range(100):
+        budget.record_frame_time(7)
+    assert budget.scale == 1.0
+
+def test_weak_emissions_are_cut_first_and_rejected_below_the_threshold():
+    budget = ParticleBudget(reject_below=0.15)
+    budget.scale = 0.3
+    strong = budget.emission_scale(alpha=250, lifetime=10)
+    weak = budget.emission_scale(alpha=0, lifetime=0)
+    assert strong == 0.3
+    assert weak < 0.15
+    assert budget.scale_count(20, alpha=0, lifetime=0, rng=random.Random(0)) == 0
+    assert budget.rejected == 20
+    allowed = budget.scale_count(20, alpha=250, lifetime=10, rng=random.Random(0))
+    assert allowed == 6
+    assert budget.emitted == 6
+
+def test_full_scale_keeps_every_particle():
+    budget = ParticleBudget()
+    assert budget.scale_count(7, alpha=10, lifetime=1, rng=random.Random(0)) == 7
+    assert budget.stats()['rejected'] == 0
@@ -0,0 +1,59 @@
+import numpy as np
+from src.utils.effects import ParticlePool
+
+def emit(pool, count, lifetime=5, alpha=200, first_x=0):
+    return pool.emit(np.arange(first_x, first_x + count, dtype=np.float64), 0.0,
+                     np.zeros(count), np.zeros(count),
+                     np.full((count, 3), 255, dtype=np.uint8), alpha, 3.0, lifetime)
+
+def test_emit_fills_the_first_slots():
+    pool = ParticlePool(capacity=8)
+    assert emit(pool, 3) == 3
+    assert len(pool) == 3
+    assert pool.pos[:3, 0].tolist() == [0.0, 1.0, 2.0]
+    assert pool.glow_size[:3].tolist() == [6.0, 6.0, 6.0]
+
+def test_emit_drops_what_does_not_fit():
+    pool = ParticlePool(capacity=4)
+    emit(pool, 3)
+    assert emit(pool, 3) == 1
+    assert len(pool) == 4
+    assert pool.dropped == 2
+    assert emit(pool, 2) == 0
+    assert pool.dropped == 4
+
+def test_compact_keeps_survivors_in_order():
+    pool = ParticlePool(capacity=8)
+    emit(pool, 5)
+    pool.lifetime[:5] = [1, 2, 3, 4, 5]
+    pool.compact(np.array([True, False, True, False, True]))
+    assert len(pool) == 3
+    assert pool.pos[:3, 0].tolist() == [0.0, 2.0, 4.0]
+    assert pool.lifetime[:3].tolist() == [1, 3, 5]
+
+def test_update_releases_dead_particles_and_frees_their_slots():
+    pool = ParticlePool(capacity=4)
+    pool.rng = np.random.default_rng(0)
+    emit(pool, 2, lifetime=1)
+    emit(pool, 2, lifetime=10, first_x=2)
+    pool.update()
+    assert len(pool) == 2
+    assert pool.pos[:2, 0].round().tolist() == [2.0, 3.0]
+    # As posições liberadas voltam a ser usadas
+    assert emit(pool, 2) == 2
+    assert pool.dropped == 0
+
+def test_cull_discards_the_weakest_first():
+    pool = ParticlePool(capacity=8)
+    emit(pool, 4)
+    pool.alpha[:4] = [250, 40, 200, 60]
+    assert pool.cull(2) == 2
+    assert sorted(pool.alpha[:2].tolist()) == [200, 250]
+    assert pool.cull(5) == 0
+
+def test_clear_empties_the_pool():
+    pool = ParticlePool(capacity=4)
+    emit(pool, 3)
+    pool.clear()
+    assert len(pool) == 0
+    assert emit(pool, 4) == 4
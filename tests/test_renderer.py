@@ -0,0 +1,163 @@
+import pygame
+import pytest
+from src.menus.menu import OptionsMenu
+from src.utils.renderer import DirtyRenderer, ScaledFramebuffer
+
+@pytest.fixture
+def presented(monkeypatch):
+    # Registrar o que seria enviado para a janela
+    calls = []
+    monkeypatch.setattr(pygame.display, "flip", lambda: calls.append("flip"))
+    monkeypatch.setattr(pygame.display, "update", lambda rects: calls.append(list(rects)))
+    return calls
+
+@pytest.fixture
+def screen():
+    return pygame.display.get_surface()
+
+def fill_backdrop(surface):
+    surface.fill((0, 0, 80))
+
+def draw_frame(renderer, scroll, rects):
+    renderer.begin(scroll, fill_backdrop)
+    for rect in rects:
+        renderer.screen.fill((255, 255, 0), rect)
+    renderer.add_many([pygame.Rect(rect) for rect in rects])
+    renderer.present()
+
+def test_disabled_renderer_draws_and_flips_every_frame(screen, presented):
+    renderer = DirtyRenderer(screen)
+    draw_frame(renderer, 0, [(0, 0, 4, 4)])
+    draw_frame(renderer, 0, [(0, 0, 4, 4)])
+    assert presented == ["flip", "flip"]
+    assert renderer.stats()['full_frames'] == 2
+
+def test_standing_camera_sends_only_old_and_new_areas(screen, presented):
+    renderer = DirtyRenderer(screen, enabled=True)
+    draw_frame(renderer, 0, [(0, 0, 4, 4)])
+    draw_frame(renderer, 0, [(10, 10, 4, 4)])
+    assert presented == ["flip", [pygame.Rect(0, 0, 4, 4), pygame.Rect(10, 10, 4, 4)]]
+    # A área do frame anterior foi restaurada a partir do cenário guardado
+    assert screen.get_at((1, 1)) == (0, 0, 80, 255)
+    assert screen.get_at((11, 11)) == (255, 255, 0, 255)
+    assert renderer.stats()['last_pixels'] == 32
+
+def test_scrolling_redraws_and_flips(screen, presented):
+    renderer = DirtyRenderer(screen, enabled=True)
+    draw_frame(renderer, 0, [(0, 0, 4, 4)])
+    draw_frame(renderer, 5, [(0, 0, 4, 4)])
+    renderer.invalidate()
+    draw_frame(renderer, 5, [(0, 0, 4, 4)])
+    assert presented == ["flip", "flip", "flip"]
+
+def test_too_many_areas_fall_back_to_a_flip(screen, presented):
+    renderer = DirtyRenderer(screen, enabled=True, max_rects=3)
+    draw_frame(renderer, 0, [])
+    draw_frame(renderer, 0, [(0, 0, 2, 2), (4, 0, 2, 2)])
+    draw_frame(renderer, 0, [(8, 0, 2, 2), (12, 0, 2, 2)])
+    assert presented[1] == [pygame.Rect(0, 0, 2, 2), pygame.Rect(4, 0, 2, 2)]
+    assert presented[2] == "flip"
+    assert renderer.stats()['partial_frames'] == 1
+
+def test_areas_are_clipped_to_the_screen(screen, presented):
+    renderer = DirtyRenderer(screen, enabled=True)
+    width, height = screen.get_size()
+    draw_frame(renderer, 0, [])
+    draw_frame(renderer, 0, [(width - 2, 0, 10, 2), (width + 5, 0, 4, 4)])
+    assert presented[1] == [pygame.Rect(width - 2, 0, 2, 2)]
+
+def test_static_screens_are_sent_once_until_something_changes(screen, presented):
+    renderer = DirtyRenderer(screen, enabled=True)
+    assert renderer.begin_static("options")
+    renderer.present()
+    assert not renderer.begin_static("options")
+    renderer.present()
+    assert renderer.begin_static("options", changed=True)
+    renderer.present()
+    assert renderer.begin_static("credits")
+    renderer.present()
+    assert presented == ["flip", "flip", "flip"]
+    assert renderer.stats()['skipped_frames'] == 1
+
+def test_hovered_button_glow_keeps_being_sent_on_static_screens(presented):
+    screen = pygame.Surface((800, 600))
+    renderer = DirtyRenderer(screen, enabled=True)
+    menu = OptionsMenu(800, 600)
+    button = menu.buttons['voltar']
+    assert renderer.begin_static("options", animated=menu.animated_rects())
+    menu.draw(screen)
+    renderer.present()
+    menu.handle_input(pygame.event.Event(pygame.MOUSEMOTION, pos=button.rect.center))
+    assert renderer.begin_static("options", changed=True, animated=menu.animated_rects())
+    menu.draw(screen)
+    renderer.present()
+    # Sem eventos, só o brilho do botão em hover é redesenhado e enviado
+    glow_alpha = button.glow_alpha
+    assert renderer.begin_static("options", animated=menu.animated_rects())
+    menu.draw(screen)
+    renderer.present()
+    assert button.glow_alpha != glow_alpha
+    assert presented == ["flip", "flip", [button.rect.inflate(10, 10)]]
+    menu.handle_input(pygame.event.Event(pygame.MOUSEMOTION, pos=(0, 0)))
+    assert menu.animated_rects() == []
+    assert not renderer.begin_static("options", animated=menu.animated_rects())
+
+def make_framebuffer(**kwargs):
+    framebuffer = ScaledFramebuffer((80, 60), target_frame_ms=10, **kwargs)
+    framebuffer.cooldown_frames = 5
+    return framebuffer
+
+def run_frames(framebuffer, frame_ms, count):
+    return [framebuffer.record_frame_time(frame_ms) for _ in range(count)]
+
+def test_fixed_scale_uses_a_smaller_internal_surface(screen):
+    framebuffer = ScaledFramebuffer((64, 64), scale=0.5)
+    assert framebuffer.target(screen).get_size() == (32, 32)
+    framebuffer.target(screen).fill((200, 0, 0))
+    framebuffer.present(screen)
+    assert screen.get_at((63, 63)) == (200, 0, 0, 255)
+    framebuffer.set_mode(1.0)
+    assert framebuffer.target(screen) is screen
+    # Sem modo automático a escala não muda, mesmo acima do orçamento
+    assert not any(run_frames(framebuffer, 1000, 300))
+
+def test_auto_mode_steps_down_after_the_cooldown():
+    framebuffer = make_framebuffer(auto=True)
+    changes = run_frames(framebuffer, 20, 5)
+    assert changes == [False] * 4 + [True]
+    assert framebuffer.scale == 0.5
+    # Já no menor nível: não há para onde descer
+    assert not any(run_frames(framebuffer, 20, 20))
+
+def test_auto_mode_waits_for_the_cooldown_between_changes():
+    framebuffer = make_framebuffer(auto=True)
+    run_frames(framebuffer, 20, 5)
+    assert run_frames(framebuffer, 1, 4) == [False] * 4
+    assert framebuffer.scale == 0.5
+
+def test_auto_mode_steps_up_only_below_sixty_percent_of_the_budget():
+    framebuffer = make_framebuffer(auto=True, scale=0.5)
+    framebuffer.frames_since_change = 0
+    # 7 ms está abaixo do orçamento, mas acima de 60% dele: fica onde está
+    assert not any(run_frames(framebuffer, 7, 50))
+    assert framebuffer.scale == 0.5
+    framebuffer.frames_measured = 0
+    assert run_frames(framebuffer, 5, 1) == [True]
+    assert framebuffer.scale == 1.0
+    assert framebuffer.stats()['changes'] == 2
+
+def test_frame_time_is_smoothed():
+    framebuffer = make_framebuffer(auto=True)
+    framebuffer.record_frame_time(5)
+    framebuffer.record_frame_time(25)
+    # Um pico isolado não derruba a média: 5 + (25 - 5) * 0.1
+    assert framebuffer.average_frame_ms == pytest.approx(7)
+    assert framebuffer.mode == "auto"
+
+def test_set_mode_rejects_unsupported_scales():
+    framebuffer = make_framebuffer()
+    with pytest.raises(ValueError):
+        framebuffer.set_mode(0.75)
+    assert framebuffer.mode == 1.0
+    framebuffer.set_mode("auto")
+    assert framebuffer.auto
@@ -0,0 +1,44 @@
+import pytest
+from benchmarks.scenarios import compare, percentile
+
+def result(**scenarios):
+    return {'scenarios': {
+        name: {'frame_ms': dict(zip(('p50', 'p95', 'p99'), times)), 'peak_particles': 0}
+        for name, times in scenarios.items()
+    }}
+
+def regressions(rows):
+    return [(name, metric) for name, metric, _, _, _, regression in rows if regression]
+
+def test_increase_above_the_threshold_is_a_regression():
+    rows = compare(result(idle=(1.2, 2.0, 3.0)), result(idle=(1.0, 2.0, 3.0)), threshold=0.10)
+    assert regressions(rows) == [('idle', 'p50')]
+    assert rows[0][4] == pytest.approx(0.2)
+
+def test_increase_below_the_threshold_passes():
+    rows = compare(result(idle=(1.09, 2.0, 2.0)), result(idle=(1.0, 2.0, 3.0)), threshold=0.10)
+    assert regressions(rows) == []
+    assert rows[2][4] == pytest.approx(-1 / 3)
+
+def test_tiny_absolute_increases_are_treated_as_noise():
+    # +50% mas só 0.02 ms: abaixo de min_delta_ms
+    rows = compare(result(menu_idle=(0.06, 1.0, 1.0)), result(menu_idle=(0.04, 1.0, 1.0)))
+    assert regressions(rows) == []
+    rows = compare(result(menu_idle=(0.06, 1.0, 1.0)), result(menu_idle=(0.04, 1.0, 1.0)), min_delta_ms=0.01)
+    assert regressions(rows) == [('menu_idle', 'p50')]
+
+def test_scenarios_missing_from_the_baseline_are_skipped():
+    rows = compare(result(idle=(1.0, 1.0, 1.0), shield=(9.0, 9.0, 9.0)), result(idle=(1.0, 1.0, 1.0)))
+    assert {row[0] for row in rows} == {'idle'}
+    assert compare(result(idle=(1.0, 1.0, 1.0)), {}) == []
+
+def test_zero_baseline_does_not_divide_by_zero():
+    rows = compare(result(idle=(1.0, 1.0, 1.0)), result(idle=(0.0, 0.0, 0.0)))
+    assert [row[4] for row in rows] == [0.0, 0.0, 0.0]
+    assert regressions(rows) == []
+
+def test_percentile_interpolates_between_neighbours():
+    assert percentile([4, 1, 3, 2], 50) == pytest.approx(2.5)
+    assert percentile([1, 2, 3, 4, 5], 100) == 5
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
@@ -0,0 +1,55 @@
+import pygame
+from src.sprites.sprite_manager import SpriteSheet
+
+def make_sheet():
+    # Dois frames 4x4 lado a lado: vermelho e verde
+    surface = pygame.Surface((8, 4), pygame.SRCALPHA)
+    surface.fill((255, 0, 0, 255), (0, 0, 4, 4))
+    surface.fill((0, 255, 0, 255), (4, 0, 4, 4))
+    return SpriteSheet.from_surface(surface)
+
+def test_unscaled_frames_are_views_of_the_sheet():
+    sheet = make_sheet()
+    frame = sheet.get_image(4, 0, 4, 4)
+    assert frame.get_parent() is sheet.sheet
+    assert frame.get_offset() == (4, 0)
+    # Sem cópia: mudar o sheet aparece no frame
+    sheet.sheet.set_at((5, 1), (0, 0, 255, 255))
+    assert frame.get_at((1, 1)) == (0, 0, 255, 255)
+
+def test_frames_are_memoized_by_rect_scale_and_colorkey():
+    sheet = make_sheet()
+    scaled = sheet.get_image(0, 0, 4, 4, scale=2)
+    assert scaled.get_size() == (8, 8)
+    assert scaled.get_parent() is None
+    assert sheet.get_image(0, 0, 4, 4, scale=2) is scaled
+    assert sheet.get_image(0, 0, 4, 4) is sheet.get_image(0, 0, 4, 4)
+    assert sheet.get_image(0, 0, 4, 4, scale=3) is not scaled
+    keyed = sheet.get_image(0, 0, 4, 4, colorkey=-1)
+    assert keyed is sheet.get_image(0, 0, 4, 4, colorkey=-1)
+    assert keyed.get_parent() is None
+    assert keyed.get_colorkey() == (255, 0, 0, 255)
+    assert sheet.sheet.get_colorkey() is None
+
+def test_materialize_returns_an_independent_copy():
+    sheet = make_sheet()
+    copy = sheet.materialize(0, 0, 4, 4)
+    assert copy is not sheet.materialize(0, 0, 4, 4)
+    assert copy.get_parent() is None
+    copy.fill((0, 0, 0, 255))
+    assert sheet.sheet.get_at((0, 0)) == (255, 0, 0, 255)
+    assert sheet.get_image(0, 0, 4, 4).get_at((0, 0)) == (255, 0, 0, 255)
+
+def test_regions_outside_the_sheet_are_clipped_copies():
+    sheet = make_sheet()
+    frame = sheet.get_image(6, 0, 4, 4)
+    assert frame.get_size() == (4, 4)
+    assert frame.get_parent() is None
+    assert frame.get_at((0, 0)) == (0, 255, 0, 255)
+    assert frame.get_at((3, 0)).a == 0
+
+def test_animation_frames_walk_a_row():
+    sheet = make_sheet()
+    frames = sheet.get_animation_frames(0, 2, 4, 4)
+    assert [frame.get_offset() for frame in frames] == [(0, 0), (4, 0)]
+    assert frames[1] is sheet.get_image(4, 0, 4, 4)
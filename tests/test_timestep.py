@@ -0,0 +1,35 @@
+import pytest
+from src.utils.timestep import FixedTimestep
+
+def test_advance_runs_whole_steps_and_keeps_the_remainder():
+    timestep = FixedTimestep(step_ms=10, max_steps=5)
+    assert timestep.advance(25) == 2
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(5) == 1
+    assert timestep.alpha == pytest.approx(0.0)
+    assert (timestep.steps, timestep.time_ms) == (3, 30)
+
+def test_short_frames_accumulate_until_a_step_is_due():
+    timestep = FixedTimestep(step_ms=10)
+    assert timestep.advance(4) == 0
+    assert timestep.advance(4) == 0
+    assert timestep.alpha == pytest.approx(0.8)
+    assert timestep.advance(4) == 1
+    assert timestep.last_steps == 1
+
+def test_slow_frames_are_clamped_to_max_steps():
+    timestep = FixedTimestep(step_ms=10, max_steps=3)
+    assert timestep.advance(75) == 3
+    # O atraso além do limite é descartado; só a fração do passo seguinte sobra
+    assert timestep.dropped_ms == pytest.approx(40)
+    assert timestep.alpha == pytest.approx(0.5)
+    assert timestep.advance(5) == 1
+    assert timestep.time_ms == pytest.approx(40)
+
+def test_reset_discards_the_accumulated_time():
+    timestep = FixedTimestep(step_ms=10)
+    timestep.advance(9)
+    timestep.reset()
+    assert timestep.alpha == 0
+    assert timestep.advance(9) == 0
+    assert timestep.stats()['steps'] == 0